@@ -1,15 +1,22 @@
+const readline = require('readline');
 const { createInstance, SepoliaConfig } = require('@zama-fhe/relayer-sdk/node');
 
-async function main() {
-  const input = await new Promise((resolve) => {
-    let data = '';
-    process.stdin.on('data', (chunk) => (data += chunk));
-    process.stdin.on('end', () => resolve(JSON.parse(data)));
-  });
+let instancePromise;
 
-  const { vaultAddress, curatorAddress, values } = input;
+// Create the relayer instance once per process, as it downloads the FHE public
+// keys and initialises the WASM runtime.
+function getInstance() {
+  if (!instancePromise) {
+    instancePromise = createInstance(SepoliaConfig).catch((err) => {
+      instancePromise = undefined;
+      throw err;
+    });
+  }
+  return instancePromise;
+}
 
-  const instance = await createInstance(SepoliaConfig);
+async function encryptValues({ vaultAddress, curatorAddress, values }) {
+  const instance = await getInstance();
 
   // Create a buffer for all values to encrypt
   const encryptedBuffer = instance.createEncryptedInput(
@@ -31,12 +38,87 @@ async function main() {
   const inputProofHex =
     '0x' + Buffer.from(encryptedCiphertexts.inputProof).toString('hex');
 
-  console.log(
-    JSON.stringify({ encryptedValues: handlesHex, inputProof: inputProofHex }),
+  return { encryptedValues: handlesHex, inputProof: inputProofHex };
+}
+
+// Encrypt independent vault inputs concurrently, reporting failures per item
+// instead of rejecting the whole batch.
+async function encryptBatch(batch) {
+  const settled = await Promise.allSettled(batch.map(encryptValues));
+  return settled.map((outcome) =>
+    outcome.status === 'fulfilled'
+      ? outcome.value
+      : { error: String(outcome.reason?.message || outcome.reason) },
   );
 }
 
-main().catch((err) => {
-  console.error('Error:', err);
-  process.exit(1);
-});
+async function main() {
+  const input = await new Promise((resolve) => {
+    let data = '';
+    process.stdin.on('data', (chunk) => (data += chunk));
+    process.stdin.on('end', () => resolve(JSON.parse(data)));
+  });
+
+  if (Array.isArray(input.batch)) {
+    console.log(JSON.stringify({ results: await encryptBatch(input.batch) }));
+  } else {
+    console.log(JSON.stringify(await encryptValues(input)));
+  }
+}
+
+// Long-lived mode: one JSON request per stdin line, one JSON response per
+// stdout line, matched by id. Requests are served concurrently.
+function worker() {
+  const stdout = process.stdout;
+  // Keep stdout reserved for the protocol.
+  console.log = console.error;
+
+  const respond = (response) => stdout.write(JSON.stringify(response) + '\n');
+
+  getInstance().catch((err) => console.error('Error:', err));
+
+  let inFlight = 0;
+  let closed = false;
+  const exitWhenDrained = () => {
+    if (closed && inFlight === 0) {
+      process.exit(0);
+    }
+  };
+
+  const lines = readline.createInterface({ input: process.stdin });
+  lines.on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+    let request;
+    try {
+      request = JSON.parse(line);
+    } catch (err) {
+      respond({ id: null, error: `Invalid request: ${err.message}` });
+      return;
+    }
+    inFlight += 1;
+    encryptValues(request.params)
+      .then(
+        (result) => respond({ id: request.id, result }),
+        (err) => respond({ id: request.id, error: String(err.message || err) }),
+      )
+      .finally(() => {
+        inFlight -= 1;
+        exitWhenDrained();
+      });
+  });
+  lines.on('close', () => {
+    closed = true;
+    exitWhenDrained();
+  });
+}
+
+if (process.argv.includes('--worker')) {
+  worker();
+} else {
+  main().catch((err) => {
+    console.error('Error:', err);
+    process.exit(1);
+  });
+}
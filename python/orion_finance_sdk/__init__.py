@@ -1,9 +1,34 @@
-"""Orion Finance Python SDK."""
+"""Orion Finance Python SDK.
 
-import importlib.metadata
+Attributes are imported on first access, so that importing the package does
+not load web3 and the other heavy dependencies of the commands.
+"""
 
-from orion_finance_sdk.cli import deploy_vault, submit_order
+from importlib import import_module
 
-__version__ = importlib.metadata.version("orion-finance-sdk")
+_LAZY_ATTRIBUTES = {
+    "deploy_vault": "orion_finance_sdk.cli",
+    "submit_order": "orion_finance_sdk.cli",
+    "submit_orders": "orion_finance_sdk.cli",
+}
 
-__all__ = ["deploy_vault", "submit_order"]
+__all__ = ["deploy_vault", "submit_order", "submit_orders"]
+
+
+def __getattr__(name: str):
+    """Import public attributes and the package version on first access."""
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("orion-finance-sdk")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported attributes along with the loaded ones."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES, "__version__"})
@@ -0,0 +1,425 @@
+"""Asyncio interactions with the Orion Finance protocol contracts.
+
+The classes mirror those of ``contracts`` on top of AsyncWeb3: reads are
+awaited (``await config.whitelisted_assets``) and can be gathered
+concurrently, and submissions do not block the event loop.
+"""
+
+import os
+
+from eth_account.signers.local import LocalAccount
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import TxReceipt
+
+from .calls import PreparedCall
+from .connection import get_async_chain_id, get_async_web3
+from .contracts import (
+    OrionSmartContract,
+    TransactionResult,
+    VaultFactory,
+    get_contract,
+)
+from .fees import get_fee_oracle
+from .gas import gas_key, get_gas_cache
+from .instrumentation import span
+from .intent import OrderIntent, address_bytes, checksum_address
+from .nonce import (
+    get_nonce_manager,
+    is_already_known_error,
+    is_nonce_too_low_error,
+)
+from .types import VaultType
+from .utils import (
+    load_env,
+    validate_management_fee,
+    validate_performance_fee,
+    validate_var,
+)
+
+
+class AsyncOrionSmartContract:
+    """Base class for Orion smart contracts on an asyncio event loop."""
+
+    def __init__(self, contract_name: str, contract_address: str):
+        """Initialize a smart contract."""
+        load_env()
+        rpc_url = os.getenv("RPC_URL")
+        validate_var(
+            rpc_url,
+            error_message=(
+                "RPC_URL environment variable is missing or invalid. "
+                "Please set RPC_URL in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        self.w3 = get_async_web3(rpc_url)
+        self.contract_name = contract_name
+        self.contract_address = contract_address
+        self.contract = get_contract(self.w3, self.contract_name, self.contract_address)
+
+    # Log decoding and result checks do no I/O and are shared with the sync classes.
+    _decode_log = OrionSmartContract._decode_log
+    _decode_logs = OrionSmartContract._decode_logs
+    _transaction_result = OrionSmartContract._transaction_result
+
+    async def _wait_for_transaction_receipt(
+        self, tx_hash: str, timeout: int = 120
+    ) -> TxReceipt:
+        """Wait for a transaction to be processed and return the receipt."""
+        return await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
+    async def _send_transaction(
+        self, account: LocalAccount, function: AsyncContractFunction
+    ) -> TransactionResult:
+        """Sign and send a contract function call, then wait for its receipt.
+
+        The nonce is allocated by the account's AsyncNonceManager. If the node
+        reports it as already used, the manager resyncs and the transaction is
+        retried once. A node answering "already known" already holds this signed
+        transaction, so it is not signed again. Gas is estimated from the receipts
+        of earlier calls of the same shape when they agree, and by the node
+        otherwise.
+        """
+        with span(f"{self.contract_name}.{function.fn_name}"):
+            return await self._sign_and_send(account, function)
+
+    async def _sign_and_send(
+        self, account: LocalAccount, function: AsyncContractFunction
+    ) -> TransactionResult:
+        """Send a contract function call, each stage in its own span."""
+        nonce_manager = get_nonce_manager(self.w3, account.address)
+        fee_oracle = get_fee_oracle(self.w3)
+        gas_cache = get_gas_cache(self.w3)
+        shape = gas_key(self.contract_name, function)
+        # Encoded once, for both the gas estimate and the signed transaction.
+        with span("encode"):
+            prepared = PreparedCall(function)
+        for attempt in range(2):
+            cached_estimate = gas_cache.get(shape)
+            try:
+                async with nonce_manager.nonce() as nonce:
+                    # A cached estimate already includes its headroom.
+                    gas_limit = cached_estimate
+                    if gas_limit is None:
+                        with span("estimate_gas"):
+                            gas_estimate = await self.w3.eth.estimate_gas(
+                                prepared.transaction(account.address)
+                            )
+
+                        # Add 20% buffer to gas estimate
+                        gas_limit = int(gas_estimate * 1.2)
+
+                    tx = prepared.transaction(
+                        account.address,
+                        chainId=await get_async_chain_id(self.w3),
+                        nonce=nonce,
+                        gas=gas_limit,
+                        **(await fee_oracle.transaction_fees()),
+                    )
+
+                    with span("sign"):
+                        signed = account.sign_transaction(tx)
+                    with span("send"):
+                        try:
+                            tx_hash = await self.w3.eth.send_raw_transaction(
+                                signed.raw_transaction
+                            )
+                        except Exception as e:
+                            # An earlier attempt already reached the node.
+                            if not is_already_known_error(e):
+                                raise
+                            tx_hash = signed.hash
+                break
+            except Exception as e:
+                if attempt or not is_nonce_too_low_error(e):
+                    if cached_estimate is not None:
+                        # The cached estimate may be what the node rejected.
+                        gas_cache.forget(shape)
+                    raise
+
+        tx_hash_hex = tx_hash.hex()
+
+        with span("wait_receipt"):
+            receipt = await self._wait_for_transaction_receipt(tx_hash_hex)
+        gas_cache.record(shape, receipt)
+
+        return self._transaction_result(tx_hash_hex, receipt)
+
+
+class AsyncOrionConfig(AsyncOrionSmartContract):
+    """OrionConfig contract on an asyncio event loop."""
+
+    def __init__(self):
+        """Initialize the OrionConfig contract."""
+        contract_address = "0x8eD5Fb264A049b18B98e8403e01146Ee78C1e984"
+        super().__init__(
+            contract_name="OrionConfig",
+            contract_address=contract_address,
+        )
+
+    @property
+    def curator_intent_decimals(self):
+        """Awaitable curator intent decimals from the OrionConfig contract."""
+        return self.contract.functions.curatorIntentDecimals().call()
+
+    @property
+    def whitelisted_assets(self):
+        """Awaitable list of all whitelisted assets from the OrionConfig contract."""
+        return self.contract.functions.getAllWhitelistedAssets().call()
+
+    @property
+    def whitelisted_asset_set(self):
+        """Awaitable set of whitelisted assets as checksum addresses, in a single call."""
+        return self._whitelisted_asset_set()
+
+    async def _whitelisted_asset_set(self) -> set[str]:
+        return {
+            checksum_address(address_bytes(asset))
+            for asset in await self.whitelisted_assets
+        }
+
+    async def is_whitelisted(self, token_address: str) -> bool:
+        """Check if a token address is whitelisted."""
+        return await self.contract.functions.isWhitelisted(
+            checksum_address(address_bytes(token_address))
+        ).call()
+
+    @property
+    def orion_transparent_vaults(self):
+        """Awaitable list of all Orion transparent vault addresses."""
+        return self.contract.functions.getAllOrionVaults(0).call()
+
+    @property
+    def orion_encrypted_vaults(self):
+        """Awaitable list of all Orion encrypted vault addresses."""
+        return self.contract.functions.getAllOrionVaults(1).call()
+
+    async def is_system_idle(self) -> bool:
+        """Check if the system is in idle state, required for vault deployment."""
+        return await self.contract.functions.isSystemIdle().call()
+
+
+class AsyncVaultFactory(AsyncOrionSmartContract):
+    """VaultFactory contract on an asyncio event loop."""
+
+    def __init__(
+        self,
+        vault_type: str,
+        contract_address: str | None = None,
+    ):
+        """Initialize the VaultFactory contract."""
+        if vault_type == VaultType.TRANSPARENT:
+            contract_address = "0x5689219Aa5dC2766928d316E719AaE25047314e4"
+        elif vault_type == VaultType.ENCRYPTED:
+            contract_address = "0xdD7900c4B6abfEB4D2Cb9F233d875071f6e1093F"
+
+        super().__init__(
+            contract_name=f"{vault_type.capitalize()}VaultFactory",
+            contract_address=contract_address,
+        )
+
+    get_vault_address_from_result = VaultFactory.get_vault_address_from_result
+
+    async def create_orion_vault(
+        self,
+        name: str,
+        symbol: str,
+        fee_type: int,
+        performance_fee: int,
+        management_fee: int,
+    ) -> TransactionResult:
+        """Create an Orion vault for a given curator address.
+
+        Raises:
+            RuntimeError: If the system is not idle, as deployment requires.
+        """
+        config = AsyncOrionConfig()
+
+        curator_address = os.getenv("CURATOR_ADDRESS")
+        validate_var(
+            curator_address,
+            error_message=(
+                "CURATOR_ADDRESS environment variable is missing or invalid. "
+                "Please set CURATOR_ADDRESS in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        deployer_private_key = os.getenv("VAULT_DEPLOYER_PRIVATE_KEY")
+        validate_var(
+            deployer_private_key,
+            error_message=(
+                "VAULT_DEPLOYER_PRIVATE_KEY environment variable is missing or invalid. "
+                "Please set VAULT_DEPLOYER_PRIVATE_KEY in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+        account = self.w3.eth.account.from_key(deployer_private_key)
+        validate_var(
+            account.address,
+            error_message="Invalid VAULT_DEPLOYER_PRIVATE_KEY.",
+        )
+
+        validate_performance_fee(performance_fee)
+        validate_management_fee(management_fee)
+
+        if not await config.is_system_idle():
+            raise RuntimeError("System is not idle. Cannot deploy vault at this time.")
+
+        return await self._send_transaction(
+            account,
+            self.contract.functions.createVault(
+                curator_address, name, symbol, fee_type, performance_fee, management_fee
+            ),
+        )
+
+
+class AsyncOrionVault(AsyncOrionSmartContract):
+    """OrionVault contract on an asyncio event loop."""
+
+    def __init__(self, contract_name: str, contract_address: str | None = None):
+        """Initialize the OrionVault contract.
+
+        Args:
+            contract_name: Name of the vault contract ABI.
+            contract_address: Vault address, defaults to ORION_VAULT_ADDRESS.
+        """
+        contract_address = contract_address or os.getenv("ORION_VAULT_ADDRESS")
+        validate_var(
+            contract_address,
+            error_message=(
+                "ORION_VAULT_ADDRESS environment variable is missing or invalid. "
+                "Please set ORION_VAULT_ADDRESS in your .env file or as an environment variable. "
+            ),
+        )
+        super().__init__(contract_name, contract_address)
+
+    async def update_curator(self, new_curator_address: str) -> TransactionResult:
+        """Update the curator address for the vault."""
+        deployer_private_key = os.getenv("VAULT_DEPLOYER_PRIVATE_KEY")
+        validate_var(
+            deployer_private_key,
+            error_message=(
+                "VAULT_DEPLOYER_PRIVATE_KEY environment variable is missing or invalid. "
+                "Please set VAULT_DEPLOYER_PRIVATE_KEY in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        account = self.w3.eth.account.from_key(deployer_private_key)
+
+        return await self._send_transaction(
+            account, self.contract.functions.updateCurator(new_curator_address)
+        )
+
+    async def update_fee_model(
+        self, fee_type: int, performance_fee: int, management_fee: int
+    ) -> TransactionResult:
+        """Update the fee model for the vault."""
+        deployer_private_key = os.getenv("VAULT_DEPLOYER_PRIVATE_KEY")
+        validate_var(
+            deployer_private_key,
+            error_message=(
+                "VAULT_DEPLOYER_PRIVATE_KEY environment variable is missing or invalid. "
+                "Please set VAULT_DEPLOYER_PRIVATE_KEY in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        account = self.w3.eth.account.from_key(deployer_private_key)
+
+        return await self._send_transaction(
+            account,
+            self.contract.functions.updateFeeModel(
+                fee_type, performance_fee, management_fee
+            ),
+        )
+
+
+class AsyncOrionTransparentVault(AsyncOrionVault):
+    """OrionTransparentVault contract on an asyncio event loop."""
+
+    def __init__(self, contract_address: str | None = None):
+        """Initialize the OrionTransparentVault contract, at ORION_VAULT_ADDRESS by default."""
+        super().__init__("OrionTransparentVault", contract_address)
+
+    async def submit_order_intent(
+        self,
+        order_intent: OrderIntent | dict[str, int],
+    ) -> TransactionResult:
+        """Submit a portfolio order intent.
+
+        Args:
+            order_intent: OrderIntent, or dictionary mapping token addresses to values
+
+        Returns:
+            TransactionResult
+        """
+        curator_private_key = os.getenv("CURATOR_PRIVATE_KEY")
+        validate_var(
+            curator_private_key,
+            error_message=(
+                "CURATOR_PRIVATE_KEY environment variable is missing or invalid. "
+                "Please set CURATOR_PRIVATE_KEY in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        account = self.w3.eth.account.from_key(curator_private_key)
+
+        # Token bytes of a parsed intent skip checksumming every address again.
+        order_intent = OrderIntent.from_mapping(order_intent)
+        items = [
+            {"token": token, "value": value}
+            for token, value in zip(order_intent.tokens, order_intent.weights)
+        ]
+
+        return await self._send_transaction(
+            account, self.contract.functions.submitIntent(items)
+        )
+
+
+class AsyncOrionEncryptedVault(AsyncOrionVault):
+    """OrionEncryptedVault contract on an asyncio event loop."""
+
+    def __init__(self, contract_address: str | None = None):
+        """Initialize the OrionEncryptedVault contract, at ORION_VAULT_ADDRESS by default."""
+        super().__init__("OrionEncryptedVault", contract_address)
+
+    async def submit_order_intent(
+        self,
+        order_intent: OrderIntent | dict[str, bytes],
+        input_proof: str,
+    ) -> TransactionResult:
+        """Submit a portfolio order intent.
+
+        Args:
+            order_intent: OrderIntent, or dictionary mapping token addresses to values
+            input_proof: A Zero-Knowledge Proof ensuring the validity of the encrypted data.
+
+        Returns:
+            TransactionResult
+        """
+        curator_private_key = os.getenv("CURATOR_PRIVATE_KEY")
+        validate_var(
+            curator_private_key,
+            error_message=(
+                "CURATOR_PRIVATE_KEY environment variable is missing or invalid. "
+                "Please set CURATOR_PRIVATE_KEY in your .env file or as an environment variable. "
+                "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
+            ),
+        )
+
+        account = self.w3.eth.account.from_key(curator_private_key)
+
+        # Token bytes of a parsed intent skip checksumming every address again.
+        order_intent = OrderIntent.from_mapping(order_intent)
+        items = [
+            {"token": token, "weight": weight}
+            for token, weight in zip(order_intent.tokens, order_intent.weights)
+        ]
+
+        return await self._send_transaction(
+            account, self.contract.functions.submitIntent(items, input_proof)
+        )
@@ -0,0 +1,74 @@
+"""Contract calls encoded once for the Orion Finance Python SDK."""
+
+from eth_abi import encode
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+from web3.types import TxParams
+
+
+def _abi_value(abi_input: dict, value):
+    """Bring a web3-style argument to the form eth_abi encodes.
+
+    Structs given as dicts become tuples in component order, and hex strings
+    passed for bytes types become bytes. Address strings become bytes too:
+    web3 has validated them already, and eth_abi would hash each one again to
+    check its checksum.
+    """
+    abi_type = abi_input["type"]
+    if abi_type.endswith("]"):
+        item_input = {**abi_input, "type": abi_type[: abi_type.rindex("[")]}
+        return [_abi_value(item_input, item) for item in value]
+    if abi_type == "tuple":
+        components = abi_input["components"]
+        if isinstance(value, dict):
+            value = [value[component["name"]] for component in components]
+        return tuple(
+            _abi_value(component, item) for component, item in zip(components, value)
+        )
+    if abi_type.startswith("bytes") and isinstance(value, str):
+        return bytes(HexBytes(value))
+    if abi_type == "address" and isinstance(value, str):
+        return bytes.fromhex(value[2:])
+    return value
+
+
+class PreparedCall:
+    """Contract function call whose calldata is ABI-encoded once.
+
+    Gas estimation, eth_call preflights, simulations and the signed
+    transaction all reuse the same calldata, instead of each running web3's
+    argument normalisation and encoding over the full argument list again.
+    """
+
+    def __init__(self, function):
+        """Encode a contract function call.
+
+        Args:
+            function: Contract function bound to its arguments, e.g.
+                ``contract.functions.submitIntent(items)``.
+        """
+        self.function = function
+        self.to = function.address
+        abi_inputs = function.abi["inputs"]
+        self.data = function.selector + (
+            encode(
+                [collapse_if_tuple(abi_input) for abi_input in abi_inputs],
+                [
+                    _abi_value(abi_input, arg)
+                    for abi_input, arg in zip(abi_inputs, function.args)
+                ],
+            ).hex()
+        )
+
+    @property
+    def fn_name(self) -> str:
+        """Name of the called function."""
+        return self.function.fn_name
+
+    def transaction(self, sender: str, **fields) -> TxParams:
+        """Transaction calling the function from sender, with extra fields.
+
+        Without extra fields, the result is ready for eth_estimateGas or
+        eth_call; with chainId, nonce, gas and fee fields, for signing.
+        """
+        return {"from": sender, "to": self.to, "data": self.data, **fields}
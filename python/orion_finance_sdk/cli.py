@@ -1,16 +1,14 @@
-"""Command line interface for the Orion Finance Python SDK."""
+"""Command line interface for the Orion Finance Python SDK.
+
+Contract, web3 and encryption modules are imported inside the commands that
+use them, so that ``orion --help`` does not pay for loading them.
+"""
 
-import json
 import os
 
 import typer
 
-from .contracts import (
-    OrionEncryptedVault,
-    OrionTransparentVault,
-    VaultFactory,
-)
-from .encrypt import encrypt_order_intent
+from .instrumentation import Profiler, get_instrumentation, set_instrumentation, span
 from .types import (
     FeeType,
     VaultType,
@@ -18,14 +16,60 @@ from .types import (
 )
 from .utils import (
     BASIS_POINTS_FACTOR,
+    DEFAULT_MAX_WORKERS,
     ensure_env_file,
     format_transaction_logs,
+    load_env,
     validate_order,
     validate_var,
 )
 
 app = typer.Typer()
 
+SIMULATE_HELP = "Validate and simulate the transaction without sending it"
+
+
+def _print_simulation(report) -> None:
+    """Print a simulation report, exiting with an error if it would fail."""
+    print(report.format())
+    if not report.ok:
+        raise typer.Exit(code=1)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    rpc_stats: bool = typer.Option(
+        False, help="Print the RPC requests and compute units the command used"
+    ),
+    profile: bool = typer.Option(
+        False, help="Print the time spent in each stage and RPC method"
+    ),
+) -> None:
+    """Orion Finance command line interface."""
+    load_env()
+    if rpc_stats:
+
+        def print_rpc_stats() -> None:
+            from .ratelimit import format_request_stats
+
+            print(format_request_stats())
+
+        ctx.call_on_close(print_rpc_stats)
+
+    if profile:
+        profiler = Profiler(inner=get_instrumentation())
+        set_instrumentation(profiler)
+
+        def print_profile() -> None:
+            set_instrumentation(profiler.inner)
+            print(profiler.format())
+
+        ctx.call_on_close(print_profile)
+
+    # Closed with the context, before the reports above are printed.
+    ctx.with_resource(span(f"orion {ctx.invoked_subcommand}"))
+
 
 @app.command()
 def deploy_vault(
@@ -41,14 +85,36 @@ def deploy_vault(
     management_fee: float = typer.Option(
         ..., help="Management fee in percentage i.e. 2.1 (maximum 3%)"
     ),
+    simulate: bool = typer.Option(False, help=SIMULATE_HELP),
 ):
     """Deploy an Orion vault with customizable fee structure, name, and symbol. The vault can be either transparent or encrypted."""
+    from .contracts import VaultFactory
+
     ensure_env_file()
 
     fee_type = fee_type_to_int[fee_type.value]
 
     vault_factory = VaultFactory(vault_type=vault_type.value)
 
+    if simulate:
+        from .simulation import SimulationReport
+
+        report = SimulationReport("createVault")
+        vault_report = report.run(
+            "validate",
+            vault_factory.create_orion_vault,
+            name=name,
+            symbol=symbol,
+            fee_type=fee_type,
+            performance_fee=int(performance_fee * BASIS_POINTS_FACTOR),
+            management_fee=int(management_fee * BASIS_POINTS_FACTOR),
+            simulate=True,
+        )
+        if vault_report is not None:
+            report.extend(vault_report)
+        _print_simulation(report)
+        return
+
     tx_result = vault_factory.create_orion_vault(
         name=name,
         symbol=symbol,
@@ -73,9 +139,14 @@ def deploy_vault(
 @app.command()
 def submit_order(
     order_intent_path: str = typer.Option(
-        ..., help="Path to JSON file containing order intent"
+        ..., help="Path to JSON, CSV or Parquet file containing order intent"
     ),
     fuzz: bool = typer.Option(False, help="Fuzz the order intent"),
+    simulate: bool = typer.Option(False, help=SIMULATE_HELP),
+    stub_encryption: bool = typer.Option(
+        False,
+        help="With --simulate, skip encryption and submit placeholder ciphertexts",
+    ),
 ) -> None:
     """Submit an order intent to an Orion vault. The order intent can be either transparent or encrypted."""
     ensure_env_file()
@@ -89,19 +160,40 @@ def submit_order(
         ),
     )
 
-    # JSON file input
-    with open(order_intent_path, "r") as f:
-        order_intent = json.load(f)
+    from .contracts import OrionConfig, OrionEncryptedVault, OrionTransparentVault
+    from .encrypt import (
+        check_node_available,
+        encrypt_order_intent,
+        print_installation_guide,
+    )
+    from .intent import load_order_intent
+
+    order_intent = load_order_intent(order_intent_path)
 
-    from .contracts import OrionConfig
+    if simulate:
+        from .orders import simulate_order_intent
+
+        _print_simulation(
+            simulate_order_intent(
+                vault_address,
+                order_intent,
+                fuzz=fuzz,
+                stub_encryption=stub_encryption,
+            )
+        )
+        return
 
     config = OrionConfig()
 
-    if vault_address in config.orion_transparent_vaults:
+    vault_type = config.vault_type(vault_address)
+    if vault_type == VaultType.TRANSPARENT:
         output_order_intent = validate_order(order_intent=order_intent)
         vault = OrionTransparentVault()
         tx_result = vault.submit_order_intent(order_intent=output_order_intent)
-    elif vault_address in config.orion_encrypted_vaults:
+    elif vault_type == VaultType.ENCRYPTED:
+        if not check_node_available():
+            print_installation_guide()
+            raise typer.Exit(code=1)
         validated_order_intent = validate_order(order_intent=order_intent, fuzz=fuzz)
         output_order_intent, input_proof = encrypt_order_intent(
             order_intent=validated_order_intent
@@ -117,13 +209,52 @@ def submit_order(
     format_transaction_logs(tx_result, "Order intent submitted successfully!")
 
 
+@app.command()
+def submit_orders(
+    manifest_path: str = typer.Option(
+        ...,
+        help="Path to JSON file mapping vault addresses to order intent files",
+    ),
+    fuzz: bool = typer.Option(False, help="Fuzz the order intents"),
+    max_workers: int = typer.Option(
+        DEFAULT_MAX_WORKERS, help="Maximum number of vaults processed concurrently"
+    ),
+    simulate: bool = typer.Option(
+        False, help="Validate and simulate the submissions without sending them"
+    ),
+    stub_encryption: bool = typer.Option(
+        False,
+        help="With --simulate, skip encryption and submit placeholder ciphertexts",
+    ),
+) -> None:
+    """Submit order intents to several Orion vaults at once, transparent or encrypted."""
+    from .orders import format_submissions, load_manifest, submit_manifest
+
+    ensure_env_file()
+
+    submissions = submit_manifest(
+        load_manifest(manifest_path),
+        fuzz=fuzz,
+        max_workers=max_workers,
+        simulate=simulate,
+        stub_encryption=stub_encryption,
+    )
+
+    print(format_submissions(submissions))
+    if not all(submission.ok for submission in submissions):
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def update_curator(
     new_curator_address: str = typer.Option(
         ..., help="New curator address to set for the vault"
     ),
+    simulate: bool = typer.Option(False, help=SIMULATE_HELP),
 ) -> None:
     """Update the curator address for an Orion vault."""
+    from .contracts import OrionTransparentVault
+
     ensure_env_file()
 
     vault_address = os.getenv("ORION_VAULT_ADDRESS")
@@ -138,7 +269,10 @@ def update_curator(
     # Working for both vaults types
     vault = OrionTransparentVault()
 
-    tx_result = vault.update_curator(new_curator_address)
+    tx_result = vault.update_curator(new_curator_address, simulate=simulate)
+    if simulate:
+        _print_simulation(tx_result)
+        return
     format_transaction_logs(tx_result, "Curator address updated successfully!")
 
 
@@ -151,8 +285,11 @@ def update_fee_model(
     management_fee: float = typer.Option(
         ..., help="Management fee in percentage i.e. 2.1 (maximum 3%)"
     ),
+    simulate: bool = typer.Option(False, help=SIMULATE_HELP),
 ) -> None:
     """Update the fee model for an Orion vault."""
+    from .contracts import OrionTransparentVault
+
     ensure_env_file()
 
     fee_type = fee_type_to_int[fee_type.value]
@@ -173,5 +310,9 @@ def update_fee_model(
         fee_type=fee_type,
         performance_fee=int(performance_fee * BASIS_POINTS_FACTOR),
         management_fee=int(management_fee * BASIS_POINTS_FACTOR),
+        simulate=simulate,
     )
+    if simulate:
+        _print_simulation(tx_result)
+        return
     format_transaction_logs(tx_result, "Fee model updated successfully!")
@@ -0,0 +1,154 @@
+"""Read-through cache of OrionConfig protocol reads for the Orion Finance Python SDK."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from web3 import Web3
+
+from .types import VaultType
+from .utils import get_cache_dir
+
+# Seconds a cached value stays fresh, per OrionConfig field. 0 disables caching.
+DEFAULT_CONFIG_CACHE_TTLS = {
+    "curator_intent_decimals": 3600,
+    "whitelisted_assets": 300,
+    "orion_transparent_vaults": 60,
+    "orion_encrypted_vaults": 60,
+}
+
+
+class ConfigCache:
+    """Per-field TTL cache of protocol configuration values.
+
+    Each entry records when and at which block it was read. Entries expire
+    after their field's TTL, and can be invalidated explicitly or once the
+    configuration is known to have changed at a given block. With a path,
+    entries are persisted to disk so that short-lived processes, such as
+    successive CLI invocations, share them.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        ttls: dict[str, float] | None = None,
+        path: os.PathLike | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            key: Identifies the configuration contract and network in the cache file.
+            ttls: Per-field TTLs in seconds, overriding DEFAULT_CONFIG_CACHE_TTLS.
+            path: JSON file to persist entries to, or None to keep them in memory.
+        """
+        self.key = key
+        self.ttls = {**DEFAULT_CONFIG_CACHE_TTLS, **(ttls or {})}
+        self.path = path
+        self._entries: dict[str, tuple[Any, float, int]] = {}
+        # A vault's type never changes, so resolved types are kept indefinitely.
+        self.vault_types: dict[str, VaultType] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self._entries.update(self._read_file().get(key, {}))
+
+    def get(
+        self,
+        field: str,
+        fetch: Callable[[], tuple[Any, int]],
+        ttl: float | None = None,
+    ) -> Any:
+        """Return a fresh cached value, or read it through fetch.
+
+        Args:
+            field: Name of the cached field.
+            fetch: Returns the value from the chain and the block it was read at.
+            ttl: Seconds the value stays fresh for this read, defaults to the
+                field's TTL.
+        """
+        if ttl is None:
+            ttl = self.ttls.get(field, 0)
+        with self._lock:
+            entry = self._entries.get(field)
+        if entry is not None and time.time() - entry[1] < ttl:
+            return entry[0]
+
+        value, block_number = fetch()
+        if ttl > 0:
+            with self._lock:
+                self._entries[field] = (value, time.time(), block_number)
+            self._save()
+        return value
+
+    def invalidate(self, *fields: str, block_number: int | None = None) -> None:
+        """Drop cached values.
+
+        Args:
+            fields: Fields to drop, all of them if none are given.
+            block_number: Only drop values read before this block, i.e. the
+                block at which the configuration is known to have changed.
+        """
+        with self._lock:
+            for field in fields or list(self._entries):
+                entry = self._entries.get(field)
+                if entry is None:
+                    continue
+                if block_number is None or entry[2] < block_number:
+                    del self._entries[field]
+        self._save()
+
+    def _read_file(self) -> dict:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        """Write the entries to disk; failures only cost future reads."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = self._read_file()
+            data[self.key] = self._entries.copy()
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+
+_caches: "weakref.WeakKeyDictionary[Web3, dict[str, ConfigCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+_caches_lock = threading.Lock()
+
+
+def get_config_cache(w3: Web3, config_address: str) -> ConfigCache:
+    """Return the process-wide cache of a configuration contract on a connection.
+
+    Setting ORION_CONFIG_CACHE_PERSIST=1 persists it under the SDK cache
+    directory, keyed by a hash of the RPC endpoint and the contract address.
+    """
+    config_address = Web3.to_checksum_address(config_address)
+    with _caches_lock:
+        caches = _caches.setdefault(w3, {})
+        if config_address not in caches:
+            endpoint = str(getattr(w3.provider, "endpoint_uri", ""))
+            # Hashed, since RPC URLs often embed API keys.
+            key = (
+                f"{hashlib.sha256(endpoint.encode()).hexdigest()[:16]}:{config_address}"
+            )
+            path = None
+            if os.getenv("ORION_CONFIG_CACHE_PERSIST", "").lower() in ("1", "true"):
+                path = get_cache_dir() / "orion_config.json"
+            caches[config_address] = ConfigCache(key, path=path)
+        return caches[config_address]
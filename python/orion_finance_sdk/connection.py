@@ -0,0 +1,160 @@
+"""Shared Web3 connections for the Orion Finance Python SDK."""
+
+import os
+import threading
+import weakref
+
+import requests
+from aiohttp import ClientTimeout
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+
+from .ratelimit import AsyncMeteredHTTPProvider, MeteredHTTPProvider
+from .router import DEFAULT_RETRIES, AsyncRPCRouter, RPCRouter, split_rpc_urls
+
+DEFAULT_POOL_SIZE = 10  # Keep-alive connections kept open per RPC URL
+DEFAULT_TIMEOUT = 30  # Seconds before an RPC request times out
+
+_connections: dict[str, Web3] = {}
+_async_connections: dict[str, AsyncWeb3] = {}
+_sessions: dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    """Create a keep-alive HTTP session with a bounded connection pool."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _routing_options() -> dict:
+    """Retry and hedging settings of multi-endpoint routers, from the environment."""
+    hedge_after = os.getenv("ORION_RPC_HEDGE_DELAY")
+    return {
+        "retries": int(os.getenv("ORION_RPC_RETRIES", DEFAULT_RETRIES)),
+        "hedge_after": float(hedge_after) if hedge_after else None,
+    }
+
+
+def get_web3(
+    rpc_url: str, pool_size: int | None = None, timeout: float | None = None
+) -> Web3:
+    """Return the process-wide Web3 connection for an RPC URL.
+
+    The first call for a given URL creates the connection; later calls reuse it,
+    together with its pooled HTTP session, so contract objects do not each pay
+    for their own TCP and TLS handshakes.
+
+    A comma-separated list of endpoints is served by an RPCRouter, which
+    spreads reads by latency, fails over between endpoints and broadcasts
+    signed transactions to all of them.
+
+    Args:
+        rpc_url: RPC endpoint to connect to, or comma-separated endpoints.
+        pool_size: Keep-alive connections in the pool, defaults to ORION_RPC_POOL_SIZE.
+        timeout: Request timeout in seconds, defaults to ORION_RPC_TIMEOUT.
+
+    Returns:
+        Web3 instance bound to the shared provider.
+    """
+    with _lock:
+        w3 = _connections.get(rpc_url)
+        if w3 is None:
+            if pool_size is None:
+                pool_size = int(os.getenv("ORION_RPC_POOL_SIZE", DEFAULT_POOL_SIZE))
+            if timeout is None:
+                timeout = float(os.getenv("ORION_RPC_TIMEOUT", DEFAULT_TIMEOUT))
+
+            session = _pooled_session(pool_size)
+            urls = split_rpc_urls(rpc_url)
+            if len(urls) > 1:
+                provider = RPCRouter(
+                    urls,
+                    request_kwargs={"timeout": timeout},
+                    session=session,
+                    pool_size=pool_size,
+                    **_routing_options(),
+                )
+            else:
+                provider = MeteredHTTPProvider(
+                    rpc_url, request_kwargs={"timeout": timeout}, session=session
+                )
+            w3 = Web3(provider)
+            _connections[rpc_url] = w3
+            _sessions[rpc_url] = session
+        return w3
+
+
+def get_async_web3(rpc_url: str, timeout: float | None = None) -> AsyncWeb3:
+    """Return the process-wide AsyncWeb3 connection for an RPC URL.
+
+    The provider keeps one keep-alive aiohttp session per event loop, and
+    routes over comma-separated endpoints like get_web3.
+
+    Args:
+        rpc_url: RPC endpoint to connect to, or comma-separated endpoints.
+        timeout: Request timeout in seconds, defaults to ORION_RPC_TIMEOUT.
+
+    Returns:
+        AsyncWeb3 instance bound to the shared provider.
+    """
+    with _lock:
+        w3 = _async_connections.get(rpc_url)
+        if w3 is None:
+            if timeout is None:
+                timeout = float(os.getenv("ORION_RPC_TIMEOUT", DEFAULT_TIMEOUT))
+
+            request_kwargs = {"timeout": ClientTimeout(total=timeout)}
+            urls = split_rpc_urls(rpc_url)
+            if len(urls) > 1:
+                provider = AsyncRPCRouter(
+                    urls, request_kwargs=request_kwargs, **_routing_options()
+                )
+            else:
+                provider = AsyncMeteredHTTPProvider(
+                    rpc_url, request_kwargs=request_kwargs
+                )
+            w3 = AsyncWeb3(provider)
+            _async_connections[rpc_url] = w3
+        return w3
+
+
+_chain_ids: "weakref.WeakKeyDictionary[Web3 | AsyncWeb3, int]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_chain_id(w3: Web3) -> int:
+    """Return the chain id of a connection, fetched once.
+
+    An endpoint serves a single chain, so transactions need not each ask for it.
+    """
+    chain_id = _chain_ids.get(w3)
+    if chain_id is None:
+        chain_id = _chain_ids[w3] = w3.eth.chain_id
+    return chain_id
+
+
+async def get_async_chain_id(w3: AsyncWeb3) -> int:
+    """Return the chain id of an async connection, fetched once."""
+    chain_id = _chain_ids.get(w3)
+    if chain_id is None:
+        chain_id = _chain_ids[w3] = await w3.eth.chain_id
+    return chain_id
+
+
+def close_connections() -> None:
+    """Close all pooled sessions and forget the registered connections.
+
+    Async connections are forgotten; close them with ``await w3.provider.disconnect()``
+    from their event loop beforehand to release their sessions.
+    """
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _connections.clear()
+        _async_connections.clear()
@@ -1,19 +1,41 @@
 """Interactions with the Orion Finance protocol contracts."""
 
+import functools
 import json
 import os
-import sys
+import threading
+import weakref
+from concurrent.futures import Future
 from dataclasses import dataclass
 from importlib import resources
 
-from dotenv import load_dotenv
-from web3 import Web3
-from web3.types import TxReceipt
-
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.contract.contract import Contract, ContractEvent, ContractFunction
+from web3.types import LogReceipt, TxReceipt
+
+from .calls import PreparedCall
+from .config_cache import get_config_cache
+from .connection import get_chain_id, get_web3
+from .fees import get_fee_oracle
+from .gas import gas_key, get_gas_cache
+from .instrumentation import span
+from .intent import OrderIntent, address_bytes, checksum_address
+from .nonce import (
+    get_nonce_manager,
+    is_already_known_error,
+    is_nonce_too_low_error,
+)
+from .receipts import get_receipt_tracker
+from .simulation import SimulationReport, simulate_transactions
 from .types import VaultType
-from .utils import validate_management_fee, validate_performance_fee, validate_var
-
-load_dotenv()
+from .utils import (
+    load_env,
+    validate_management_fee,
+    validate_performance_fee,
+    validate_var,
+)
 
 
 @dataclass
@@ -25,8 +47,50 @@ class TransactionResult:
     decoded_logs: list[dict] | None = None
 
 
+class PendingTransaction:
+    """Handle on a broadcast transaction whose receipt is tracked in the background.
+
+    The receipt is polled by the connection's ReceiptTracker together with all
+    other pending transactions, and its logs are only decoded when the result
+    is requested.
+    """
+
+    def __init__(
+        self, contract: "OrionSmartContract", tx_hash: str, receipt_future: Future
+    ):
+        """Initialize the pending transaction."""
+        self.contract = contract
+        self.tx_hash = tx_hash
+        self._receipt_future = receipt_future
+        self._result: TransactionResult | None = None
+
+    def done(self) -> bool:
+        """Whether the transaction has been mined or has timed out."""
+        return self._receipt_future.done()
+
+    def receipt(self, timeout: float | None = None) -> TxReceipt:
+        """Wait for the transaction receipt."""
+        return self._receipt_future.result(timeout=timeout)
+
+    def result(self, timeout: float | None = None) -> TransactionResult:
+        """Wait for the transaction to be mined and decode its logs.
+
+        Raises:
+            Exception: If the transaction failed.
+        """
+        if self._result is None:
+            self._result = self.contract._transaction_result(
+                self.tx_hash, self.receipt(timeout=timeout)
+            )
+        return self._result
+
+
+@functools.lru_cache(maxsize=None)
 def load_contract_abi(contract_name: str) -> list[dict]:
-    """Load the ABI for a given contract."""
+    """Load the ABI for a given contract.
+
+    The ABI is parsed once per process and shared, so it must not be mutated.
+    """
     try:
         # Try to load from package data (when installed from PyPI)
         with (
@@ -43,11 +107,76 @@ def load_contract_abi(contract_name: str) -> list[dict]:
             return json.load(f)["abi"]
 
 
+# Contract objects per connection, keyed by (contract name, checksum address).
+_contracts: "weakref.WeakKeyDictionary[Web3, dict[tuple[str, str], Contract]]" = (
+    weakref.WeakKeyDictionary()
+)
+_event_indexes: "weakref.WeakKeyDictionary[Contract, dict[bytes, ContractEvent]]" = (
+    weakref.WeakKeyDictionary()
+)
+_contracts_lock = threading.Lock()
+
+
+def get_contract(
+    w3: Web3 | AsyncWeb3, contract_name: str, contract_address: str
+) -> Contract:
+    """Return the web3 contract object of a deployed contract on a connection.
+
+    Building a contract object generates classes for every function and event
+    of the ABI, so it is done once per (contract name, address, connection).
+    """
+    key = (contract_name, Web3.to_checksum_address(contract_address))
+    with _contracts_lock:
+        contracts = _contracts.setdefault(w3, {})
+        if key not in contracts:
+            contracts[key] = w3.eth.contract(
+                address=key[1], abi=load_contract_abi(contract_name)
+            )
+        return contracts[key]
+
+
+def get_event_index(contract: Contract) -> dict[bytes, ContractEvent]:
+    """Return the contract's events indexed by signature hash (topic0), built once."""
+    with _contracts_lock:
+        if contract not in _event_indexes:
+            _event_indexes[contract] = {
+                HexBytes(event.topic): event
+                for event in contract.events
+                if not event.abi.get("anonymous")
+            }
+        return _event_indexes[contract]
+
+
+def decode_log(contract: Contract, log: LogReceipt) -> dict | None:
+    """Decode a single log, or return None if it is not an event of the contract."""
+    if not log["topics"]:
+        return None
+    event = get_event_index(contract).get(HexBytes(log["topics"][0]))
+    if event is None:
+        return None
+    try:
+        decoded_log = event.process_log(log)
+    except Exception:
+        # Same signature hash but a different indexed-argument layout
+        return None
+    return {
+        "event": decoded_log.event,
+        "args": dict(decoded_log.args),
+        "address": decoded_log.address,
+        "blockHash": decoded_log.blockHash.hex(),
+        "blockNumber": decoded_log.blockNumber,
+        "logIndex": decoded_log.logIndex,
+        "transactionHash": decoded_log.transactionHash.hex(),
+        "transactionIndex": decoded_log.transactionIndex,
+    }
+
+
 class OrionSmartContract:
     """Base class for Orion smart contracts."""
 
     def __init__(self, contract_name: str, contract_address: str):
         """Initialize a smart contract."""
+        load_env()
         rpc_url = os.getenv("RPC_URL")
         validate_var(
             rpc_url,
@@ -58,12 +187,10 @@ class OrionSmartContract:
             ),
         )
 
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.w3 = get_web3(rpc_url)
         self.contract_name = contract_name
         self.contract_address = contract_address
-        self.contract = self.w3.eth.contract(
-            address=self.contract_address, abi=load_contract_abi(self.contract_name)
-        )
+        self.contract = get_contract(self.w3, self.contract_name, self.contract_address)
 
     def _wait_for_transaction_receipt(
         self, tx_hash: str, timeout: int = 120
@@ -71,77 +198,268 @@ class OrionSmartContract:
         """Wait for a transaction to be processed and return the receipt."""
         return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
 
+    def _simulate_transaction(
+        self, account: LocalAccount, function: ContractFunction
+    ) -> SimulationReport:
+        """Estimate gas and eth_call a contract function call without sending it.
+
+        Both requests go to the node in a single batch.
+        """
+        report = SimulationReport(function.fn_name, self.contract_address)
+        prepared = report.run("encode", PreparedCall, function)
+        if prepared is None:
+            return report
+        results = report.run(
+            "estimate_gas+eth_call",
+            simulate_transactions,
+            self.w3,
+            [prepared.transaction(account.address)],
+        )
+        if results is not None:
+            report.gas_estimate, report.return_data, error = results[0]
+            report.stages[-1].error = error
+        return report
+
+    def _send_transaction(
+        self,
+        account: LocalAccount,
+        function: ContractFunction,
+        wait: bool = True,
+        simulate: bool = False,
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
+        """Sign and send a contract function call, then wait for its receipt.
+
+        The nonce is allocated by the account's NonceManager. If the node reports
+        it as already used, the manager resyncs and the transaction is retried once.
+        A node answering "already known" already holds this signed transaction,
+        so it is not signed again.
+        Gas is estimated from the receipts of earlier calls of the same shape
+        when they agree, and by the node otherwise.
+        With wait=False, a PendingTransaction is returned right after broadcast.
+        With simulate=True, nothing is sent and a SimulationReport is returned.
+        """
+        with span(f"{self.contract_name}.{function.fn_name}", simulate=simulate):
+            if simulate:
+                return self._simulate_transaction(account, function)
+            return self._sign_and_send(account, function, wait)
+
+    def _sign_and_send(
+        self, account: LocalAccount, function: ContractFunction, wait: bool
+    ) -> TransactionResult | PendingTransaction:
+        """Send a contract function call, each stage in its own span."""
+        nonce_manager = get_nonce_manager(self.w3, account.address)
+        fee_oracle = get_fee_oracle(self.w3)
+        gas_cache = get_gas_cache(self.w3)
+        shape = gas_key(self.contract_name, function)
+        # Encoded once, for both the gas estimate and the signed transaction.
+        with span("encode"):
+            prepared = PreparedCall(function)
+        for attempt in range(2):
+            cached_estimate = gas_cache.get(shape)
+            try:
+                with nonce_manager.nonce() as nonce:
+                    # A cached estimate already includes its headroom.
+                    gas_limit = cached_estimate
+                    if gas_limit is None:
+                        with span("estimate_gas"):
+                            gas_estimate = self.w3.eth.estimate_gas(
+                                prepared.transaction(account.address)
+                            )
+
+                        # Add 20% buffer to gas estimate
+                        gas_limit = int(gas_estimate * 1.2)
+
+                    tx = prepared.transaction(
+                        account.address,
+                        chainId=get_chain_id(self.w3),
+                        nonce=nonce,
+                        gas=gas_limit,
+                        **fee_oracle.transaction_fees(),
+                    )
+
+                    with span("sign"):
+                        signed = account.sign_transaction(tx)
+                    with span("send"):
+                        try:
+                            tx_hash = self.w3.eth.send_raw_transaction(
+                                signed.raw_transaction
+                            )
+                        except Exception as e:
+                            # An earlier attempt already reached the node.
+                            if not is_already_known_error(e):
+                                raise
+                            tx_hash = signed.hash
+                break
+            except Exception as e:
+                if attempt or not is_nonce_too_low_error(e):
+                    if cached_estimate is not None:
+                        # The cached estimate may be what the node rejected.
+                        gas_cache.forget(shape)
+                    raise
+
+        tx_hash_hex = tx_hash.hex()
+
+        if not wait:
+            receipt_future = get_receipt_tracker(self.w3).track(tx_hash_hex)
+            receipt_future.add_done_callback(
+                lambda future: (
+                    future.exception() or gas_cache.record(shape, future.result())
+                )
+            )
+            return PendingTransaction(self, tx_hash_hex, receipt_future)
+
+        with span("wait_receipt"):
+            receipt = self._wait_for_transaction_receipt(tx_hash_hex)
+        gas_cache.record(shape, receipt)
+
+        return self._transaction_result(tx_hash_hex, receipt)
+
+    def _transaction_result(
+        self, tx_hash_hex: str, receipt: TxReceipt
+    ) -> TransactionResult:
+        """Check a mined transaction succeeded and decode its logs."""
+        # Check if transaction was successful
+        if receipt["status"] != 1:
+            raise Exception(f"Transaction failed with status: {receipt['status']}")
+
+        # Decode logs from the transaction receipt
+        decoded_logs = self._decode_logs(receipt)
+
+        return TransactionResult(
+            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        )
+
     # TODO: verify contracts once deployed, potentially in the same cli command, as soon as deployed it,
     # verify with the same input parameters.
     # Skip verification if Etherscan API key is not provided without failing command.
 
+    def _decode_log(self, log: LogReceipt) -> dict | None:
+        """Decode a single log, or return None if it is not an event of this contract."""
+        return decode_log(self.contract, log)
+
     def _decode_logs(self, receipt: TxReceipt) -> list[dict]:
         """Decode logs from a transaction receipt."""
+        contract_address = self.contract_address.lower()
         decoded_logs = []
         for log in receipt.logs:
             # Only process logs from this contract
-            if log.address.lower() != self.contract_address.lower():
+            if log.address.lower() != contract_address:
                 continue
 
-            # Try to decode the log with each event in the contract
-            for event in self.contract.events:
-                try:
-                    decoded_log = event.process_log(log)
-                    decoded_logs.append(
-                        {
-                            "event": decoded_log.event,
-                            "args": dict(decoded_log.args),
-                            "address": decoded_log.address,
-                            "blockHash": decoded_log.blockHash.hex(),
-                            "blockNumber": decoded_log.blockNumber,
-                            "logIndex": decoded_log.logIndex,
-                            "transactionHash": decoded_log.transactionHash.hex(),
-                            "transactionIndex": decoded_log.transactionIndex,
-                        }
-                    )
-                    break  # Successfully decoded, move to next log
-                except Exception:
-                    # This event doesn't match this log, try the next event
-                    continue
+            decoded_log = self._decode_log(log)
+            if decoded_log is not None:
+                decoded_logs.append(decoded_log)
         return decoded_logs
 
 
 class OrionConfig(OrionSmartContract):
-    """OrionConfig contract."""
+    """OrionConfig contract.
+
+    Protocol reads are served from a read-through cache shared by all
+    instances on the same connection, see ConfigCache for the expiry rules.
+    """
 
-    def __init__(self):
-        """Initialize the OrionConfig contract."""
+    def __init__(self, cache_ttls: dict[str, float] | None = None):
+        """Initialize the OrionConfig contract.
+
+        Args:
+            cache_ttls: Per-field cache TTLs in seconds for this instance's
+                reads; other instances sharing the cache keep the defaults.
+        """
         contract_address = "0x8eD5Fb264A049b18B98e8403e01146Ee78C1e984"
         super().__init__(
             contract_name="OrionConfig",
             contract_address=contract_address,
         )
+        self.cache = get_config_cache(self.w3, self.contract_address)
+        self.cache_ttls = dict(cache_ttls or {})
+
+    def _cached_call(self, field: str, function: ContractFunction):
+        """Read a config value through the cache, pinned to the current block."""
+
+        def fetch():
+            block_number = self.w3.eth.block_number
+            return function.call(block_identifier=block_number), block_number
+
+        return self.cache.get(field, fetch, self.cache_ttls.get(field))
+
+    def refresh(self, *fields: str, block_number: int | None = None) -> None:
+        """Drop cached config values, so the next access reads them from the chain.
+
+        Args:
+            fields: Fields to refresh, all of them if none are given.
+            block_number: Only refresh values read before this block.
+        """
+        self.cache.invalidate(*fields, block_number=block_number)
 
     @property
     def curator_intent_decimals(self) -> int:
         """Fetch the curator intent decimals from the OrionConfig contract."""
-        return self.contract.functions.curatorIntentDecimals().call()
+        return self._cached_call(
+            "curator_intent_decimals", self.contract.functions.curatorIntentDecimals()
+        )
 
     @property
     def whitelisted_assets(self) -> list[str]:
         """Fetch all whitelisted assets from the OrionConfig contract."""
-        return self.contract.functions.getAllWhitelistedAssets().call()
+        return self._cached_call(
+            "whitelisted_assets", self.contract.functions.getAllWhitelistedAssets()
+        )
+
+    @property
+    def whitelisted_asset_set(self) -> set[str]:
+        """Fetch all whitelisted assets as a set of checksum addresses, in a single call."""
+        return {
+            checksum_address(address_bytes(asset)) for asset in self.whitelisted_assets
+        }
 
     def is_whitelisted(self, token_address: str) -> bool:
         """Check if a token address is whitelisted."""
         return self.contract.functions.isWhitelisted(
-            Web3.to_checksum_address(token_address)
+            checksum_address(address_bytes(token_address))
         ).call()
 
     @property
     def orion_transparent_vaults(self) -> list[str]:
         """Fetch all Orion transparent vault addresses from the OrionConfig contract."""
-        return self.contract.functions.getAllOrionVaults(0).call()
+        return self._cached_call(
+            "orion_transparent_vaults", self.contract.functions.getAllOrionVaults(0)
+        )
 
     @property
     def orion_encrypted_vaults(self) -> list[str]:
         """Fetch all Orion encrypted vault addresses from the OrionConfig contract."""
-        return self.contract.functions.getAllOrionVaults(1).call()
+        return self._cached_call(
+            "orion_encrypted_vaults", self.contract.functions.getAllOrionVaults(1)
+        )
+
+    def vault_type(self, vault_address: str) -> VaultType | None:
+        """Resolve whether an address is a transparent or encrypted Orion vault.
+
+        The vault lists are indexed once into a checksum-address lookup, so
+        repeated resolutions cost no contract calls. An unknown address
+        refreshes the lists once, in case the vault was deployed since.
+
+        Returns:
+            The vault type, or None if the address is not an Orion vault.
+        """
+        vault_address = Web3.to_checksum_address(vault_address)
+        vault_types = self.cache.vault_types
+        if vault_address in vault_types:
+            return vault_types[vault_address]
+
+        for refresh in (False, True):
+            if refresh:
+                self.refresh("orion_transparent_vaults", "orion_encrypted_vaults")
+            for vault_type, field in (
+                (VaultType.TRANSPARENT, "orion_transparent_vaults"),
+                (VaultType.ENCRYPTED, "orion_encrypted_vaults"),
+            ):
+                for vault in getattr(self, field):
+                    vault_types.setdefault(Web3.to_checksum_address(vault), vault_type)
+                if vault_address in vault_types:
+                    return vault_types[vault_address]
+        return None
 
     def is_system_idle(self) -> bool:
         """Check if the system is in idle state, required for vault deployment."""
@@ -174,8 +492,17 @@ class VaultFactory(OrionSmartContract):
         fee_type: int,
         performance_fee: int,
         management_fee: int,
-    ) -> TransactionResult:
-        """Create an Orion vault for a given curator address."""
+        wait: bool = True,
+        simulate: bool = False,
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
+        """Create an Orion vault for a given curator address.
+
+        With wait=False, returns a PendingTransaction right after broadcast, and
+        with simulate=True a SimulationReport without sending anything.
+
+        Raises:
+            RuntimeError: If the system is not idle, as deployment requires.
+        """
         config = OrionConfig()
 
         curator_address = os.getenv("CURATOR_ADDRESS")
@@ -207,49 +534,34 @@ class VaultFactory(OrionSmartContract):
         validate_management_fee(management_fee)
 
         if not config.is_system_idle():
-            print("System is not idle. Cannot deploy vault at this time.")
-            sys.exit(1)
-
-        account = self.w3.eth.account.from_key(deployer_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        # Estimate gas needed for the transaction
-        gas_estimate = self.contract.functions.createVault(
-            curator_address, name, symbol, fee_type, performance_fee, management_fee
-        ).estimate_gas({"from": account.address, "nonce": nonce})
-
-        # Add 20% buffer to gas estimate
-        gas_limit = int(gas_estimate * 1.2)
+            raise RuntimeError("System is not idle. Cannot deploy vault at this time.")
 
         # TODO: add check to measure deployer ETH balance and raise error if not enough before building tx.
 
-        tx = self.contract.functions.createVault(
-            curator_address, name, symbol, fee_type, performance_fee, management_fee
-        ).build_transaction(
-            {
-                "from": account.address,
-                "nonce": nonce,
-                "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
-            }
+        return self._send_transaction(
+            account,
+            self.contract.functions.createVault(
+                curator_address, name, symbol, fee_type, performance_fee, management_fee
+            ),
+            wait=wait,
+            simulate=simulate,
         )
 
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        # Check if transaction was successful
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        # Decode logs from the transaction receipt
-        decoded_logs = self._decode_logs(receipt)
+    def _transaction_result(
+        self, tx_hash_hex: str, receipt: TxReceipt
+    ) -> TransactionResult:
+        """Check a mined transaction succeeded and decode its logs.
 
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        A deployed vault changes the vault lists, so cached lists read before
+        its block are dropped.
+        """
+        result = super()._transaction_result(tx_hash_hex, receipt)
+        OrionConfig().refresh(
+            "orion_transparent_vaults",
+            "orion_encrypted_vaults",
+            block_number=receipt["blockNumber"],
         )
+        return result
 
     def get_vault_address_from_result(self, result: TransactionResult) -> str | None:
         """Extract the vault address from OrionVaultCreated event in the transaction result."""
@@ -266,9 +578,14 @@ class VaultFactory(OrionSmartContract):
 class OrionVault(OrionSmartContract):
     """OrionVault contract."""
 
-    def __init__(self, contract_name: str):
-        """Initialize the OrionVault contract."""
-        contract_address = os.getenv("ORION_VAULT_ADDRESS")
+    def __init__(self, contract_name: str, contract_address: str | None = None):
+        """Initialize the OrionVault contract.
+
+        Args:
+            contract_name: Name of the vault contract ABI.
+            contract_address: Vault address, defaults to ORION_VAULT_ADDRESS.
+        """
+        contract_address = contract_address or os.getenv("ORION_VAULT_ADDRESS")
         validate_var(
             contract_address,
             error_message=(
@@ -278,8 +595,14 @@ class OrionVault(OrionSmartContract):
         )
         super().__init__(contract_name, contract_address)
 
-    def update_curator(self, new_curator_address: str) -> TransactionResult:
-        """Update the curator address for the vault."""
+    def update_curator(
+        self, new_curator_address: str, wait: bool = True, simulate: bool = False
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
+        """Update the curator address for the vault.
+
+        With wait=False, returns a PendingTransaction right after broadcast, and
+        with simulate=True a SimulationReport without sending anything.
+        """
         deployer_private_key = os.getenv("VAULT_DEPLOYER_PRIVATE_KEY")
         validate_var(
             deployer_private_key,
@@ -291,31 +614,27 @@ class OrionVault(OrionSmartContract):
         )
 
         account = self.w3.eth.account.from_key(deployer_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.updateCurator(
-            new_curator_address
-        ).build_transaction({"from": account.address, "nonce": nonce})
 
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        return self._send_transaction(
+            account,
+            self.contract.functions.updateCurator(new_curator_address),
+            wait=wait,
+            simulate=simulate,
         )
 
     def update_fee_model(
-        self, fee_type: int, performance_fee: int, management_fee: int
-    ) -> TransactionResult:
-        """Update the fee model for the vault."""
+        self,
+        fee_type: int,
+        performance_fee: int,
+        management_fee: int,
+        wait: bool = True,
+        simulate: bool = False,
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
+        """Update the fee model for the vault.
+
+        With wait=False, returns a PendingTransaction right after broadcast, and
+        with simulate=True a SimulationReport without sending anything.
+        """
         deployer_private_key = os.getenv("VAULT_DEPLOYER_PRIVATE_KEY")
         validate_var(
             deployer_private_key,
@@ -327,46 +646,40 @@ class OrionVault(OrionSmartContract):
         )
 
         account = self.w3.eth.account.from_key(deployer_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
-
-        tx = self.contract.functions.updateFeeModel(
-            fee_type, performance_fee, management_fee
-        ).build_transaction({"from": account.address, "nonce": nonce})
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
 
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        return self._send_transaction(
+            account,
+            self.contract.functions.updateFeeModel(
+                fee_type, performance_fee, management_fee
+            ),
+            wait=wait,
+            simulate=simulate,
         )
 
 
 class OrionTransparentVault(OrionVault):
     """OrionTransparentVault contract."""
 
-    def __init__(self):
-        """Initialize the OrionTransparentVault contract."""
-        super().__init__("OrionTransparentVault")
+    def __init__(self, contract_address: str | None = None):
+        """Initialize the OrionTransparentVault contract, at ORION_VAULT_ADDRESS by default."""
+        super().__init__("OrionTransparentVault", contract_address)
 
     def submit_order_intent(
         self,
-        order_intent: dict[str, int],
-    ) -> TransactionResult:
+        order_intent: OrderIntent | dict[str, int],
+        wait: bool = True,
+        simulate: bool = False,
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
         """Submit a portfolio order intent.
 
         Args:
-            order_intent: Dictionary mapping token addresses to values
+            order_intent: OrderIntent, or dictionary mapping token addresses to values
+            wait: Wait for the receipt, or return a PendingTransaction after broadcast.
+            simulate: Estimate gas and eth_call the submission without sending it.
 
         Returns:
-            TransactionResult
+            TransactionResult, PendingTransaction if wait is False, or
+            SimulationReport if simulate is True
         """
         curator_private_key = os.getenv("CURATOR_PRIVATE_KEY")
         validate_var(
@@ -379,43 +692,19 @@ class OrionTransparentVault(OrionVault):
         )
 
         account = self.w3.eth.account.from_key(curator_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
 
+        # Token bytes of a parsed intent skip checksumming every address again.
+        order_intent = OrderIntent.from_mapping(order_intent)
         items = [
-            {"token": Web3.to_checksum_address(token), "value": value}
-            for token, value in order_intent.items()
+            {"token": token, "value": value}
+            for token, value in zip(order_intent.tokens, order_intent.weights)
         ]
 
-        # Estimate gas needed for the transaction
-        gas_estimate = self.contract.functions.submitIntent(items).estimate_gas(
-            {"from": account.address, "nonce": nonce}
-        )
-
-        # Add 20% buffer to gas estimate
-        gas_limit = int(gas_estimate * 1.2)
-
-        tx = self.contract.functions.submitIntent(items).build_transaction(
-            {
-                "from": account.address,
-                "nonce": nonce,
-                "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
-            }
-        )
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        return self._send_transaction(
+            account,
+            self.contract.functions.submitIntent(items),
+            wait=wait,
+            simulate=simulate,
         )
 
 
@@ -423,23 +712,28 @@ class OrionTransparentVault(OrionVault):
 class OrionEncryptedVault(OrionVault):
     """OrionEncryptedVault contract."""
 
-    def __init__(self):
-        """Initialize the OrionEncryptedVault contract."""
-        super().__init__("OrionEncryptedVault")
+    def __init__(self, contract_address: str | None = None):
+        """Initialize the OrionEncryptedVault contract, at ORION_VAULT_ADDRESS by default."""
+        super().__init__("OrionEncryptedVault", contract_address)
 
     def submit_order_intent(
         self,
-        order_intent: dict[str, bytes],
+        order_intent: OrderIntent | dict[str, bytes],
         input_proof: str,
-    ) -> TransactionResult:
+        wait: bool = True,
+        simulate: bool = False,
+    ) -> TransactionResult | PendingTransaction | SimulationReport:
         """Submit a portfolio order intent.
 
         Args:
-            order_intent: Dictionary mapping token addresses to values
+            order_intent: OrderIntent, or dictionary mapping token addresses to values
             input_proof: A Zero-Knowledge Proof ensuring the validity of the encrypted data.
+            wait: Wait for the receipt, or return a PendingTransaction after broadcast.
+            simulate: Estimate gas and eth_call the submission without sending it.
 
         Returns:
-            TransactionResult
+            TransactionResult, PendingTransaction if wait is False, or
+            SimulationReport if simulate is True
         """
         curator_private_key = os.getenv("CURATOR_PRIVATE_KEY")
         validate_var(
@@ -452,41 +746,17 @@ class OrionEncryptedVault(OrionVault):
         )
 
         account = self.w3.eth.account.from_key(curator_private_key)
-        nonce = self.w3.eth.get_transaction_count(account.address)
 
+        # Token bytes of a parsed intent skip checksumming every address again.
+        order_intent = OrderIntent.from_mapping(order_intent)
         items = [
-            {"token": Web3.to_checksum_address(token), "weight": weight}
-            for token, weight in order_intent.items()
+            {"token": token, "weight": weight}
+            for token, weight in zip(order_intent.tokens, order_intent.weights)
         ]
 
-        # Estimate gas needed for the transaction
-        gas_estimate = self.contract.functions.submitIntent(
-            items, input_proof
-        ).estimate_gas({"from": account.address, "nonce": nonce})
-
-        # Add 20% buffer to gas estimate
-        gas_limit = int(gas_estimate * 1.2)
-
-        tx = self.contract.functions.submitIntent(items, input_proof).build_transaction(
-            {
-                "from": account.address,
-                "nonce": nonce,
-                "gas": gas_limit,
-                "gasPrice": self.w3.eth.gas_price,
-            }
-        )
-
-        signed = account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        tx_hash_hex = tx_hash.hex()
-
-        receipt = self._wait_for_transaction_receipt(tx_hash_hex)
-
-        if receipt["status"] != 1:
-            raise Exception(f"Transaction failed with status: {receipt['status']}")
-
-        decoded_logs = self._decode_logs(receipt)
-
-        return TransactionResult(
-            tx_hash=tx_hash_hex, receipt=receipt, decoded_logs=decoded_logs
+        return self._send_transaction(
+            account,
+            self.contract.functions.submitIntent(items, input_proof),
+            wait=wait,
+            simulate=simulate,
         )
@@ -1,22 +1,65 @@
 """Encryption operations for the Orion Finance Python SDK."""
 
+import atexit
+import itertools
 import json
 import os
 import subprocess
-import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
 from importlib.resources import files
 
-from .utils import validate_var
+from .instrumentation import traced
+from .toolchain import MIN_NODE_MAJOR_VERSION, resolve_node
+from .utils import load_env
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+ENCRYPTION_TIMEOUT = 120  # Seconds to wait for an encryption, single or batch
 
-def encrypt_order_intent(order_intent: dict[str, int]) -> tuple[dict[str, bytes], str]:
-    """Encrypt an order intent."""
-    if not check_npm_available():
-        print_installation_guide()
-        sys.exit(1)
 
-    curator_address = os.getenv("CURATOR_ADDRESS")
-    validate_var(
+def _node_binary() -> str:
+    """Path of the resolved Node.js binary.
+
+    Raises:
+        RuntimeError: If no supported Node.js is available.
+    """
+    toolchain = resolve_node()
+    if toolchain is None:
+        raise RuntimeError(
+            f"Curation of Encrypted Vaults requires Node.js {MIN_NODE_MAJOR_VERSION} "
+            "or later, which is not available. Install it from https://nodejs.org/, "
+            "or set ORION_NODE_PATH to its binary."
+        )
+    return toolchain.path
+
+
+def _require_address(address: str | None, error_message: str) -> None:
+    """Raise ValueError with error_message if an address is missing or zero."""
+    if not address or address == ZERO_ADDRESS:
+        raise ValueError(error_message)
+
+
+def _js_entry() -> str:
+    """Path of the bundled JavaScript encryption entry point."""
+    return str(files("orion_finance_sdk.js_sdk").joinpath("bundle.js"))
+
+
+def _encryption_payload(
+    order_intent: dict[str, int],
+    vault_address: str | None = None,
+    curator_address: str | None = None,
+) -> dict:
+    """Build the encryption request for an order intent, defaulting addresses from the environment.
+
+    Raises:
+        ValueError: If the curator or vault address is missing.
+    """
+    load_env()
+    curator_address = curator_address or os.getenv("CURATOR_ADDRESS")
+    _require_address(
         curator_address,
         error_message=(
             "CURATOR_ADDRESS environment variable is missing or invalid. "
@@ -24,8 +67,8 @@ def encrypt_order_intent(order_intent: dict[str, int]) -> tuple[dict[str, bytes]
             "Follow the SDK Installation instructions to get one: https://docs.orionfinance.ai/curator/orion_sdk/install"
         ),
     )
-    vault_address = os.getenv("ORION_VAULT_ADDRESS")
-    validate_var(
+    vault_address = vault_address or os.getenv("ORION_VAULT_ADDRESS")
+    _require_address(
         vault_address,
         error_message=(
             "ORION_VAULT_ADDRESS environment variable is missing or invalid. "
@@ -34,46 +77,414 @@ def encrypt_order_intent(order_intent: dict[str, int]) -> tuple[dict[str, bytes]
         ),
     )
 
-    tokens = [token for token in order_intent.keys()]
-    values = [value for value in order_intent.values()]
-
-    payload = {
+    return {
         "vaultAddress": vault_address,
         "curatorAddress": curator_address,
-        "values": values,
+        "values": list(order_intent.values()),
     }
 
-    js_entry = files("orion_finance_sdk.js_sdk").joinpath("bundle.js")
 
-    result = subprocess.run(
-        ["node", str(js_entry)],
-        input=json.dumps(payload),
-        capture_output=True,
-        text=True,
-    )
+def _run_node(payload: dict, timeout: float = ENCRYPTION_TIMEOUT) -> dict:
+    """Run an encryption request, single or batch, in a one-shot Node process.
+
+    Raises:
+        TimeoutError: If the process does not finish within timeout seconds.
+    """
+    try:
+        result = subprocess.run(
+            [_node_binary(), _js_entry()],
+            input=json.dumps(payload),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise TimeoutError(f"Encryption timed out after {timeout} s") from e
 
     if result.returncode != 0:
         raise RuntimeError(f"Encryption failed: {result.stderr}")
 
-    data = json.loads(result.stdout)
+    return json.loads(result.stdout)
+
+
+def _encrypted_intent(order_intent, encrypted_values: list):
+    """Pair encrypted handles with the tokens of an intent, keeping its type.
+
+    An OrderIntent shares its tokens and checksum addresses with the result.
+    """
+    if hasattr(order_intent, "with_weights"):
+        return order_intent.with_weights(encrypted_values)
+    return dict(zip(order_intent.keys(), encrypted_values))
+
+
+@traced("encrypt_order_intent")
+def encrypt_order_intent(
+    order_intent: dict[str, int],
+    vault_address: str | None = None,
+    curator_address: str | None = None,
+) -> tuple[dict[str, bytes], str]:
+    """Encrypt an order intent.
 
-    encrypted_values = data["encryptedValues"]
+    The process-wide encryption worker keeps the FHE relayer warm across
+    calls; if the worker fails to start or crashes, a one-shot Node process
+    is used. Encryption is bounded by ENCRYPTION_TIMEOUT, raising TimeoutError.
 
-    encrypted_intent = dict(zip(tokens, encrypted_values))
+    Args:
+        order_intent: Dictionary mapping token addresses to integer values.
+        vault_address: Vault the intent targets, defaults to ORION_VAULT_ADDRESS.
+        curator_address: Curator submitting the intent, defaults to CURATOR_ADDRESS.
+
+    Returns:
+        Encrypted intent and its input proof.
+    """
+    payload = _encryption_payload(order_intent, vault_address, curator_address)
+
+    worker = get_encryption_worker()
+    try:
+        data = worker._wait(
+            worker.submit(
+                payload["vaultAddress"], payload["curatorAddress"], payload["values"]
+            )
+        )
+    except EncryptionWorkerError:
+        data = _run_node(payload, worker.timeout)
+
+    encrypted_intent = _encrypted_intent(order_intent, data["encryptedValues"])
 
     input_proof = data["inputProof"]
 
     return encrypted_intent, input_proof
 
 
+@dataclass
+class EncryptionResult:
+    """Outcome of encrypting the order intent of one vault within a batch."""
+
+    vault_address: str
+    encrypted_intent: dict[str, bytes] | None = None
+    input_proof: str | None = None
+    error: str | None = None
+
+
+@traced("encrypt_order_intents_batch")
+def encrypt_order_intents_batch(
+    requests: list[tuple[str, str, dict[str, int]]],
+) -> list[EncryptionResult]:
+    """Encrypt the order intents of several vaults in a single Node process.
+
+    The vaults are encrypted concurrently by the process-wide encryption
+    worker, or, if the worker fails to start or crashes, by a one-shot Node
+    process fetching the FHE keys once. A failing item is reported in its
+    result instead of aborting the batch; a batch taking longer than
+    ENCRYPTION_TIMEOUT raises TimeoutError.
+
+    Args:
+        requests: (vault address, curator address, order intent) triples.
+
+    Returns:
+        One EncryptionResult per request, in order.
+    """
+    payloads = [
+        _encryption_payload(order_intent, vault_address, curator_address)
+        for vault_address, curator_address, order_intent in requests
+    ]
+
+    worker = get_encryption_worker()
+    try:
+        items = worker._encrypt_payloads(payloads)
+    except EncryptionWorkerError:
+        items = _run_node({"batch": payloads}, worker.timeout)["results"]
+
+    return [
+        _encryption_result(vault_address, order_intent, item)
+        for (vault_address, _, order_intent), item in zip(requests, items)
+    ]
+
+
+def _encryption_result(
+    vault_address: str, order_intent: dict[str, int], data: dict
+) -> EncryptionResult:
+    """Pair encrypted handles with the intent tokens, or carry the item error."""
+    if "error" in data:
+        return EncryptionResult(vault_address=vault_address, error=data["error"])
+    return EncryptionResult(
+        vault_address=vault_address,
+        encrypted_intent=_encrypted_intent(order_intent, data["encryptedValues"]),
+        input_proof=data["inputProof"],
+    )
+
+
+class EncryptionError(RuntimeError):
+    """Encryption request rejected by the Node entry point."""
+
+    def __init__(self, reason: str):
+        """Initialize the error with the entry point's reason."""
+        super().__init__(f"Encryption failed: {reason}")
+        self.reason = reason
+
+
+class EncryptionWorkerError(RuntimeError):
+    """Failure of the encryption worker process, rather than of a request.
+
+    The worker could not start or exited. The request is then retried in a
+    one-shot Node process; a timed out request is not, as it may still run.
+    """
+
+
+class EncryptionWorker:
+    """Long-lived Node process keeping the FHE relayer instance warm.
+
+    Requests are written as newline-delimited JSON to the worker's stdin and
+    matched to responses by id, so several threads can encrypt concurrently
+    through one worker. A crashed worker is restarted on the next request.
+    """
+
+    def __init__(
+        self, js_entry: str | None = None, timeout: float = ENCRYPTION_TIMEOUT
+    ):
+        """Initialize the worker; the Node process is started on first use.
+
+        Args:
+            js_entry: JavaScript entry point, defaults to the bundled SDK.
+            timeout: Seconds to wait for an encryption, single or batch.
+        """
+        self.js_entry = js_entry
+        self.timeout = timeout
+        self._process: subprocess.Popen | None = None
+        self._pending: dict[int, Future] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._stderr: deque[str] = deque(maxlen=50)
+
+    def __enter__(self) -> "EncryptionWorker":
+        """Start the worker."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut the worker down."""
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Whether the Node process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the Node process unless it is already running."""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        if self.running:
+            return
+        command = [_node_binary(), self.js_entry or _js_entry(), "--worker"]
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            raise EncryptionWorkerError(
+                f"Could not start the encryption worker: {e}"
+            ) from e
+        # Each process gets its own table of in-flight requests, so a crashed
+        # worker only fails the requests it was actually processing.
+        self._process = process
+        self._pending = {}
+        threading.Thread(
+            target=self._read_stdout, args=(process, self._pending), daemon=True
+        ).start()
+        threading.Thread(target=self._read_stderr, args=(process,), daemon=True).start()
+
+    def _read_stdout(
+        self, process: subprocess.Popen, pending: dict[int, Future]
+    ) -> None:
+        for line in process.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            with self._lock:
+                future = pending.pop(response.get("id"), None)
+            if future is None:
+                continue
+            if "error" in response:
+                future.set_exception(EncryptionError(response["error"]))
+            else:
+                future.set_result(response["result"])
+
+        # The worker exited: fail whatever it was still processing.
+        process.wait()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            failed = list(pending.values())
+            pending.clear()
+        stderr = "".join(self._stderr)
+        for future in failed:
+            future.set_exception(
+                EncryptionWorkerError(
+                    f"Encryption worker exited with code {process.returncode}: {stderr}"
+                )
+            )
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            self._stderr.append(line)
+
+    def submit(self, vault_address: str, curator_address: str, values: list) -> Future:
+        """Queue the encryption of values for a vault/curator pair.
+
+        Returns:
+            Future resolving to the worker's encryptedValues and inputProof.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._start_locked()
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            request = {
+                "id": request_id,
+                "params": {
+                    "vaultAddress": vault_address,
+                    "curatorAddress": curator_address,
+                    "values": values,
+                },
+            }
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._pending.pop(request_id, None)
+                future.set_exception(
+                    EncryptionWorkerError(f"Encryption worker died: {e}")
+                )
+        return future
+
+    @traced("encrypt_order_intent")
+    def encrypt_order_intent(
+        self,
+        order_intent: dict[str, int],
+        vault_address: str | None = None,
+        curator_address: str | None = None,
+    ) -> tuple[dict[str, bytes], str]:
+        """Encrypt an order intent through the warm worker.
+
+        Args:
+            order_intent: Dictionary mapping token addresses to integer values.
+            vault_address: Vault the intent targets, defaults to ORION_VAULT_ADDRESS.
+            curator_address: Curator submitting the intent, defaults to CURATOR_ADDRESS.
+
+        Returns:
+            Encrypted intent and its input proof.
+        """
+        payload = _encryption_payload(order_intent, vault_address, curator_address)
+        data = self._wait(
+            self.submit(
+                payload["vaultAddress"], payload["curatorAddress"], payload["values"]
+            )
+        )
+
+        encrypted_intent = _encrypted_intent(order_intent, data["encryptedValues"])
+        return encrypted_intent, data["inputProof"]
+
+    @traced("encrypt_order_intents_batch")
+    def encrypt_order_intents_batch(
+        self, requests: list[tuple[str, str, dict[str, int]]]
+    ) -> list[EncryptionResult]:
+        """Encrypt the order intents of several vaults concurrently through the worker.
+
+        Args:
+            requests: (vault address, curator address, order intent) triples.
+
+        Returns:
+            One EncryptionResult per request, in order.
+
+        Raises:
+            EncryptionWorkerError: If the worker process fails.
+        """
+        payloads = [
+            _encryption_payload(order_intent, vault_address, curator_address)
+            for vault_address, curator_address, order_intent in requests
+        ]
+        return [
+            _encryption_result(vault_address, order_intent, item)
+            for (vault_address, _, order_intent), item in zip(
+                requests, self._encrypt_payloads(payloads)
+            )
+        ]
+
+    def _encrypt_payloads(self, payloads: list[dict]) -> list[dict]:
+        """Encrypt requests concurrently, in the entry point's batch result format.
+
+        A rejected request is reported as an error item; a failure of the
+        worker itself raises.
+        """
+        deadline = time.monotonic() + self.timeout
+        futures = [
+            self.submit(
+                payload["vaultAddress"], payload["curatorAddress"], payload["values"]
+            )
+            for payload in payloads
+        ]
+        items = []
+        for future in futures:
+            try:
+                items.append(self._wait(future, deadline - time.monotonic()))
+            except EncryptionError as e:
+                items.append({"error": e.reason})
+        return items
+
+    def _wait(self, future: Future, timeout: float | None = None) -> dict:
+        """Wait for a request's result, up to timeout or the worker's timeout."""
+        timeout = self.timeout if timeout is None else max(timeout, 0)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError as e:
+            raise TimeoutError(f"Encryption timed out after {self.timeout} s") from e
+
+    def close(self, timeout: float = 5) -> None:
+        """Let the worker finish in-flight requests, then stop it."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+
+_worker: EncryptionWorker | None = None
+_worker_lock = threading.Lock()
+
+
+def get_encryption_worker() -> EncryptionWorker:
+    """Return the process-wide encryption worker, shut down at interpreter exit."""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = EncryptionWorker()
+                atexit.register(_worker.close)
+    return _worker
+
+
 def print_installation_guide():
-    """Print installation guide for npm."""
+    """Print installation guide for Node.js."""
     print("=" * 80)
-    print("ERROR: Curation of Encrypted Vaults requires npm to be installed.")
+    print("ERROR: Curation of Encrypted Vaults requires Node.js to be installed.")
     print("=" * 80)
     print()
-    print("npm is not available on your system.")
-    print("Please install Node.js and npm first:")
+    print(f"Node.js {MIN_NODE_MAJOR_VERSION} or later is not available on your system.")
+    print("Please install Node.js first:")
     print()
     print("  Visit: https://nodejs.org/")
     print("  OR use a package manager:")
@@ -81,18 +492,13 @@ def print_installation_guide():
     print("    Ubuntu/Debian: sudo apt install nodejs npm")
     print("    Windows: Download from https://nodejs.org/")
     print()
+    print(
+        "If Node.js is installed outside your PATH, set ORION_NODE_PATH to its binary."
+    )
+    print()
     print("=" * 80)
 
 
-def check_npm_available() -> bool:
-    """Check if npm is available on the system."""
-    try:
-        result = subprocess.run(
-            ["npm", "--version"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+def check_node_available() -> bool:
+    """Check if a supported Node.js binary is available on the system."""
+    return resolve_node() is not None
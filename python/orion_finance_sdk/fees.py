@@ -0,0 +1,228 @@
+"""Transaction fee estimation for the Orion Finance Python SDK."""
+
+import asyncio
+import os
+import statistics
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+
+from web3 import AsyncWeb3, Web3
+
+from .types import FeeStrategy
+
+DEFAULT_FEE_STRATEGY = FeeStrategy.NORMAL
+DEFAULT_FEE_MAX_AGE = 12.0  # Seconds a fee sample is reused, one Ethereum slot
+FEE_HISTORY_BLOCKS = 10  # Blocks sampled per eth_feeHistory request
+FEE_HISTORY_PERCENTILES = (10, 50, 90)
+
+# Priority fee percentile and headroom over the next base fee, per strategy.
+# The base fee rises by at most 12.5% per block, so 2x covers about six full
+# blocks; only the actual base fee plus the tip is paid.
+FEE_STRATEGIES = {
+    FeeStrategy.CHEAP: (10, 1.25),
+    FeeStrategy.NORMAL: (50, 2),
+    FeeStrategy.FAST: (90, 3),
+}
+
+
+@dataclass(frozen=True)
+class FeeSample:
+    """Fee market snapshot of a chain.
+
+    Attributes:
+        block_number: Newest block sampled, None on legacy chains.
+        base_fee: Base fee of the next block, None on legacy chains.
+        priority_fees: Median tip paid at each FEE_HISTORY_PERCENTILES entry.
+        gas_price: Legacy gas price, only sampled on chains without EIP-1559.
+        sampled_at: time.monotonic() of the sample.
+    """
+
+    block_number: int | None
+    base_fee: int | None
+    priority_fees: tuple[int, ...]
+    gas_price: int | None
+    sampled_at: float
+
+    def transaction_fees(self, strategy: FeeStrategy) -> dict[str, int]:
+        """Fee fields of a transaction priced with a strategy."""
+        if self.base_fee is None:
+            return {"gasPrice": self.gas_price}
+        percentile, headroom = FEE_STRATEGIES[FeeStrategy(strategy)]
+        priority_fee = self.priority_fees[FEE_HISTORY_PERCENTILES.index(percentile)]
+        return {
+            "maxFeePerGas": int(self.base_fee * headroom) + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+
+def _priority_fees(history) -> tuple[int, ...] | None:
+    """Median of each reward percentile over the non-empty sampled blocks."""
+    rewards = [
+        reward
+        for reward, ratio in zip(history.get("reward") or [], history["gasUsedRatio"])
+        if ratio > 0 and reward
+    ]
+    if not rewards:
+        return None
+    return tuple(
+        int(statistics.median(reward[i] for reward in rewards))
+        for i in range(len(FEE_HISTORY_PERCENTILES))
+    )
+
+
+def _default_strategy() -> FeeStrategy:
+    return FeeStrategy(os.getenv("ORION_FEE_STRATEGY", DEFAULT_FEE_STRATEGY.value))
+
+
+class FeeOracle:
+    """Cached fee estimates of one connection.
+
+    A single eth_feeHistory request samples the base fee of the next block and
+    the tips paid over the last FEE_HISTORY_BLOCKS blocks; the sample is reused
+    by every transaction built within max_age seconds, about one block. Chains
+    without EIP-1559 fall back to a cached legacy gas price; chains reporting no
+    base fee are remembered so that eth_feeHistory is not requested again.
+    """
+
+    def __init__(self, w3: Web3, max_age: float = DEFAULT_FEE_MAX_AGE):
+        """Initialize the fee oracle for a connection."""
+        self.w3 = w3
+        self.max_age = max_age
+        self.supports_eip1559: bool | None = None
+        self._sample: FeeSample | None = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._sample is not None
+            and time.monotonic() - self._sample.sampled_at < self.max_age
+        )
+
+    def _eip1559_sample(self, history, max_priority_fee) -> FeeSample | None:
+        base_fees = history.get("baseFeePerGas") or []
+        if not base_fees or not base_fees[-1]:
+            return None
+        priority_fees = _priority_fees(history)
+        if priority_fees is None:
+            priority_fees = (max_priority_fee(),) * len(FEE_HISTORY_PERCENTILES)
+        return FeeSample(
+            block_number=history["oldestBlock"] + len(base_fees) - 2,
+            base_fee=base_fees[-1],
+            priority_fees=priority_fees,
+            gas_price=None,
+            sampled_at=time.monotonic(),
+        )
+
+    def _legacy_sample(self, gas_price: int) -> FeeSample:
+        return FeeSample(
+            block_number=None,
+            base_fee=None,
+            priority_fees=(),
+            gas_price=gas_price,
+            sampled_at=time.monotonic(),
+        )
+
+    def sample(self) -> FeeSample:
+        """Return the current fee sample, fetching a new one once it is stale."""
+        with self._lock:
+            if self._is_fresh():
+                return self._sample
+            sample = None
+            if self.supports_eip1559 is not False:
+                try:
+                    history = self.w3.eth.fee_history(
+                        FEE_HISTORY_BLOCKS, "latest", list(FEE_HISTORY_PERCENTILES)
+                    )
+                except Exception:
+                    # Not served by this node: price this sample legacy.
+                    history = None
+                if history is not None:
+                    sample = self._eip1559_sample(
+                        history, lambda: self.w3.eth.max_priority_fee
+                    )
+                    self.supports_eip1559 = sample is not None
+            if sample is None:
+                sample = self._legacy_sample(self.w3.eth.gas_price)
+            self._sample = sample
+            return sample
+
+    def transaction_fees(self, strategy: FeeStrategy | None = None) -> dict[str, int]:
+        """Fee fields for build_transaction.
+
+        Args:
+            strategy: Fee strategy, defaults to ORION_FEE_STRATEGY or normal.
+
+        Returns:
+            maxFeePerGas and maxPriorityFeePerGas, or gasPrice on legacy chains.
+        """
+        return self.sample().transaction_fees(strategy or _default_strategy())
+
+
+class AsyncFeeOracle(FeeOracle):
+    """Cached fee estimates of one connection, for use from an event loop.
+
+    Same sampling rules as FeeOracle, but the chain is queried without
+    blocking the loop and coroutines wait on an asyncio lock.
+    """
+
+    def __init__(self, w3: AsyncWeb3, max_age: float = DEFAULT_FEE_MAX_AGE):
+        """Initialize the fee oracle for a connection."""
+        super().__init__(w3, max_age)
+        self._async_lock = asyncio.Lock()
+
+    async def sample(self) -> FeeSample:
+        """Return the current fee sample, fetching a new one once it is stale."""
+        async with self._async_lock:
+            if self._is_fresh():
+                return self._sample
+            sample = None
+            if self.supports_eip1559 is not False:
+                try:
+                    history = await self.w3.eth.fee_history(
+                        FEE_HISTORY_BLOCKS, "latest", list(FEE_HISTORY_PERCENTILES)
+                    )
+                except Exception:
+                    # Not served by this node: price this sample legacy.
+                    history = None
+                if history is not None:
+                    max_priority_fee = None
+                    if _priority_fees(history) is None:
+                        max_priority_fee = await self.w3.eth.max_priority_fee
+                    sample = self._eip1559_sample(history, lambda: max_priority_fee)
+                    self.supports_eip1559 = sample is not None
+            if sample is None:
+                sample = self._legacy_sample(await self.w3.eth.gas_price)
+            self._sample = sample
+            return sample
+
+    async def transaction_fees(
+        self, strategy: FeeStrategy | None = None
+    ) -> dict[str, int]:
+        """Fee fields for build_transaction.
+
+        Args:
+            strategy: Fee strategy, defaults to ORION_FEE_STRATEGY or normal.
+
+        Returns:
+            maxFeePerGas and maxPriorityFeePerGas, or gasPrice on legacy chains.
+        """
+        sample = await self.sample()
+        return sample.transaction_fees(strategy or _default_strategy())
+
+
+_oracles: "weakref.WeakKeyDictionary[Web3, FeeOracle]" = weakref.WeakKeyDictionary()
+_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(w3: Web3 | AsyncWeb3) -> FeeOracle:
+    """Return the process-wide fee oracle of a connection.
+
+    An AsyncFeeOracle is returned for AsyncWeb3 connections.
+    """
+    with _oracles_lock:
+        if w3 not in _oracles:
+            oracle_class = AsyncFeeOracle if isinstance(w3, AsyncWeb3) else FeeOracle
+            _oracles[w3] = oracle_class(w3)
+        return _oracles[w3]
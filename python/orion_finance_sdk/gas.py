@@ -0,0 +1,135 @@
+"""Gas estimate cache for the Orion Finance Python SDK."""
+
+import hashlib
+import json
+import math
+import os
+import threading
+import weakref
+
+from web3 import AsyncWeb3, Web3
+
+from .utils import get_cache_dir
+
+GAS_SAMPLES = 5  # Most recent gasUsed values kept per call shape
+GAS_MIN_SAMPLES = 2  # Receipts needed before estimate_gas is skipped
+GAS_MAX_SPREAD = 0.1  # Largest relative spread of the samples to trust them
+
+# gasUsed is net of the storage refund, which is capped at a fifth of the gas
+# used, so a call may need up to 1.25x its gasUsed while executing.
+GAS_REFUND_HEADROOM = 1.25
+
+
+def gas_key(contract_name: str, function) -> str:
+    """Shape of a contract call whose gas cost is expected to be stable.
+
+    The contract name tells encrypted and transparent vaults apart, and the
+    length of the first list argument counts the items of an order intent.
+    """
+    item_count = next(
+        (len(arg) for arg in function.args if isinstance(arg, (list, tuple))), 0
+    )
+    return f"{contract_name}:{function.address}:{function.fn_name}:{item_count}"
+
+
+class GasEstimateCache:
+    """Gas limits learned from the receipts of previous calls.
+
+    Calls are grouped by gas_key. Once a shape has GAS_MIN_SAMPLES receipts
+    within GAS_MAX_SPREAD of each other, its estimate is served from the
+    cache instead of an eth_estimateGas simulation. A failed transaction
+    forgets its shape, so the next call is estimated by the node again.
+    """
+
+    def __init__(self, key: str, path: os.PathLike | None = None):
+        """Initialize the cache.
+
+        Args:
+            key: Identifies the network in the cache file.
+            path: JSON file to persist samples to, or None to keep them in memory.
+        """
+        self.key = key
+        self.path = path
+        self._samples: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self._samples.update(self._read_file().get(key, {}))
+
+    def get(self, shape: str) -> int | None:
+        """Return the gas limit of a call shape, or None if not trusted yet.
+
+        The limit includes the refund headroom, so it is used as is.
+        """
+        with self._lock:
+            samples = list(self._samples.get(shape, ()))
+        if len(samples) < GAS_MIN_SAMPLES:
+            return None
+        highest = max(samples)
+        if highest - min(samples) > GAS_MAX_SPREAD * highest:
+            return None
+        return math.ceil(highest * GAS_REFUND_HEADROOM)
+
+    def record(self, shape: str, receipt) -> None:
+        """Learn from a mined transaction, or forget its shape if it failed."""
+        with self._lock:
+            if receipt["status"] != 1:
+                self._samples.pop(shape, None)
+            else:
+                samples = self._samples.setdefault(shape, [])
+                samples.append(receipt["gasUsed"])
+                del samples[:-GAS_SAMPLES]
+        self._save()
+
+    def forget(self, shape: str) -> None:
+        """Drop the samples of a call shape."""
+        with self._lock:
+            self._samples.pop(shape, None)
+        self._save()
+
+    def _read_file(self) -> dict:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        """Write the samples to disk; failures only cost future estimates."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = self._read_file()
+            data[self.key] = {shape: list(s) for shape, s in self._samples.items()}
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+
+_caches: "weakref.WeakKeyDictionary[Web3, GasEstimateCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_caches_lock = threading.Lock()
+
+
+def get_gas_cache(w3: Web3 | AsyncWeb3) -> GasEstimateCache:
+    """Return the process-wide gas estimate cache of a connection.
+
+    Setting ORION_GAS_CACHE_PERSIST=1 persists it under the SDK cache
+    directory, keyed by a hash of the RPC endpoint.
+    """
+    with _caches_lock:
+        if w3 not in _caches:
+            endpoint = str(getattr(w3.provider, "endpoint_uri", ""))
+            # Hashed, since RPC URLs often embed API keys.
+            key = hashlib.sha256(endpoint.encode()).hexdigest()[:16]
+            path = None
+            if os.getenv("ORION_GAS_CACHE_PERSIST", "").lower() in ("1", "true"):
+                path = get_cache_dir() / "gas_estimates.json"
+            _caches[w3] = GasEstimateCache(key, path=path)
+        return _caches[w3]
@@ -0,0 +1,323 @@
+"""Incremental index of Orion vaults built from on-chain events."""
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+
+from hexbytes import HexBytes
+from web3 import Web3
+
+from .connection import get_chain_id
+from .contracts import (
+    OrionConfig,
+    VaultFactory,
+    decode_log,
+    get_contract,
+    get_event_index,
+)
+from .types import VaultType
+from .utils import get_cache_dir
+
+DEFAULT_CHUNK_SIZE = 2000  # Blocks per eth_getLogs request
+DEFAULT_ADDRESS_CHUNK_SIZE = 500  # Contract addresses per eth_getLogs request
+DEFAULT_CONFIRMATIONS = 5  # Blocks behind the head, to stay clear of reorgs
+
+VAULT_CREATED_EVENT = "OrionVaultCreated"
+CURATOR_UPDATED_EVENT = "CuratorUpdated"
+FEE_MODEL_UPDATED_EVENT = "FeeModelUpdated"
+
+VAULT_CONTRACT_NAMES = {
+    VaultType.TRANSPARENT: "OrionTransparentVault",
+    VaultType.ENCRYPTED: "OrionEncryptedVault",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vaults (
+    deployment TEXT NOT NULL,
+    address TEXT NOT NULL,
+    vault_type TEXT NOT NULL,
+    curator TEXT,
+    fee_type INTEGER,
+    performance_fee INTEGER,
+    management_fee INTEGER,
+    created_block INTEGER NOT NULL,
+    updated_block INTEGER NOT NULL,
+    created_args TEXT,
+    PRIMARY KEY (deployment, address)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    key TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class IndexedVault:
+    """Vault as recorded in the local index."""
+
+    address: str
+    vault_type: VaultType
+    curator: str | None
+    fee_type: int | None
+    performance_fee: int | None
+    management_fee: int | None
+    created_block: int
+    updated_block: int
+
+
+def _arg(args: dict, *names: str):
+    """First present argument among alternative names."""
+    for name in names:
+        if name in args:
+            return args[name]
+    return None
+
+
+class VaultIndexer:
+    """Index vaults, their curators and fee models into a local SQLite database.
+
+    OrionVaultCreated events of both vault factories, and curator and fee
+    model updates of the indexed vaults, are fetched with eth_getLogs over
+    fixed block ranges, the vault addresses split into fixed-size groups so
+    requests stay within provider limits as vaults are added. Each range is
+    committed together with the checkpoint, so an interrupted sync resumes
+    from the last indexed block and later syncs only fetch new blocks.
+
+    Vaults and checkpoints are recorded per deployment, the chain id and
+    factory addresses, so one database can index several chains.
+    """
+
+    def __init__(
+        self,
+        db_path: os.PathLike | None = None,
+        start_block: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        address_chunk_size: int = DEFAULT_ADDRESS_CHUNK_SIZE,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            db_path: SQLite database file, defaults to vault_index.sqlite in the cache directory.
+            start_block: First block to scan on an empty index, e.g. the factories' deployment.
+            chunk_size: Maximum number of blocks per eth_getLogs request.
+            confirmations: Blocks behind the chain head left unindexed.
+            address_chunk_size: Maximum number of addresses per eth_getLogs request.
+        """
+        self.factories = {
+            vault_type: VaultFactory(vault_type.value) for vault_type in VaultType
+        }
+        self.w3 = self.factories[VaultType.TRANSPARENT].w3
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.confirmations = confirmations
+        self.address_chunk_size = address_chunk_size
+
+        if db_path is None:
+            db_path = get_cache_dir() / "vault_index.sqlite"
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(_SCHEMA)
+        self._deployment = f"{get_chain_id(self.w3)}:" + ",".join(
+            factory.contract_address for factory in self.factories.values()
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        self.db.close()
+
+    def __enter__(self):
+        """Use the indexer as a context manager closing the database."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the database."""
+        self.close()
+
+    @property
+    def last_block(self) -> int | None:
+        """Last indexed block, or None if nothing was indexed yet."""
+        row = self.db.execute(
+            "SELECT block_number FROM checkpoints WHERE key = ?",
+            (self._deployment,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, to_block: int | None = None) -> int:
+        """Index new blocks, up to to_block or the confirmed chain head.
+
+        Returns:
+            Number of events indexed.
+        """
+        if to_block is None:
+            to_block = self.w3.eth.block_number - self.confirmations
+        last_block = self.last_block
+        from_block = self.start_block if last_block is None else last_block + 1
+
+        indexed = 0
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            with self.db:
+                indexed += self._index_range(from_block, chunk_end)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+                    (self._deployment, chunk_end),
+                )
+            from_block = chunk_end + 1
+
+        # Vault types are immutable, so the config's resolver can reuse them.
+        OrionConfig().cache.vault_types.update(
+            (vault.address, vault.vault_type) for vault in self.vaults()
+        )
+        return indexed
+
+    def _topics(self, contract, event_names: tuple[str, ...]) -> list[str]:
+        return [
+            HexBytes(topic).to_0x_hex()
+            for topic, event in get_event_index(contract).items()
+            if event.event_name in event_names
+        ]
+
+    def _get_logs(self, addresses: list[str], topics: list[str], from_block, to_block):
+        if not topics:
+            return []
+        logs = []
+        for i in range(0, len(addresses), self.address_chunk_size):
+            logs.extend(
+                self.w3.eth.get_logs(
+                    {
+                        "address": addresses[i : i + self.address_chunk_size],
+                        "topics": [topics],
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                    }
+                )
+            )
+        # Each address is in one group, so its own logs stay in chain order.
+        return logs
+
+    def _vault_contract(self, address: str, vault_type: VaultType):
+        return get_contract(self.w3, VAULT_CONTRACT_NAMES[vault_type], address)
+
+    def _index_range(self, from_block: int, to_block: int) -> int:
+        """Index the events of one block range, inside the caller's transaction."""
+        indexed = 0
+
+        # Vaults created in this range come first, so their updates in the same
+        # range are picked up below.
+        factories_by_address = {
+            factory.contract_address.lower(): (vault_type, factory)
+            for vault_type, factory in self.factories.items()
+        }
+        topics = sorted(
+            {
+                topic
+                for factory in self.factories.values()
+                for topic in self._topics(factory.contract, (VAULT_CREATED_EVENT,))
+            }
+        )
+        for log in self._get_logs(
+            [factory.contract_address for factory in self.factories.values()],
+            topics,
+            from_block,
+            to_block,
+        ):
+            vault_type, factory = factories_by_address[log["address"].lower()]
+            decoded = decode_log(factory.contract, log)
+            if decoded is None or decoded["event"] != VAULT_CREATED_EVENT:
+                continue
+            args = decoded["args"]
+            self.db.execute(
+                "INSERT OR IGNORE INTO vaults VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._deployment,
+                    Web3.to_checksum_address(args["vault"]),
+                    vault_type.value,
+                    _arg(args, "curator"),
+                    _arg(args, "feeType"),
+                    _arg(args, "performanceFee"),
+                    _arg(args, "managementFee"),
+                    decoded["blockNumber"],
+                    decoded["blockNumber"],
+                    json.dumps(args, default=str),
+                ),
+            )
+            indexed += 1
+
+        vaults = dict(
+            self.db.execute(
+                "SELECT address, vault_type FROM vaults WHERE deployment = ?",
+                (self._deployment,),
+            )
+        )
+        # Event topics depend only on the ABI, so one contract per type is enough.
+        sample_vaults = {VaultType(value): address for address, value in vaults.items()}
+        topics = sorted(
+            {
+                topic
+                for vault_type, address in sample_vaults.items()
+                for topic in self._topics(
+                    self._vault_contract(address, vault_type),
+                    (CURATOR_UPDATED_EVENT, FEE_MODEL_UPDATED_EVENT),
+                )
+            }
+        )
+        for log in self._get_logs(list(vaults), topics, from_block, to_block):
+            address = Web3.to_checksum_address(log["address"])
+            decoded = decode_log(
+                self._vault_contract(address, VaultType(vaults[address])), log
+            )
+            if decoded is None:
+                continue
+            args = decoded["args"]
+            if decoded["event"] == CURATOR_UPDATED_EVENT:
+                self.db.execute(
+                    "UPDATE vaults SET curator = ?, updated_block = ? "
+                    "WHERE deployment = ? AND address = ?",
+                    (
+                        _arg(args, "newCurator", "curator"),
+                        decoded["blockNumber"],
+                        self._deployment,
+                        address,
+                    ),
+                )
+            elif decoded["event"] == FEE_MODEL_UPDATED_EVENT:
+                self.db.execute(
+                    "UPDATE vaults SET fee_type = ?, performance_fee = ?, "
+                    "management_fee = ?, updated_block = ? "
+                    "WHERE deployment = ? AND address = ?",
+                    (
+                        _arg(args, "feeType", "mode"),
+                        _arg(args, "performanceFee"),
+                        _arg(args, "managementFee"),
+                        decoded["blockNumber"],
+                        self._deployment,
+                        address,
+                    ),
+                )
+            else:
+                continue
+            indexed += 1
+        return indexed
+
+    def _select(self, where: str = "", params: tuple = ()) -> list[IndexedVault]:
+        rows = self.db.execute(
+            "SELECT address, vault_type, curator, fee_type, performance_fee, "
+            "management_fee, created_block, updated_block FROM vaults "
+            f"WHERE deployment = ? {where} ORDER BY created_block, address",
+            (self._deployment, *params),
+        ).fetchall()
+        return [IndexedVault(row[0], VaultType(row[1]), *row[2:]) for row in rows]
+
+    def vaults(self, vault_type: VaultType | None = None) -> list[IndexedVault]:
+        """Indexed vaults, optionally of a single type, in creation order."""
+        if vault_type is None:
+            return self._select()
+        return self._select("AND vault_type = ?", (VaultType(vault_type).value,))
+
+    def vault(self, address: str) -> IndexedVault | None:
+        """Indexed vault at an address, or None if it is not indexed."""
+        vaults = self._select("AND address = ?", (Web3.to_checksum_address(address),))
+        return vaults[0] if vaults else None
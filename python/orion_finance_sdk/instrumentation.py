@@ -0,0 +1,254 @@
+"""Pluggable spans, timers and RPC metrics for the Orion Finance Python SDK.
+
+The SDK reports what it spends time on through the current Instrumentation:
+named spans around its stages (validation, encryption, gas estimation,
+signing, broadcast, receipts) and the latency of every JSON-RPC request. The
+default does nothing; OpenTelemetryInstrumentation forwards to the
+OpenTelemetry API, and Profiler aggregates a per-stage breakdown, as printed
+by ``orion --profile``.
+"""
+
+import bisect
+import contextlib
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from collections.abc import Iterator
+
+# Upper bounds of the RPC latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Instrumentation:
+    """No-op instrumentation, the default."""
+
+    def span(self, name: str, attributes: dict | None = None):
+        """Return a context manager timing a stage named name."""
+        return contextlib.nullcontext()
+
+    def record_rpc(self, method: str, seconds: float, error: bool = False) -> None:
+        """Record a JSON-RPC request and its latency."""
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Spans and RPC metrics reported through the OpenTelemetry API.
+
+    The exporters are the application's: configure an OpenTelemetry SDK
+    TracerProvider and MeterProvider, or these calls stay no-ops.
+    """
+
+    def __init__(self, tracer=None, meter=None):
+        """Initialize the instrumentation.
+
+        Args:
+            tracer: OpenTelemetry Tracer, defaults to the global provider's.
+            meter: OpenTelemetry Meter, defaults to the global provider's.
+        """
+        if tracer is None or meter is None:
+            try:
+                from opentelemetry import metrics, trace
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetry instrumentation requires opentelemetry-api: "
+                    "pip install 'orion-finance-sdk[otel]'"
+                ) from e
+
+            tracer = tracer or trace.get_tracer("orion_finance_sdk")
+            meter = meter or metrics.get_meter("orion_finance_sdk")
+        self.tracer = tracer
+        self._rpc_requests = meter.create_counter(
+            "rpc.client.requests", unit="{request}", description="JSON-RPC requests"
+        )
+        self._rpc_duration = meter.create_histogram(
+            "rpc.client.duration", unit="ms", description="JSON-RPC request latency"
+        )
+
+    def span(self, name: str, attributes: dict | None = None):
+        """Start an OpenTelemetry span, current for its duration."""
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    def record_rpc(self, method: str, seconds: float, error: bool = False) -> None:
+        """Count the request and record its latency, by method."""
+        attributes = {"rpc.method": method, "error": error}
+        self._rpc_requests.add(1, attributes)
+        self._rpc_duration.record(seconds * 1e3, attributes)
+
+
+class LatencyHistogram:
+    """Latencies of one JSON-RPC method, bucketed by LATENCY_BUCKETS_MS."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float, error: bool = False) -> None:
+        """Add a latency sample."""
+        milliseconds = seconds * 1e3
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound, in seconds, of the bucket holding the q-quantile."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound / 1e3, self.max)
+        return self.max
+
+
+class Profiler(Instrumentation):
+    """Instrumentation aggregating time per stage and RPC latency per method.
+
+    Spans nest: a stage opened inside another is reported under it. Stages run
+    concurrently, e.g. one per vault, add up, so a parent may show less time
+    than its children. Spans and RPC records are also forwarded to an inner
+    instrumentation, so profiling does not turn off tracing.
+    """
+
+    def __init__(self, inner: Instrumentation | None = None):
+        """Initialize the profiler.
+
+        Args:
+            inner: Instrumentation to forward to, e.g. the one configured before.
+        """
+        self.inner = inner or Instrumentation()
+        self.stages: dict[tuple[str, ...], list] = {}  # path: [calls, seconds]
+        self.rpc: dict[str, LatencyHistogram] = {}
+        self._path: contextvars.ContextVar[tuple[str, ...]] = contextvars.ContextVar(
+            "orion_profile_path", default=()
+        )
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, attributes: dict | None = None) -> Iterator[None]:
+        """Time a stage, nested under the stage currently open."""
+        path = self._path.get() + (name,)
+        token = self._path.set(path)
+        with self._lock:
+            # Registered on entry, so stages are listed in the order they start.
+            self.stages.setdefault(path, [0, 0.0])
+        start = time.perf_counter()
+        try:
+            with self.inner.span(name, attributes):
+                yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._path.reset(token)
+            with self._lock:
+                self.stages[path][0] += 1
+                self.stages[path][1] += seconds
+
+    def record_rpc(self, method: str, seconds: float, error: bool = False) -> None:
+        """Add the request to its method's histogram."""
+        with self._lock:
+            self.rpc.setdefault(method, LatencyHistogram()).record(seconds, error)
+        self.inner.record_rpc(method, seconds, error)
+
+    def format(self) -> str:
+        """Format the stage breakdown and the RPC latencies."""
+        with self._lock:
+            started = {path: i for i, path in enumerate(self.stages)}
+            # Each stage under its parent, siblings in the order they started.
+            stages = sorted(
+                self.stages.items(),
+                key=lambda item: [
+                    started[item[0][:i]] for i in range(1, len(item[0]) + 1)
+                ],
+            )
+            rpc = sorted(self.rpc.items())
+
+        lines = ["Stages:"]
+        labels = ["  " * len(path) + path[-1] for path, _ in stages]
+        width = max(map(len, labels), default=0)
+        for label, (_, (calls, seconds)) in zip(labels, stages):
+            lines.append(f"{label.ljust(width)}  {calls:5d}x  {seconds * 1e3:10.1f} ms")
+
+        lines.append("RPC latency:")
+        width = max((len(method) for method, _ in rpc), default=0)
+        for method, histogram in rpc:
+            lines.append(
+                f"  {method.ljust(width)}  {histogram.count:5d}x"
+                f"  mean {histogram.total / histogram.count * 1e3:7.1f} ms"
+                f"  p50 {histogram.quantile(0.5) * 1e3:7.1f} ms"
+                f"  p95 {histogram.quantile(0.95) * 1e3:7.1f} ms"
+                f"  max {histogram.max * 1e3:7.1f} ms"
+                + (f"  {histogram.errors} failed" if histogram.errors else "")
+            )
+        return "\n".join(lines)
+
+
+_instrumentation: Instrumentation | None = None
+_instrumentation_lock = threading.Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the process-wide instrumentation.
+
+    Unless set_instrumentation was called, ORION_INSTRUMENTATION=opentelemetry
+    selects OpenTelemetryInstrumentation, and the no-op default is used
+    otherwise.
+    """
+    global _instrumentation
+    if _instrumentation is None:
+        with _instrumentation_lock:
+            if _instrumentation is None:
+                if os.getenv("ORION_INSTRUMENTATION", "").lower() == "opentelemetry":
+                    _instrumentation = OpenTelemetryInstrumentation()
+                else:
+                    _instrumentation = Instrumentation()
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation | None) -> None:
+    """Install the process-wide instrumentation, or None to restore the default."""
+    global _instrumentation
+    with _instrumentation_lock:
+        _instrumentation = instrumentation
+
+
+def span(name: str, **attributes):
+    """Time a stage with the current instrumentation.
+
+    Usable as a context manager, e.g. ``with span("validate_order", tokens=3):``.
+    """
+    return get_instrumentation().span(name, attributes or None)
+
+
+def record_rpc(method: str, seconds: float, error: bool = False) -> None:
+    """Record a JSON-RPC request with the current instrumentation."""
+    get_instrumentation().record_rpc(method, seconds, error)
+
+
+def traced(name: str):
+    """Decorate a function, sync or async, to run each call in a span."""
+
+    def decorator(function):
+        if inspect.iscoroutinefunction(function):
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,253 @@
+"""Order intents and their loading for the Orion Finance Python SDK."""
+
+import csv
+import functools
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping
+
+from eth_utils import to_checksum_address
+
+from .instrumentation import traced
+
+# Accepted column names of tabular intents, the first matching one is used.
+TOKEN_COLUMNS = ("token", "address", "asset")
+WEIGHT_COLUMNS = ("weight", "value", "amount")
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+
+def address_bytes(address: str | bytes) -> bytes:
+    """Parse a hex token address, in any letter case, into its 20 bytes."""
+    if isinstance(address, bytes) and len(address) == 20:
+        return address
+    if isinstance(address, str) and len(address) == 42 and address[:2] in ("0x", "0X"):
+        try:
+            return bytes.fromhex(address[2:])
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid token address {address!r}")
+
+
+@functools.lru_cache(maxsize=65536)
+def checksum_address(address: bytes) -> str:
+    """Return the checksum address of 20 address bytes, memoized.
+
+    Checksumming costs a keccak hash, and the same tokens recur in every
+    intent of a process.
+    """
+    return to_checksum_address(address)
+
+
+class OrderIntent(Mapping):
+    """Order intent as parallel arrays of token address bytes and weights.
+
+    Built once from the input, then shared through validation, encryption and
+    submission: each stage swaps in new weights with with_weights while the
+    tokens, and their checksum addresses, are reused as they are. It is a
+    read-only mapping of checksum addresses to weights, so it can be used
+    where a dict was expected; to_dict returns a plain dict, e.g. for JSON.
+    """
+
+    __slots__ = ("_addresses", "_index", "tokens", "weights")
+
+    def __init__(self, tokens: list[bytes], weights: list):
+        """Initialize the intent from already parsed, distinct tokens.
+
+        Args:
+            tokens: 20-byte token addresses.
+            weights: Weight of each token, in the same order.
+        """
+        if len(tokens) != len(weights):
+            raise ValueError("Tokens and weights must have the same length")
+        self.tokens = tokens
+        self.weights = weights
+        self._addresses: list[str] | None = None
+        self._index: dict[bytes, int] | None = None
+
+    @classmethod
+    def from_columns(
+        cls, addresses: Iterable[str | bytes], weights: Iterable
+    ) -> "OrderIntent":
+        """Build an intent from token addresses in any letter case.
+
+        Raises:
+            ValueError: If an address is malformed or appears more than once.
+        """
+        tokens = [address_bytes(address) for address in addresses]
+        if len(set(tokens)) != len(tokens):
+            seen: set[bytes] = set()
+            for token in tokens:
+                if token in seen:
+                    raise ValueError(
+                        f"Token {checksum_address(token)} appears more than once"
+                    )
+                seen.add(token)
+        return cls(tokens, list(weights))
+
+    @classmethod
+    def from_mapping(cls, order_intent: Mapping) -> "OrderIntent":
+        """Build an intent from a mapping of token addresses to weights."""
+        if isinstance(order_intent, cls):
+            return order_intent
+        return cls.from_columns(order_intent.keys(), order_intent.values())
+
+    @property
+    def addresses(self) -> list[str]:
+        """Checksum addresses of the tokens, computed once."""
+        if self._addresses is None:
+            self._addresses = [checksum_address(token) for token in self.tokens]
+        return self._addresses
+
+    def with_weights(self, weights: list) -> "OrderIntent":
+        """Return the same tokens with new weights, without copying the tokens."""
+        intent = OrderIntent(self.tokens, weights)
+        intent._addresses = self._addresses
+        intent._index = self._index
+        return intent
+
+    def _position(self, address) -> int | None:
+        """Index of a token, given as an address in any letter case or bytes."""
+        try:
+            token = address_bytes(address)
+        except ValueError:
+            return None
+        if self._index is None:
+            self._index = {token: i for i, token in enumerate(self.tokens)}
+        return self._index.get(token)
+
+    def __getitem__(self, address: str | bytes):
+        """Weight of a token, looked up by address in any letter case."""
+        position = self._position(address)
+        if position is None:
+            raise KeyError(address)
+        return self.weights[position]
+
+    def __contains__(self, address) -> bool:
+        """Whether the intent holds a token, by address in any letter case."""
+        return self._position(address) is not None
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self.tokens)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the checksum addresses, like the keys of a dict."""
+        return iter(self.addresses)
+
+    def keys(self) -> list[str]:
+        """Checksum addresses of the tokens."""
+        return list(self.addresses)
+
+    def values(self) -> list:
+        """Weights, in token order."""
+        return list(self.weights)
+
+    def items(self) -> list[tuple[str, object]]:
+        """Pairs of checksum address and weight."""
+        return list(zip(self.addresses, self.weights))
+
+    def to_dict(self) -> dict:
+        """Return the intent as a dict of checksum addresses to weights."""
+        return dict(zip(self.addresses, self.weights))
+
+    def __repr__(self) -> str:
+        """Short representation, the tokens of a large intent are elided."""
+        return f"OrderIntent({len(self)} tokens)"
+
+
+def _column(names: list[str], candidates: tuple[str, ...], path: str) -> int:
+    lowered = [name.strip().lower() for name in names]
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered.index(candidate)
+    raise ValueError(
+        f"{path} has no {' / '.join(candidates)} column (columns: {', '.join(names)})"
+    )
+
+
+def _read_json(path: str) -> tuple[list[str], list[float]]:
+    with open(path) as f:
+        # Pairs rather than a dict, so repeated addresses are not silently merged.
+        pairs = json.load(f, object_pairs_hook=lambda pairs: pairs)
+    if not isinstance(pairs, list) or any(
+        not isinstance(pair, tuple) for pair in pairs
+    ):
+        raise ValueError(f"{path} must contain an object mapping tokens to weights")
+    return [token for token, _ in pairs], [weight for _, weight in pairs]
+
+
+def _read_csv(path: str) -> tuple[list[str], list[float]]:
+    tokens: list[str] = []
+    weights: list[float] = []
+    with open(path, newline="") as f:
+        rows = csv.reader(f)
+        header = next(rows, None)
+        if not header:
+            return tokens, weights
+        if header[0].strip().lower().startswith("0x"):
+            # Headerless file: token, weight
+            token_index, weight_index = 0, 1
+            tokens.append(header[0].strip())
+            weights.append(float(header[1]))
+        else:
+            token_index = _column(header, TOKEN_COLUMNS, path)
+            weight_index = _column(header, WEIGHT_COLUMNS, path)
+        for row in rows:
+            if row:
+                tokens.append(row[token_index].strip())
+                weights.append(float(row[weight_index]))
+    return tokens, weights
+
+
+def _read_arrow(path: str) -> tuple[list[str], list[float]]:
+    try:
+        import pyarrow.feather as feather
+        import pyarrow.parquet as parquet
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet or Arrow intents requires pyarrow: "
+            "pip install 'orion-finance-sdk[arrow]'"
+        ) from e
+
+    if path.lower().endswith(PARQUET_SUFFIXES):
+        table = parquet.read_table(path)
+    else:
+        table = feather.read_table(path)
+    names = table.column_names
+    token_column = table.column(_column(names, TOKEN_COLUMNS, path))
+    weight_column = table.column(_column(names, WEIGHT_COLUMNS, path))
+    return token_column.to_pylist(), weight_column.cast("double").to_pylist()
+
+
+def read_intent_columns(path: str) -> tuple[list[str], list[float]]:
+    """Read an order intent file into parallel token and weight columns.
+
+    JSON files map token addresses to weights. CSV, Parquet and Arrow files
+    have one row per token, with token and weight columns (see TOKEN_COLUMNS
+    and WEIGHT_COLUMNS); headerless CSV files are read as token, weight.
+
+    Returns:
+        Token addresses and their weights, in file order.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".csv":
+        return _read_csv(path)
+    if suffix in PARQUET_SUFFIXES + ARROW_SUFFIXES:
+        return _read_arrow(path)
+    return _read_json(path)
+
+
+@traced("load_order_intent")
+def load_order_intent(path: str) -> OrderIntent:
+    """Load an order intent from a JSON, CSV, Parquet or Arrow file.
+
+    Raises:
+        ValueError: If a token is malformed or appears more than once.
+    """
+    tokens, weights = read_intent_columns(path)
+    try:
+        return OrderIntent.from_columns(tokens, weights)
+    except ValueError as e:
+        raise ValueError(f"{e} in {path}") from e
@@ -0,0 +1,173 @@
+"""Local nonce allocation for the Orion Finance Python SDK."""
+
+import asyncio
+import heapq
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+
+from web3 import AsyncWeb3, Web3
+
+# Node error messages meaning the nonce was already used on chain.
+NONCE_TOO_LOW_ERRORS = (
+    "nonce too low",
+    "replacement transaction underpriced",
+    "invalid nonce",
+)
+
+# Node error messages meaning the node already holds this exact transaction,
+# e.g. from an earlier attempt that timed out or from gossip. Not a failure.
+ALREADY_KNOWN_ERRORS = (
+    "already known",
+    "known transaction",
+)
+
+
+def is_nonce_too_low_error(error: Exception) -> bool:
+    """Whether a node rejected a transaction because its nonce is already used."""
+    message = str(error).lower()
+    return any(pattern in message for pattern in NONCE_TOO_LOW_ERRORS)
+
+
+def is_already_known_error(error: Exception) -> bool:
+    """Whether a node rejected a transaction because it already has it."""
+    message = str(error).lower()
+    return any(pattern in message for pattern in ALREADY_KNOWN_ERRORS)
+
+
+class NonceManager:
+    """Thread-safe nonce allocator for one signing account.
+
+    Nonces are handed out from a local counter, initialised from the account's
+    pending transaction count, so several transactions from the same key can
+    be in flight at once. Nonces of transactions that were never broadcast are
+    released and reused first, so they do not leave gaps.
+    """
+
+    def __init__(self, w3: Web3, address: str):
+        """Initialize the nonce manager for an account."""
+        self.w3 = w3
+        self.address = Web3.to_checksum_address(address)
+        self._lock = threading.Lock()
+        self._next_nonce: int | None = None
+        self._released: list[int] = []
+
+    def _chain_nonce(self) -> int:
+        return self.w3.eth.get_transaction_count(self.address, "pending")
+
+    def acquire(self) -> int:
+        """Allocate the next nonce for the account."""
+        with self._lock:
+            if self._released:
+                return heapq.heappop(self._released)
+            if self._next_nonce is None:
+                self._next_nonce = self._chain_nonce()
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int) -> None:
+        """Return a nonce whose transaction was never broadcast."""
+        with self._lock:
+            if self._next_nonce is not None and nonce == self._next_nonce - 1:
+                self._next_nonce = nonce
+            elif nonce not in self._released:
+                heapq.heappush(self._released, nonce)
+
+    def resync(self) -> None:
+        """Catch up with the chain after nonces were consumed elsewhere."""
+        with self._lock:
+            chain_nonce = self._chain_nonce()
+            self._released = [nonce for nonce in self._released if nonce >= chain_nonce]
+            heapq.heapify(self._released)
+            self._next_nonce = max(chain_nonce, self._next_nonce or 0)
+
+    @contextmanager
+    def nonce(self):
+        """Allocate a nonce for a transaction broadcast inside the block.
+
+        If the block raises, the nonce is released for reuse, or the manager
+        resyncs with the chain when the node reports the nonce as already used.
+        """
+        nonce = self.acquire()
+        try:
+            yield nonce
+        except Exception as e:
+            if is_nonce_too_low_error(e):
+                self.resync()
+            else:
+                self.release(nonce)
+            raise
+
+
+class AsyncNonceManager(NonceManager):
+    """Nonce allocator for one signing account, for use from an event loop.
+
+    Same allocation rules as NonceManager, but the chain is queried without
+    blocking the loop and coroutines wait on an asyncio lock.
+    """
+
+    def __init__(self, w3: AsyncWeb3, address: str):
+        """Initialize the nonce manager for an account."""
+        super().__init__(w3, address)
+        self._async_lock = asyncio.Lock()
+
+    async def _async_chain_nonce(self) -> int:
+        return await self.w3.eth.get_transaction_count(self.address, "pending")
+
+    async def acquire(self) -> int:
+        """Allocate the next nonce for the account."""
+        async with self._async_lock:
+            if self._next_nonce is None and not self._released:
+                self._next_nonce = await self._async_chain_nonce()
+            return super().acquire()
+
+    async def resync(self) -> None:
+        """Catch up with the chain after nonces were consumed elsewhere."""
+        async with self._async_lock:
+            chain_nonce = await self._async_chain_nonce()
+            with self._lock:
+                self._released = [
+                    nonce for nonce in self._released if nonce >= chain_nonce
+                ]
+                heapq.heapify(self._released)
+                self._next_nonce = max(chain_nonce, self._next_nonce or 0)
+
+    @asynccontextmanager
+    async def nonce(self):
+        """Allocate a nonce for a transaction broadcast inside the block.
+
+        If the block raises, the nonce is released for reuse, or the manager
+        resyncs with the chain when the node reports the nonce as already used.
+        """
+        nonce = await self.acquire()
+        try:
+            yield nonce
+        except Exception as e:
+            if is_nonce_too_low_error(e):
+                await self.resync()
+            else:
+                self.release(nonce)
+            raise
+
+
+_managers: "weakref.WeakKeyDictionary[Web3, dict[str, NonceManager]]" = (
+    weakref.WeakKeyDictionary()
+)
+_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(w3: Web3 | AsyncWeb3, address: str) -> NonceManager:
+    """Return the process-wide nonce manager of an account on a connection.
+
+    An AsyncNonceManager is returned for AsyncWeb3 connections.
+    """
+    address = Web3.to_checksum_address(address)
+    with _managers_lock:
+        managers = _managers.setdefault(w3, {})
+        if address not in managers:
+            manager_class = (
+                AsyncNonceManager if isinstance(w3, AsyncWeb3) else NonceManager
+            )
+            managers[address] = manager_class(w3, address)
+        return managers[address]
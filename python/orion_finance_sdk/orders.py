@@ -0,0 +1,264 @@
+"""Order intent submission to several vaults at once."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from .contracts import (
+    OrionConfig,
+    OrionEncryptedVault,
+    OrionTransparentVault,
+    PendingTransaction,
+)
+from .encrypt import encrypt_order_intent, encrypt_order_intents_batch
+from .intent import load_order_intent
+from .simulation import SimulationReport, placeholder_encryption
+from .types import VaultType
+from .utils import DEFAULT_MAX_WORKERS, validate_order
+
+
+@dataclass
+class OrderSubmission:
+    """Outcome of submitting the order intent of one vault."""
+
+    vault_address: str
+    intent_path: str
+    vault_type: VaultType | None = None
+    tx_hash: str | None = None
+    error: str | None = None
+    report: SimulationReport | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the intent was submitted, or simulated, successfully."""
+        return self.error is None and (
+            self.tx_hash is not None or self.report is not None
+        )
+
+
+def _vault_type(config: OrionConfig, vault_address: str) -> VaultType:
+    vault_type = config.vault_type(vault_address)
+    if vault_type is None:
+        raise ValueError(f"Vault address {vault_address} not in OrionConfig contract.")
+    return vault_type
+
+
+def simulate_order_intent(
+    vault_address: str,
+    order_intent: dict[str, float],
+    fuzz: bool = False,
+    stub_encryption: bool = False,
+) -> SimulationReport:
+    """Dry run the submission of an order intent to a vault.
+
+    Validation, encryption, gas estimation and the eth_call of submitIntent
+    run as timed stages of the report; no transaction is sent.
+
+    Args:
+        vault_address: Vault to simulate the submission to.
+        order_intent: Dictionary mapping token addresses to weights.
+        fuzz: Fuzz the order intent of an encrypted vault.
+        stub_encryption: Replace encryption with placeholder ciphertexts, which
+            the contract is expected to reject at the eth_call stage.
+    """
+    report = SimulationReport("submitIntent", vault_address)
+    config = report.run("config", OrionConfig)
+    vault_type = report.run("vault_type", _vault_type, config, vault_address)
+    validated = report.run(
+        "validate",
+        validate_order,
+        order_intent,
+        fuzz=fuzz and vault_type == VaultType.ENCRYPTED,
+        orion_config=config,
+    )
+    if not report.ok:
+        return report
+
+    if vault_type == VaultType.TRANSPARENT:
+        vault = OrionTransparentVault(vault_address)
+        vault_report = report.run(
+            "prepare", vault.submit_order_intent, validated, simulate=True
+        )
+    else:
+        if stub_encryption:
+            encrypted = report.run("encrypt", placeholder_encryption, validated)
+        else:
+            encrypted = report.run(
+                "encrypt", encrypt_order_intent, validated, vault_address
+            )
+        if encrypted is None:
+            return report
+        vault = OrionEncryptedVault(vault_address)
+        vault_report = report.run(
+            "prepare", vault.submit_order_intent, *encrypted, simulate=True
+        )
+    if vault_report is not None:
+        report.extend(vault_report)
+    return report
+
+
+def load_manifest(manifest_path: str) -> dict[str, str]:
+    """Load a manifest mapping vault addresses to order intent files.
+
+    Relative intent paths are resolved against the manifest's directory.
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    if not isinstance(manifest, dict):
+        raise ValueError("The manifest must map vault addresses to intent files.")
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    return {
+        vault_address: os.path.join(base_dir, intent_path)
+        for vault_address, intent_path in manifest.items()
+    }
+
+
+def submit_manifest(
+    manifest: dict[str, str],
+    fuzz: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    simulate: bool = False,
+    stub_encryption: bool = False,
+) -> list[OrderSubmission]:
+    """Validate, encrypt and submit the order intents of several vaults.
+
+    All vaults share one connection and one OrionConfig snapshot. Intents are
+    validated on a bounded thread pool, encrypted intents are encrypted in a
+    single batch, and transactions are broadcast concurrently, with nonces
+    sequenced per signer, before their receipts are awaited together. A
+    failing vault is reported in its result and does not stop the others.
+
+    Args:
+        manifest: Mapping of vault addresses to order intent files.
+        fuzz: Fuzz the order intents of encrypted vaults.
+        max_workers: Maximum number of vaults processed concurrently.
+        simulate: Estimate gas and eth_call each submission instead of sending
+            it, reporting the outcome in each OrderSubmission's report.
+        stub_encryption: Replace encryption with placeholder ciphertexts, only
+            meaningful with simulate.
+
+    Returns:
+        One OrderSubmission per vault, in manifest order.
+    """
+    config = OrionConfig()
+    submissions = [
+        OrderSubmission(Web3.to_checksum_address(vault_address), intent_path)
+        for vault_address, intent_path in manifest.items()
+    ]
+    # Read the whitelist and decimals once, before the workers need them.
+    for field in ("whitelisted_assets", "curator_intent_decimals"):
+        getattr(config, field)
+
+    def prepare(submission: OrderSubmission) -> dict[str, int] | None:
+        try:
+            submission.vault_type = _vault_type(config, submission.vault_address)
+            order_intent = load_order_intent(submission.intent_path)
+            return validate_order(
+                order_intent,
+                fuzz=fuzz and submission.vault_type == VaultType.ENCRYPTED,
+                orion_config=config,
+            )
+        except Exception as e:
+            submission.error = str(e)
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        validated = list(pool.map(prepare, submissions))
+
+    # Encrypted vaults share a single Node invocation.
+    encrypted = [
+        i
+        for i, submission in enumerate(submissions)
+        if submission.error is None and submission.vault_type == VaultType.ENCRYPTED
+    ]
+    proofs: dict[int, str] = {}
+    if encrypted and stub_encryption:
+        for i in encrypted:
+            validated[i], proofs[i] = placeholder_encryption(validated[i])
+    elif encrypted:
+        try:
+            results = encrypt_order_intents_batch(
+                [(submissions[i].vault_address, None, validated[i]) for i in encrypted]
+            )
+        except Exception as e:
+            # Node failing or missing, or CURATOR_ADDRESS missing, fails the
+            # encrypted vaults but not the others.
+            for i in encrypted:
+                submissions[i].error = f"Encryption failed: {e}"
+            results = []
+        for i, result in zip(encrypted, results):
+            if result.error is not None:
+                submissions[i].error = f"Encryption failed: {result.error}"
+            else:
+                validated[i] = result.encrypted_intent
+                proofs[i] = result.input_proof
+
+    def submit(i: int) -> PendingTransaction | None:
+        submission, order_intent = submissions[i], validated[i]
+        try:
+            if submission.vault_type == VaultType.TRANSPARENT:
+                vault = OrionTransparentVault(submission.vault_address)
+                result = vault.submit_order_intent(
+                    order_intent, wait=False, simulate=simulate
+                )
+            else:
+                vault = OrionEncryptedVault(submission.vault_address)
+                result = vault.submit_order_intent(
+                    order_intent, proofs[i], wait=False, simulate=simulate
+                )
+        except Exception as e:
+            submission.error = str(e)
+            return None
+        if isinstance(result, SimulationReport):
+            submission.report, submission.error = result, result.error
+            return None
+        return result
+
+    ready = [i for i, submission in enumerate(submissions) if submission.error is None]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = list(pool.map(submit, ready))
+
+    for i, pending_tx in zip(ready, pending):
+        if pending_tx is None:
+            continue
+        submission = submissions[i]
+        submission.tx_hash = pending_tx.tx_hash
+        try:
+            pending_tx.result()
+        except Exception as e:
+            submission.error = str(e)
+
+    return submissions
+
+
+def _outcome(submission: OrderSubmission) -> str:
+    if not submission.ok:
+        return submission.error or "not submitted"
+    if submission.report is not None:
+        return f"simulated, estimated gas {submission.report.gas_estimate}"
+    return f"0x{submission.tx_hash}"
+
+
+def format_submissions(submissions: list[OrderSubmission]) -> str:
+    """Format submission outcomes as a per-vault table."""
+    rows = [
+        (
+            submission.vault_address,
+            submission.vault_type.value if submission.vault_type else "-",
+            "ok" if submission.ok else "failed",
+            _outcome(submission),
+        )
+        for submission in submissions
+    ]
+    header = ("Vault", "Type", "Status", "Transaction / Error")
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(3)]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row[:3], widths))
+        + f"  {row[3]}"
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "-" * max(len(line) for line in lines))
+    return "\n".join(lines)
@@ -0,0 +1,281 @@
+"""Client-side RPC rate limiting and request accounting for the Orion Finance SDK."""
+
+import asyncio
+import os
+import threading
+import time
+from collections import Counter
+
+from web3 import AsyncHTTPProvider, HTTPProvider
+
+from .instrumentation import record_rpc
+
+# Compute units of each JSON-RPC method, relative to a simple read. Hosted RPC
+# plans meter requests this way, heavier simulations costing several units.
+DEFAULT_COMPUTE_UNITS = 1
+METHOD_COMPUTE_UNITS = {
+    "eth_chainId": 1,
+    "eth_blockNumber": 1,
+    "eth_gasPrice": 1,
+    "eth_getTransactionCount": 1,
+    "eth_getTransactionReceipt": 1,
+    "eth_feeHistory": 2,
+    "eth_call": 2,
+    "eth_getLogs": 5,
+    "eth_estimateGas": 5,
+    "eth_sendRawTransaction": 5,
+}
+
+
+def compute_units(method: str) -> int:
+    """Compute units of a JSON-RPC method.
+
+    ORION_RPC_COMPUTE_UNITS overrides the defaults, e.g.
+    ``eth_call=3,eth_estimateGas=10``.
+    """
+    return _compute_units().get(method, DEFAULT_COMPUTE_UNITS)
+
+
+_overrides: tuple[str, dict[str, int]] = ("", dict(METHOD_COMPUTE_UNITS))
+
+
+def _compute_units() -> dict[str, int]:
+    """Return the method weights, parsed again when ORION_RPC_COMPUTE_UNITS changes."""
+    global _overrides
+    setting = os.getenv("ORION_RPC_COMPUTE_UNITS", "")
+    if setting != _overrides[0]:
+        units = dict(METHOD_COMPUTE_UNITS)
+        for entry in filter(None, (e.strip() for e in setting.split(","))):
+            method, _, value = entry.partition("=")
+            try:
+                units[method.strip()] = int(value)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid ORION_RPC_COMPUTE_UNITS entry {entry!r}, "
+                    "expected method=units"
+                ) from e
+        _overrides = (setting, units)
+    return _overrides[1]
+
+
+class TokenBucket:
+    """Token bucket refilled at a steady rate, up to a burst capacity.
+
+    Callers reserve tokens and are told how long to wait before using them, so
+    concurrent callers queue in reservation order instead of failing.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Most tokens held at once, defaults to one second's worth.
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a token bucket must be positive")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float) -> float:
+        """Take tokens, returning the seconds to wait before they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RequestBudget:
+    """Requests sent to one RPC endpoint, paced by an optional token bucket.
+
+    Every request is counted per method, with its compute units and the time it
+    waited for the bucket, whether or not a rate limit is set.
+    """
+
+    def __init__(self, rate: float | None = None, burst: float | None = None):
+        """Initialize the budget.
+
+        Args:
+            rate: Compute units per second, or None not to limit the rate.
+            burst: Compute units that may be spent at once, defaults to one
+                second's worth.
+        """
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.requests: Counter[str] = Counter()
+        self.units: Counter[str] = Counter()
+        self.throttled = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, methods: list[str]) -> float:
+        units = [compute_units(method) for method in methods]
+        with self._lock:
+            self.requests.update(methods)
+            for method, unit in zip(methods, units):
+                self.units[method] += unit
+        if self.bucket is None:
+            return 0.0
+        delay = self.bucket.reserve(sum(units))
+        with self._lock:
+            self.throttled += delay
+        return delay
+
+    def acquire(self, methods: list[str]) -> None:
+        """Count a request, or batch of requests, and wait for its turn."""
+        delay = self._reserve(methods)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, methods: list[str]) -> None:
+        """Count a request, or batch of requests, and wait for its turn."""
+        delay = self._reserve(methods)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_budgets: dict[str, RequestBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_request_budget(endpoint: str) -> RequestBudget:
+    """Return the process-wide request budget of an RPC endpoint.
+
+    Sync and async connections to the same endpoint share it. The rate is read
+    from ORION_RPC_RATE_LIMIT, in compute units per second, and the burst from
+    ORION_RPC_BURST; without a rate, requests are only counted.
+    """
+    with _budgets_lock:
+        budget = _budgets.get(endpoint)
+        if budget is None:
+            rate = os.getenv("ORION_RPC_RATE_LIMIT")
+            burst = os.getenv("ORION_RPC_BURST")
+            budget = _budgets[endpoint] = RequestBudget(
+                float(rate) if rate else None, float(burst) if burst else None
+            )
+        return budget
+
+
+def _batch_label(methods: list[str]) -> str:
+    """Name a batch by its distinct methods, e.g. ``batch(eth_call,eth_estimateGas)``."""
+    return f"batch({','.join(sorted(set(methods)))})"
+
+
+def _record(method: str, start: float, response) -> None:
+    """Report a request's latency; no response means it raised."""
+    error = response is None or (isinstance(response, dict) and "error" in response)
+    record_rpc(method, time.perf_counter() - start, error)
+
+
+class MeteredHTTPProvider(HTTPProvider):
+    """HTTPProvider counting its requests and pacing them by the endpoint's budget.
+
+    The latency of each request, after any wait for the budget, is reported
+    to the current instrumentation.
+    """
+
+    def __init__(self, endpoint_uri: str, **kwargs):
+        """Initialize the provider, sharing the budget of its endpoint."""
+        super().__init__(endpoint_uri, **kwargs)
+        self.budget = get_request_budget(str(endpoint_uri))
+
+    def make_request(self, method, params):
+        """Wait for the request's turn, then send it."""
+        self.budget.acquire([method])
+        start = time.perf_counter()
+        response = None
+        try:
+            response = super().make_request(method, params)
+            return response
+        finally:
+            _record(method, start, response)
+
+    def make_batch_request(self, batch_requests):
+        """Wait for the batch's turn, its compute units summed, then send it."""
+        methods = [method for method, _ in batch_requests]
+        self.budget.acquire(methods)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = super().make_batch_request(batch_requests)
+            return response
+        finally:
+            _record(_batch_label(methods), start, response)
+
+
+class AsyncMeteredHTTPProvider(AsyncHTTPProvider):
+    """Async counterpart of MeteredHTTPProvider."""
+
+    def __init__(self, endpoint_uri: str, **kwargs):
+        """Initialize the provider, sharing the budget of its endpoint."""
+        super().__init__(endpoint_uri, **kwargs)
+        self.budget = get_request_budget(str(endpoint_uri))
+
+    async def make_request(self, method, params):
+        """Wait for the request's turn, then send it."""
+        await self.budget.acquire_async([method])
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await super().make_request(method, params)
+            return response
+        finally:
+            _record(method, start, response)
+
+    async def make_batch_request(self, batch_requests):
+        """Wait for the batch's turn, its compute units summed, then send it."""
+        methods = [method for method, _ in batch_requests]
+        await self.budget.acquire_async(methods)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = await super().make_batch_request(batch_requests)
+            return response
+        finally:
+            _record(_batch_label(methods), start, response)
+
+
+def request_stats() -> dict[str, tuple[int, int]]:
+    """Return the requests and compute units per JSON-RPC method, over all endpoints."""
+    requests: Counter[str] = Counter()
+    units: Counter[str] = Counter()
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    for budget in budgets:
+        with budget._lock:
+            requests.update(budget.requests)
+            units.update(budget.units)
+    return {method: (requests[method], units[method]) for method in sorted(requests)}
+
+
+def reset_request_stats() -> None:
+    """Zero the request counters of every endpoint, e.g. at the start of a command."""
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    for budget in budgets:
+        with budget._lock:
+            budget.requests.clear()
+            budget.units.clear()
+            budget.throttled = 0.0
+
+
+def format_request_stats() -> str:
+    """Format the request counters as a per-method table."""
+    stats = request_stats()
+    with _budgets_lock:
+        throttled = sum(budget.throttled for budget in _budgets.values())
+    total_requests = sum(requests for requests, _ in stats.values())
+    total_units = sum(units for _, units in stats.values())
+    lines = [
+        f"RPC requests: {total_requests} ({total_units} compute units, "
+        f"{throttled:.2f} s throttled)"
+    ]
+    width = max((len(method) for method in stats), default=0)
+    for method, (requests, units) in stats.items():
+        lines.append(f"  {method.ljust(width)}  {requests:6d}  {units:8d} CU")
+    return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""Batched transaction receipt tracking for the Orion Finance Python SDK."""
+
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+
+from web3 import Web3
+from web3._utils.method_formatters import get_result_formatters
+from web3._utils.rpc_abi import RPC
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+DEFAULT_POLL_INTERVAL = 1.0  # Seconds between receipt polls
+DEFAULT_RECEIPT_TIMEOUT = 120  # Seconds before a tracked transaction times out
+
+
+class ReceiptTimeout(TimeExhausted, TimeoutError):
+    """A tracked transaction was not found mined before its deadline.
+
+    When the last poll failed, that error is the cause.
+    """
+
+
+def _normalize_hash(tx_hash: str) -> str:
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+class ReceiptTracker:
+    """Poll many outstanding transactions in one loop and resolve their futures.
+
+    Each poll sends a single batched eth_getTransactionReceipt request for all
+    tracked hashes, so awaiting N transactions costs one round trip per poll
+    instead of N. The polling thread only runs while transactions are pending.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_RECEIPT_TIMEOUT,
+    ):
+        """Initialize the tracker for a connection."""
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._pending: dict[str, tuple[Future, float]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def track(self, tx_hash: str, timeout: float | None = None) -> Future:
+        """Start tracking a transaction.
+
+        Args:
+            tx_hash: Hash of a broadcast transaction.
+            timeout: Seconds to wait for it to be mined, defaults to the tracker's.
+
+        Returns:
+            Future resolving to the receipt, or failing with ReceiptTimeout.
+        """
+        tx_hash = _normalize_hash(tx_hash)
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            if tx_hash in self._pending:
+                return self._pending[tx_hash][0]
+            future: Future = Future()
+            self._pending[tx_hash] = (future, deadline)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return future
+
+    def _run(self) -> None:
+        last_error: Exception | None = None
+        while True:
+            # Sleep first: a just-broadcast transaction is rarely mined yet, and
+            # waiting lets concurrent submissions share the next poll.
+            time.sleep(self.poll_interval)
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                tx_hashes = list(self._pending)
+            try:
+                self.poll(tx_hashes)
+                last_error = None
+            except Exception as e:
+                # Transient RPC failure: keep the transactions and poll again.
+                last_error = e
+            # Deadlines hold even while the endpoint is down.
+            self._expire(last_error)
+
+    def _expire(self, last_error: Exception | None = None) -> None:
+        """Fail the transactions past their deadline with ReceiptTimeout."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                tx_hash
+                for tx_hash, (_, deadline) in self._pending.items()
+                if now >= deadline
+            ]
+            futures = [self._pending.pop(tx_hash)[0] for tx_hash in expired]
+
+        for future, tx_hash in zip(futures, expired):
+            message = f"Transaction {tx_hash} is not in the chain yet."
+            if last_error is not None:
+                message += f" Last receipt poll failed: {last_error}"
+            error = ReceiptTimeout(message)
+            error.__cause__ = last_error
+            future.set_exception(error)
+
+    def poll(self, tx_hashes: list[str] | None = None) -> int:
+        """Check the given (default: all tracked) transactions once.
+
+        Returns:
+            Number of transactions resolved by this poll.
+        """
+        if tx_hashes is None:
+            with self._lock:
+                tx_hashes = list(self._pending)
+        if not tx_hashes:
+            return 0
+
+        responses = self.w3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+        )
+        if not isinstance(responses, list):
+            raise RuntimeError(f"Receipt batch request failed: {responses}")
+        # Raw receipts are formatted as web3 would, without fetching them again.
+        format_receipt = get_result_formatters(
+            RPC.eth_getTransactionReceipt, self.w3.eth
+        )
+        receipts: dict[str, TxReceipt] = {
+            tx_hash: AttributeDict.recursive(format_receipt(response["result"]))
+            for tx_hash, response in zip(tx_hashes, responses)
+            if response.get("result")
+        }
+
+        resolved = []
+        with self._lock:
+            for tx_hash, receipt in receipts.items():
+                entry = self._pending.pop(tx_hash, None)
+                if entry is not None:
+                    resolved.append((entry[0], receipt))
+
+        for future, receipt in resolved:
+            future.set_result(receipt)
+        return len(resolved)
+
+
+_trackers: "weakref.WeakKeyDictionary[Web3, ReceiptTracker]" = (
+    weakref.WeakKeyDictionary()
+)
+_trackers_lock = threading.Lock()
+
+
+def get_receipt_tracker(w3: Web3) -> ReceiptTracker:
+    """Return the process-wide receipt tracker of a connection."""
+    with _trackers_lock:
+        if w3 not in _trackers:
+            _trackers[w3] = ReceiptTracker(w3)
+        return _trackers[w3]
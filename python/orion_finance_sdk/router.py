@@ -0,0 +1,479 @@
+"""Multi-endpoint JSON-RPC routing for the Orion Finance Python SDK."""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from aiohttp import ClientConnectionError, ClientResponseError
+from web3.providers import JSONBaseProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+
+from .ratelimit import AsyncMeteredHTTPProvider, MeteredHTTPProvider
+
+DEFAULT_RETRIES = 3  # Further attempts after a rate limited or failed request
+RETRY_BACKOFF = 0.25  # Seconds before the first retry, doubled at each attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# JSON-RPC error codes some providers answer rate limiting with, over HTTP 200.
+RATE_LIMIT_ERROR_CODES = frozenset({429, -32005})
+
+FAILURES_BEFORE_COOLDOWN = 3  # Consecutive failures taking an endpoint out
+FAILURE_COOLDOWN = 30.0  # Seconds an unhealthy endpoint is skipped
+LATENCY_SMOOTHING = 0.2  # Weight of the latest sample in the latency average
+
+# Sent to every endpoint, so the transaction propagates even if one node is slow
+# to gossip it or silently drops it.
+BROADCAST_METHODS = frozenset({"eth_sendRawTransaction"})
+
+
+def split_rpc_urls(rpc_url: str) -> list[str]:
+    """Split a comma-separated RPC_URL into its endpoints."""
+    return [url.strip() for url in rpc_url.split(",") if url.strip()]
+
+
+class RateLimitedError(Exception):
+    """An endpoint answered a JSON-RPC error meaning the request was throttled."""
+
+    def __init__(self, response: dict):
+        """Initialize the error from the endpoint's response."""
+        super().__init__(response["error"].get("message", "rate limited"))
+        self.response = response
+
+
+def _rate_limited(response) -> bool:
+    return (
+        isinstance(response, dict)
+        and isinstance(response.get("error"), dict)
+        and response["error"].get("code") in RATE_LIMIT_ERROR_CODES
+    )
+
+
+def _retry_after(error: Exception) -> float | None:
+    """Seconds a throttled endpoint asked to wait, from its Retry-After header."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        headers = error.response.headers
+    elif isinstance(error, ClientResponseError) and error.headers is not None:
+        headers = error.headers
+    else:
+        return None
+    try:
+        return float(headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a request failed for reasons another attempt may not hit.
+
+    Connection failures, timeouts, rate limiting and 5xx answers are; anything
+    else, such as a JSON-RPC error or an HTTP 4xx, is the request's own fault.
+    """
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and (
+            error.response.status_code in RETRY_STATUSES
+        )
+    if isinstance(error, ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(
+        error,
+        (
+            RateLimitedError,
+            requests.ConnectionError,
+            requests.Timeout,
+            ClientConnectionError,
+            asyncio.TimeoutError,
+        ),
+    )
+
+
+def _broadcast_failure(errors: list):
+    """Outcome of a broadcast no endpoint accepted.
+
+    A JSON-RPC error is a node's verdict on the transaction itself, e.g.
+    "nonce too low", which beats a transport failure of another endpoint.
+    """
+    for error in errors:
+        if not isinstance(error, Exception):
+            return error
+    raise errors[0]
+
+
+class EndpointHealth:
+    """Latency and failure record of one RPC endpoint."""
+
+    def __init__(self, url: str):
+        """Initialize the record of an endpoint not used yet."""
+        self.url = url
+        self.latency: float | None = None
+        self.failures = 0
+        self.down_until = 0.0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether the endpoint is out of its failure cooldown."""
+        return time.monotonic() >= self.down_until
+
+    def record_success(self, seconds: float) -> None:
+        """Fold a successful request into the latency average."""
+        with self._lock:
+            self.requests += 1
+            self.failures = 0
+            if self.latency is None:
+                self.latency = seconds
+            else:
+                self.latency += LATENCY_SMOOTHING * (seconds - self.latency)
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failed request, taking the endpoint out if it keeps failing."""
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            if retry_after is not None:
+                self.down_until = time.monotonic() + retry_after
+            elif self.failures >= FAILURES_BEFORE_COOLDOWN:
+                self.down_until = time.monotonic() + FAILURE_COOLDOWN
+
+    def __repr__(self) -> str:
+        """Show the endpoint with its latency and failure count."""
+        latency = "?" if self.latency is None else f"{self.latency * 1e3:.0f} ms"
+        return f"EndpointHealth({self.url}, {latency}, failures={self.failures})"
+
+
+class _Routing:
+    """Endpoint selection and retry policy shared by the sync and async routers."""
+
+    def __init__(
+        self,
+        urls: list[str],
+        retries: int = DEFAULT_RETRIES,
+        hedge_after: float | None = None,
+    ):
+        if not urls:
+            raise ValueError("At least one RPC endpoint is required")
+        self.endpoints = [EndpointHealth(url) for url in urls]
+        self.retries = retries
+        self.hedge_after = hedge_after
+
+    @property
+    def endpoint_uri(self) -> str:
+        """Endpoints joined as in RPC_URL."""
+        return ",".join(endpoint.url for endpoint in self.endpoints)
+
+    def candidates(self) -> list[EndpointHealth]:
+        """Endpoints in the order to try them.
+
+        Healthy endpoints come first, those never measured ahead, the others
+        drawn at random with a weight inversely proportional to their latency,
+        so the fastest one takes most reads while the rest keep being measured.
+        Endpoints that just failed follow, and those in cooldown come last,
+        soonest back first.
+        """
+        available = [e for e in self.endpoints if e.available]
+        healthy = [e for e in available if not e.failures]
+        ordered = [e for e in healthy if e.latency is None]
+        measured = [e for e in healthy if e.latency is not None]
+        weights = [1 / max(e.latency, 1e-4) for e in measured]
+        while measured:
+            index = random.choices(range(len(measured)), weights)[0]
+            ordered.append(measured.pop(index))
+            weights.pop(index)
+        failing = sorted((e for e in available if e.failures), key=lambda e: e.failures)
+        resting = sorted(
+            (e for e in self.endpoints if not e.available), key=lambda e: e.down_until
+        )
+        return ordered + failing + resting
+
+    def retry_delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before a retry.
+
+        Nothing while a healthy endpoint remains to fail over to; otherwise an
+        exponential backoff, or the Retry-After the endpoint asked for.
+        """
+        if any(e.available and not e.failures for e in self.endpoints):
+            return 0.0
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return RETRY_BACKOFF * 2**attempt * random.uniform(0.5, 1.0)
+
+    def record(self, endpoint: EndpointHealth, start: float, error=None) -> None:
+        """Record the outcome of a request on an endpoint."""
+        if error is None:
+            endpoint.record_success(time.monotonic() - start)
+        elif is_retryable(error):
+            endpoint.record_failure(_retry_after(error))
+        else:
+            # The request's own fault, the endpoint answered it.
+            endpoint.record_success(time.monotonic() - start)
+
+
+class RPCRouter(JSONBaseProvider, _Routing):
+    """Web3 provider spreading requests over several HTTP endpoints.
+
+    Reads go to one endpoint, chosen by measured latency. When rate limited
+    (HTTP 429), on 5xx answers and on connection failures they fail over to the
+    next endpoint, backing off exponentially once none is healthy. With
+    hedge_after set, a read still unanswered after that many seconds is also
+    sent to the next endpoint and the first answer wins. Signed transactions
+    are broadcast to all endpoints.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        request_kwargs: dict | None = None,
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        retries: int = DEFAULT_RETRIES,
+        hedge_after: float | None = None,
+    ):
+        """Initialize the router.
+
+        Args:
+            urls: RPC endpoints to route to.
+            request_kwargs: Keyword arguments of each HTTP request, e.g. timeout.
+            session: HTTP session shared by the endpoints.
+            pool_size: Requests in flight per endpoint for hedging and broadcasts.
+            retries: Further attempts after a retryable failure.
+            hedge_after: Seconds before a read is also sent to a second
+                endpoint, or None not to hedge.
+        """
+        JSONBaseProvider.__init__(self)
+        _Routing.__init__(self, urls, retries, hedge_after)
+        self._providers = {
+            endpoint.url: MeteredHTTPProvider(
+                endpoint.url,
+                request_kwargs=request_kwargs,
+                session=session,
+                # Retries are the router's, on the next endpoint.
+                exception_retry_configuration=None,
+            )
+            for endpoint in self.endpoints
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size * len(self.endpoints), thread_name_prefix="rpc-router"
+        )
+
+    def __str__(self) -> str:
+        """Name the routed endpoints."""
+        return f"RPC router over {self.endpoint_uri}"
+
+    def make_request(self, method, params):
+        """Send a JSON-RPC request, broadcasting signed transactions."""
+        if method in BROADCAST_METHODS:
+            return self._retrying(
+                self._broadcast, lambda provider: provider.make_request(method, params)
+            )
+        return self._retrying(
+            self._hedged, lambda provider: provider.make_request(method, params)
+        )
+
+    def make_batch_request(self, batch_requests):
+        """Send a JSON-RPC batch to a single endpoint."""
+        return self._retrying(
+            self._hedged, lambda provider: provider.make_batch_request(batch_requests)
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Whether any endpoint answers."""
+        return any(
+            provider.is_connected(show_traceback)
+            for provider in self._providers.values()
+        )
+
+    def _retrying(self, send: Callable, request: Callable):
+        for attempt in range(self.retries + 1):
+            try:
+                return send(request, self.candidates())
+            except Exception as e:
+                if not is_retryable(e) or attempt == self.retries:
+                    raise
+                time.sleep(self.retry_delay(attempt, e))
+
+    def _send(self, endpoint: EndpointHealth, request: Callable):
+        start = time.monotonic()
+        try:
+            response = request(self._providers[endpoint.url])
+            if _rate_limited(response):
+                raise RateLimitedError(response)
+        except Exception as e:
+            self.record(endpoint, start, e)
+            raise
+        self.record(endpoint, start)
+        return response
+
+    def _hedged(self, request: Callable, endpoints: list[EndpointHealth]):
+        """Send to the first endpoint, then to the next ones as needed.
+
+        Another endpoint is brought in whenever a request in flight fails, or
+        they all stay unanswered for hedge_after seconds.
+        """
+        if self.hedge_after is None or len(endpoints) == 1:
+            return self._send(endpoints[0], request)
+
+        remaining = iter(endpoints)
+        pending = {self._executor.submit(self._send, next(remaining), request)}
+        errors = []
+        while pending:
+            done, pending = wait(
+                pending, timeout=self.hedge_after, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                errors.append(future.exception())
+            endpoint = next(remaining, None)
+            if endpoint is not None:
+                pending.add(self._executor.submit(self._send, endpoint, request))
+        raise errors[0]
+
+    def _broadcast(self, request: Callable, endpoints: list[EndpointHealth]):
+        """Send to every endpoint and return the first success.
+
+        An error, e.g. "already known" from a node the transaction reached
+        through gossip, only counts if no endpoint accepted the transaction.
+        """
+        pending = {
+            self._executor.submit(self._send, endpoint, request)
+            for endpoint in endpoints
+        }
+        errors = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    errors.append(future.exception())
+                elif "error" in future.result():
+                    errors.append(future.result())
+                else:
+                    return future.result()
+        return _broadcast_failure(errors)
+
+
+class AsyncRPCRouter(AsyncJSONBaseProvider, _Routing):
+    """AsyncWeb3 provider spreading requests over several HTTP endpoints.
+
+    Routes, retries, hedges and broadcasts like RPCRouter.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        request_kwargs: dict | None = None,
+        retries: int = DEFAULT_RETRIES,
+        hedge_after: float | None = None,
+    ):
+        """Initialize the router.
+
+        Args:
+            urls: RPC endpoints to route to.
+            request_kwargs: Keyword arguments of each HTTP request, e.g. timeout.
+            retries: Further attempts after a retryable failure.
+            hedge_after: Seconds before a read is also sent to a second
+                endpoint, or None not to hedge.
+        """
+        AsyncJSONBaseProvider.__init__(self)
+        _Routing.__init__(self, urls, retries, hedge_after)
+        self._providers = {
+            endpoint.url: AsyncMeteredHTTPProvider(
+                endpoint.url,
+                request_kwargs=request_kwargs,
+                exception_retry_configuration=None,
+            )
+            for endpoint in self.endpoints
+        }
+
+    def __str__(self) -> str:
+        """Name the routed endpoints."""
+        return f"Async RPC router over {self.endpoint_uri}"
+
+    async def make_request(self, method, params):
+        """Send a JSON-RPC request, broadcasting signed transactions."""
+        send = self._broadcast if method in BROADCAST_METHODS else self._hedged
+        return await self._retrying(
+            send, lambda provider: provider.make_request(method, params)
+        )
+
+    async def make_batch_request(self, batch_requests):
+        """Send a JSON-RPC batch to a single endpoint."""
+        return await self._retrying(
+            self._hedged, lambda provider: provider.make_batch_request(batch_requests)
+        )
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        """Whether any endpoint answers."""
+        for provider in self._providers.values():
+            if await provider.is_connected(show_traceback):
+                return True
+        return False
+
+    async def disconnect(self) -> None:
+        """Close the HTTP sessions of every endpoint."""
+        for provider in self._providers.values():
+            await provider.disconnect()
+
+    async def _retrying(self, send: Callable, request: Callable):
+        for attempt in range(self.retries + 1):
+            try:
+                return await send(request, self.candidates())
+            except Exception as e:
+                if not is_retryable(e) or attempt == self.retries:
+                    raise
+                await asyncio.sleep(self.retry_delay(attempt, e))
+
+    async def _send(self, endpoint: EndpointHealth, request: Callable):
+        start = time.monotonic()
+        try:
+            response = await request(self._providers[endpoint.url])
+            if _rate_limited(response):
+                raise RateLimitedError(response)
+        except Exception as e:
+            self.record(endpoint, start, e)
+            raise
+        self.record(endpoint, start)
+        return response
+
+    async def _hedged(self, request: Callable, endpoints: list[EndpointHealth]):
+        if self.hedge_after is None or len(endpoints) == 1:
+            return await self._send(endpoints[0], request)
+
+        remaining = iter(endpoints)
+        pending = {asyncio.ensure_future(self._send(next(remaining), request))}
+        errors = []
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=self.hedge_after, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    # The losers still run to completion, recording their latency.
+                    return task.result()
+                errors.append(task.exception())
+            endpoint = next(remaining, None)
+            if endpoint is not None:
+                pending.add(asyncio.ensure_future(self._send(endpoint, request)))
+        raise errors[0]
+
+    async def _broadcast(self, request: Callable, endpoints: list[EndpointHealth]):
+        pending = {
+            asyncio.ensure_future(self._send(endpoint, request))
+            for endpoint in endpoints
+        }
+        errors = []
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is not None:
+                    errors.append(task.exception())
+                elif "error" in task.result():
+                    errors.append(task.result())
+                else:
+                    return task.result()
+        return _broadcast_failure(errors)
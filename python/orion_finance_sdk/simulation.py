@@ -0,0 +1,151 @@
+"""Dry runs of contract writes for the Orion Finance Python SDK."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .instrumentation import span
+
+# Selector of Solidity's Error(string) revert payload.
+ERROR_STRING_SELECTOR = "0x08c379a0"
+
+
+@dataclass
+class SimulationStage:
+    """One timed stage of a simulation."""
+
+    name: str
+    seconds: float
+    error: str | None = None
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of a dry run of a contract write, stage by stage.
+
+    Stages run in order and stop at the first failure; nothing is signed or
+    broadcast.
+    """
+
+    function: str
+    contract_address: str | None = None
+    stages: list[SimulationStage] = field(default_factory=list)
+    gas_estimate: int | None = None
+    return_data: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether every stage succeeded."""
+        return all(stage.error is None for stage in self.stages)
+
+    @property
+    def error(self) -> str | None:
+        """Error of the first failed stage."""
+        return next((stage.error for stage in self.stages if stage.error), None)
+
+    def run(self, name: str, function: Callable, /, *args, **kwargs) -> Any:
+        """Run and time a stage, recording its error instead of raising it.
+
+        The stage also runs in a span of the current instrumentation.
+
+        Returns:
+            The stage's result, or None if it failed or an earlier stage did.
+        """
+        if not self.ok:
+            return None
+        start = time.perf_counter()
+        try:
+            with span(name):
+                result = function(*args, **kwargs)
+        except Exception as e:
+            self.stages.append(
+                SimulationStage(name, time.perf_counter() - start, str(e) or repr(e))
+            )
+            return None
+        self.stages.append(SimulationStage(name, time.perf_counter() - start))
+        return result
+
+    def extend(self, report: "SimulationReport") -> None:
+        """Append the stages and outcome of a later report, e.g. a contract's."""
+        self.stages.extend(report.stages)
+        self.contract_address = report.contract_address or self.contract_address
+        self.gas_estimate = report.gas_estimate
+        self.return_data = report.return_data
+
+    def format(self) -> str:
+        """Format the report as a per-stage breakdown."""
+        lines = [
+            f"Simulation of {self.function}"
+            + (f" on {self.contract_address}" if self.contract_address else "")
+        ]
+        width = max((len(stage.name) for stage in self.stages), default=0)
+        for stage in self.stages:
+            status = "ok" if stage.error is None else f"failed: {stage.error}"
+            lines.append(
+                f"  {stage.name.ljust(width)}  {stage.seconds * 1e3:8.1f} ms  {status}"
+            )
+        total = sum(stage.seconds for stage in self.stages)
+        lines.append(f"  {'total'.ljust(width)}  {total * 1e3:8.1f} ms")
+        if self.ok:
+            lines.append(f"✅ Would succeed, estimated gas {self.gas_estimate}")
+        else:
+            lines.append(f"❌ Would fail: {self.error}")
+        return "\n".join(lines)
+
+
+def _rpc_error(response: dict) -> str:
+    """Readable message of a JSON-RPC error, with a decoded revert reason."""
+    error = response["error"]
+    message = error.get("message", str(error))
+    data = error.get("data")
+    if isinstance(data, dict):
+        data = data.get("data")
+    if isinstance(data, str) and data.startswith(ERROR_STRING_SELECTOR):
+        from eth_abi import decode
+
+        try:
+            (reason,) = decode(["string"], bytes.fromhex(data[10:]))
+        except Exception:
+            return message
+        if reason not in message:
+            message = f"{message}: {reason}"
+    return message
+
+
+def simulate_transactions(w3, transactions: list[dict]) -> list[tuple]:
+    """Estimate gas and eth_call transactions, all in one batched JSON-RPC request.
+
+    Args:
+        w3: Connection to simulate on.
+        transactions: Transactions with from, to and data fields.
+
+    Returns:
+        Per transaction, the gas estimate, the eth_call return data and an error
+        message, the first two being None on error.
+    """
+    requests = []
+    for transaction in transactions:
+        requests.append(("eth_estimateGas", [transaction]))
+        requests.append(("eth_call", [transaction, "latest"]))
+    responses = w3.provider.make_batch_request(requests)
+    if not isinstance(responses, list):
+        raise RuntimeError(f"Simulation batch request failed: {responses}")
+
+    results = []
+    for estimate, call in zip(responses[::2], responses[1::2]):
+        error = next((_rpc_error(r) for r in (call, estimate) if r.get("error")), None)
+        if error is not None:
+            results.append((None, None, error))
+        else:
+            results.append((int(estimate["result"], 16), call["result"], None))
+    return results
+
+
+def placeholder_encryption(order_intent: dict[str, int]) -> tuple[dict, str]:
+    """Stand-in for encrypt_order_intent that skips the Node toolchain.
+
+    The contract rejects the placeholder proof, so the eth_call of a simulation
+    using it is expected to revert; validation and gas still get exercised.
+    """
+    return {token: b"\x00" * 32 for token in order_intent}, "0x"
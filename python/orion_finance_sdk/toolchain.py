@@ -0,0 +1,99 @@
+"""Node.js toolchain discovery for the Orion Finance Python SDK."""
+
+import functools
+import json
+import os
+import shutil
+import subprocess
+from dataclasses import dataclass
+
+from .utils import get_cache_dir
+
+MIN_NODE_MAJOR_VERSION = 16  # Matches the engines field of the JS SDK
+
+
+@dataclass(frozen=True)
+class NodeToolchain:
+    """Resolved Node.js binary."""
+
+    path: str
+    version: str
+
+    @property
+    def major_version(self) -> int:
+        """Major version number, e.g. 22 for v22.4.1."""
+        return int(self.version.lstrip("v").split(".")[0])
+
+
+def _cache_file():
+    return get_cache_dir() / "toolchain.json"
+
+
+def _read_cached_version(path: str, mtime_ns: int) -> str | None:
+    """Return the version recorded on disk for this exact binary, if any."""
+    try:
+        with open(_cache_file()) as f:
+            cached = json.load(f)["node"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if cached.get("path") == path and cached.get("mtime_ns") == mtime_ns:
+        return cached.get("version")
+    return None
+
+
+def _write_cached_version(path: str, mtime_ns: int, version: str) -> None:
+    """Record the binary version on disk; failures only cost a future probe."""
+    try:
+        cache_file = _cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(
+                {"node": {"path": path, "mtime_ns": mtime_ns, "version": version}}, f
+            )
+    except OSError:
+        pass
+
+
+def _probe_version(path: str) -> str | None:
+    try:
+        result = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, check=False
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_node() -> NodeToolchain | None:
+    """Locate and verify the Node.js binary, once per process.
+
+    The binary is taken from ORION_NODE_PATH, or else looked up on PATH. Its
+    version is probed once and remembered on disk, keyed by the binary's path
+    and modification time, so later processes do not fork just to check it.
+
+    Returns:
+        The resolved toolchain, or None if Node.js is missing or too old.
+    """
+    path = os.getenv("ORION_NODE_PATH") or shutil.which("node")
+    if not path or not os.access(path, os.X_OK):
+        return None
+    path = os.path.realpath(path)
+
+    mtime_ns = os.stat(path).st_mtime_ns
+    version = _read_cached_version(path, mtime_ns)
+    if version is None:
+        version = _probe_version(path)
+        if version is None:
+            return None
+        _write_cached_version(path, mtime_ns, version)
+
+    toolchain = NodeToolchain(path=path, version=version)
+    try:
+        if toolchain.major_version < MIN_NODE_MAJOR_VERSION:
+            return None
+    except ValueError:
+        return None
+    return toolchain
@@ -27,3 +27,11 @@ fee_type_to_int = {
     "high_water_mark": 3,
     "hurdle_hwm": 4,
 }
+
+
+class FeeStrategy(str, Enum):
+    """Speed/price trade-off of EIP-1559 transaction fees."""
+
+    CHEAP = "cheap"  # Low tip, little headroom over the base fee
+    NORMAL = "normal"  # Median tip, 2x the base fee
+    FAST = "fast"  # High tip, 3x the base fee
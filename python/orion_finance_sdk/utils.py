@@ -1,11 +1,17 @@
 """Utility functions for the Orion Finance Python SDK."""
 
+import functools
+import math
+import operator
+import os
 import random
 import sys
 import uuid
+from decimal import Decimal
+from itertools import repeat
 from pathlib import Path
 
-import numpy as np
+from .instrumentation import traced
 
 random.seed(uuid.uuid4().int)  # uuid-based random seed for irreproducibility.
 
@@ -14,6 +20,29 @@ MAX_PERFORMANCE_FEE = 5000  # 50% in basis points
 MAX_MANAGEMENT_FEE = 500  # 5% in basis points
 BASIS_POINTS_FACTOR = 100  # 100 to convert percentage to basis points
 
+DEFAULT_MAX_WORKERS = 8  # Vaults validated or submitted concurrently
+
+# Float weights with at most this many decimal places are read by scaling.
+SHORT_DECIMAL_PLACES = 15
+
+
+def get_cache_dir() -> Path:
+    """Directory for the SDK's on-disk caches, overridable with ORION_CACHE_DIR."""
+    cache_dir = os.getenv("ORION_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return (
+        Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "orion_finance_sdk"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load the .env file of the working directory into the environment, once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 def ensure_env_file(env_file_path: Path = Path.cwd() / ".env"):
     """Check if .env file exists in the directory, create it with template if not.
@@ -75,24 +104,49 @@ def validate_management_fee(management_fee: int) -> None:
         )
 
 
-def validate_order(order_intent: dict[str, int], fuzz: bool = False) -> dict[str, int]:
-    """Validate an order intent."""
-    from .contracts import OrionConfig
-
-    orion_config = OrionConfig()
+@traced("validate_order")
+def validate_order(order_intent, fuzz: bool = False, orion_config=None):
+    """Validate an order intent.
 
-    # Validate all tokens are whitelisted
-    for token_address in order_intent.keys():
-        if not orion_config.is_whitelisted(token_address):
-            raise ValueError(f"Token {token_address} is not whitelisted")
-
-    # Validate all amounts are positive
-    if any(weight <= 0 for weight in order_intent.values()):
-        raise ValueError("All amounts must be positive")
+    Args:
+        order_intent: OrderIntent, or dictionary mapping token addresses to
+            weights summing to 1.
+        fuzz: Add the remaining whitelisted assets with dust weights.
+        orion_config: OrionConfig to read the whitelist and decimals from,
+            shared when validating several intents.
+
+    Returns:
+        OrderIntent of the same tokens with integer weights, in units of the
+        curator intent decimals.
+    """
+    from .intent import OrderIntent, address_bytes
+
+    if orion_config is None:
+        from .contracts import OrionConfig
+
+        orion_config = OrionConfig()
+
+    # Parsing rejects malformed and duplicate tokens; the checksum addresses
+    # are computed once and kept with the intent.
+    order_intent = OrderIntent.from_mapping(order_intent)
+
+    # Single pass over the intent: whitelist and positivity
+    whitelisted_assets = orion_config.whitelisted_asset_set
+    not_whitelisted = []
+    weight_sum = 0.0
+    for token_address, weight in zip(order_intent.addresses, order_intent.weights):
+        if token_address not in whitelisted_assets:
+            not_whitelisted.append(token_address)
+        # Validate all amounts are positive
+        if not weight > 0:
+            raise ValueError("All amounts must be positive")
+        weight_sum += weight
+    if not_whitelisted:
+        raise ValueError(f"Tokens {', '.join(not_whitelisted)} are not whitelisted")
 
     # Validate the sum of amounts is approximately 1 (within tolerance for floating point error)
     TOLERANCE = 1e-10
-    if not np.isclose(sum(order_intent.values()), 1, atol=TOLERANCE):
+    if not math.isclose(weight_sum, 1, rel_tol=1e-5, abs_tol=TOLERANCE):
         raise ValueError(
             "The sum of amounts is not 1 (within floating point tolerance)."
         )
@@ -100,58 +154,121 @@ def validate_order(order_intent: dict[str, int], fuzz: bool = False) -> dict[str
     curator_intent_decimals = orion_config.curator_intent_decimals
 
     if fuzz:
-        # Add remaining whitelisted assets with small random amounts
-        whitelisted_assets = orion_config.whitelisted_assets
-        for asset in whitelisted_assets:
-            if asset not in order_intent.keys():
-                order_intent[asset] = (
-                    random.randint(1, 10) / 10**curator_intent_decimals
-                )
-
-        # Normalize again to sum to 1
-        order_intent = {
-            token: weight / sum(order_intent.values())
-            for token, weight in order_intent.items()
-        }
+        # Add remaining whitelisted assets with small random amounts. There is
+        # no need to normalize again: allocate_units splits proportionally.
+        extra_assets = sorted(whitelisted_assets.difference(order_intent.addresses))
+        tokens = order_intent.tokens + [address_bytes(a) for a in extra_assets]
+        weights = order_intent.weights + [
+            random.randint(1, 10) / 10**curator_intent_decimals for _ in extra_assets
+        ]
 
         # Shuffle the order_intent to avoid dust amounts always being last
-        items = list(order_intent.items())
-        random.shuffle(items)
-        order_intent = dict(items)
-
-    order_intent = {
-        token: weight * 10**curator_intent_decimals
-        for token, weight in order_intent.items()
-    }
-    rounded_values = round_with_fixed_sum(
-        list(order_intent.values()), 10**curator_intent_decimals
+        order = list(range(len(tokens)))
+        random.shuffle(order)
+        order_intent = OrderIntent(
+            [tokens[i] for i in order], [weights[i] for i in order]
+        )
+
+    return order_intent.with_weights(
+        allocate_units(order_intent.weights, 10**curator_intent_decimals)
     )
-    order_intent = dict(zip(order_intent.keys(), rounded_values))
 
-    return order_intent
 
+def _short_decimal_numerators(weights: list, places: int) -> list[int] | None:
+    """Numerators of the weights over 10**places, by scaling.
 
-def round_with_fixed_sum(
-    values: list[float], target_sum: int | None = None
-) -> list[int]:
-    """Round a list of values to a fixed sum."""
-    values = np.asarray(values, dtype=np.float64)
+    Returns None unless every weight is the float nearest to a decimal with at
+    most places decimal places, which is then its shortest repr: below 8,
+    floats are spaced less than 10**-15 apart, so that decimal is unique.
+    """
+    if max(weights) >= 8:
+        return None
+    scale = float(10**places)
+    try:
+        numerators = list(map(round, map(operator.mul, weights, repeat(scale))))
+    except TypeError:
+        # Decimal weights do not mix with floats; they take the exact path.
+        return None
+    if any(map(operator.ne, map(operator.truediv, numerators, repeat(scale)), weights)):
+        return None
+    return numerators
+
+
+def allocate_units(weights: list, total_units: int) -> list[int]:
+    """Split a number of units into integer parts proportional to weights, exactly.
+
+    Largest-remainder method on exact rationals: each weight gets the floor of
+    its exact share of total_units, and the units left over go to the largest
+    remainders, the earliest weight first on ties. The parts always sum to
+    total_units, whatever the magnitude of total_units.
 
-    if target_sum is None:
-        target_sum = int(round(np.sum(values)))
+    Args:
+        weights: Non-negative weights, as floats, ints, Decimals or
+            Fractions. They need not sum to 1.
+        total_units: Number of units to allocate.
 
-    floored = np.floor(values).astype(int)
-    remainder = int(round(target_sum - np.sum(floored)))
+    Returns:
+        Integer parts, in the order of the weights.
+    """
+    if not weights or min(weights) < 0:
+        raise ValueError("Weights must be non-negative with a positive sum.")
+
+    # Floats are read as the shortest decimal that round-trips, i.e. the
+    # number written in the intent, rather than their binary approximation.
+    # Weights written with few decimals, as intents are, are read by scaling:
+    # first by the units' own power of ten, which makes them the units when
+    # they sum to 1, then by 10**SHORT_DECIMAL_PLACES.
+    numerators = None
+    places = len(str(total_units)) - 1
+    if places < SHORT_DECIMAL_PLACES and total_units == 10**places:
+        numerators = _short_decimal_numerators(weights, places)
+    if numerators is None:
+        numerators = _short_decimal_numerators(weights, SHORT_DECIMAL_PLACES)
+    if numerators is None:
+        ratios = [
+            (
+                Decimal(repr(weight)) if type(weight) is float else weight
+            ).as_integer_ratio()
+            for weight in weights
+        ]
+        denominator = math.lcm(*(d for _, d in ratios))
+        numerators = [n * (denominator // d) for n, d in ratios]
+
+    weight_sum = sum(numerators)
+    if weight_sum <= 0:
+        raise ValueError("Weights must be non-negative with a positive sum.")
+
+    # Share of each weight: numerator * scale / divisor, in lowest terms.
+    common = math.gcd(total_units, weight_sum)
+    scale, divisor = total_units // common, weight_sum // common
+    if divisor == 1:
+        # Whole shares, e.g. weights summing to 1 in no more places than units.
+        return numerators if scale == 1 else [n * scale for n in numerators]
+
+    units = [n * scale // divisor for n in numerators]
+    left_over = total_units - sum(units)
+    if left_over:
+        remainders = [n * scale - u * divisor for n, u in zip(numerators, units)]
+        # Stable sort: equal remainders keep the order of the weights.
+        for i in sorted(
+            range(len(remainders)), key=remainders.__getitem__, reverse=True
+        )[:left_over]:
+            units[i] += 1
+    return units
 
-    # Get the fractional parts and their indices
-    fractional_parts = values - floored
-    indices = np.argsort(-fractional_parts)  # Descending order
 
-    # Allocate the remaining units
-    result = floored.copy()
-    result[indices[:remainder]] += 1
+def round_with_fixed_sum(
+    values: list[float], target_sum: int | None = None
+) -> list[int]:
+    """Round a list of values to integers with a fixed sum.
 
-    return result.tolist()
+    Args:
+        values: Values to round.
+        target_sum: Sum of the result, defaults to the rounded sum of the values.
+    """
+    if target_sum is None:
+        target_sum = round(sum(values))
+    return allocate_units(values, target_sum)
 
 
 def format_transaction_logs(
@@ -0,0 +1,361 @@
+"""Shared fixtures: an in-process JSON-RPC stub node and minimal contract ABIs."""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import rlp
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector, keccak
+
+
+def _function(name, inputs, outputs, mutability="view"):
+    return {
+        "type": "function",
+        "name": name,
+        "stateMutability": mutability,
+        "inputs": [{"name": f"arg{i}", "type": t} for i, t in enumerate(inputs)],
+        "outputs": [{"name": "", "type": t} for t in outputs],
+    }
+
+
+ABIS = {
+    "OrionConfig": [
+        _function("curatorIntentDecimals", [], ["uint8"]),
+        _function("getAllWhitelistedAssets", [], ["address[]"]),
+        _function("isWhitelisted", ["address"], ["bool"]),
+        _function("getAllOrionVaults", ["uint8"], ["address[]"]),
+        _function("isSystemIdle", [], ["bool"]),
+    ],
+    "OrionTransparentVault": [
+        {
+            "type": "function",
+            "name": "submitIntent",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {
+                    "name": "intent",
+                    "type": "tuple[]",
+                    "components": [
+                        {"name": "token", "type": "address"},
+                        {"name": "value", "type": "uint32"},
+                    ],
+                }
+            ],
+            "outputs": [],
+        },
+        _function("updateCurator", ["address"], [], "nonpayable"),
+        _function("updateFeeModel", ["uint8", "uint16", "uint16"], [], "nonpayable"),
+    ],
+    "OrionEncryptedVault": [
+        {
+            "type": "function",
+            "name": "submitIntent",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {
+                    "name": "intent",
+                    "type": "tuple[]",
+                    "components": [
+                        {"name": "token", "type": "address"},
+                        {"name": "weight", "type": "bytes32"},
+                    ],
+                },
+                {"name": "inputProof", "type": "bytes"},
+            ],
+            "outputs": [],
+        },
+    ],
+    "TransparentVaultFactory": [
+        _function(
+            "createVault",
+            ["address", "string", "string", "uint8", "uint16", "uint16"],
+            ["address"],
+            "nonpayable",
+        ),
+    ],
+}
+
+
+def _split_types(types: str) -> list[str]:
+    """Split a comma-separated ABI type list, keeping tuple types whole."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(types):
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        if char == "," and depth == 0:
+            parts.append(types[start:i])
+            start = i + 1
+    return parts + [types[start:]] if types else []
+
+
+class StubRPC:
+    """In-process JSON-RPC server standing in for an Ethereum node.
+
+    Handlers are registered per JSON-RPC method; ``eth_call`` is further
+    dispatched on the 4-byte selector of the called function. HTTP statuses
+    appended to ``http_errors`` answer the next requests instead, 429s with a
+    ``retry_after`` header.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        """Start the server on an ephemeral localhost port."""
+        self.delay = delay
+        self.http_errors: list[int] = []
+        self.retry_after: float | None = None
+        self.calls = Counter()
+        self.contract_calls = Counter()
+        self.requests = 0
+        self.connections = set()
+        self.handlers = {
+            "eth_chainId": lambda params: hex(11155111),
+            "eth_blockNumber": lambda params: hex(1),
+            "eth_call": self._eth_call,
+        }
+        self._selectors = {}
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                stub.connections.add(self.client_address)
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                status = stub.http_error()
+                if status is not None:
+                    self.send_response(status)
+                    if status == 429 and stub.retry_after is not None:
+                        self.send_header("Retry-After", str(stub.retry_after))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                payload = stub.handle(json.loads(body))
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """HTTP endpoint of the stub."""
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def close(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def on(self, method: str, handler):
+        """Register ``handler(params)`` for a JSON-RPC method."""
+        self.handlers[method] = handler
+
+    def on_call(self, signature: str, output_types: list[str], handler):
+        """Register a contract function by signature, e.g. ``isWhitelisted(address)``.
+
+        ``handler`` receives the decoded arguments and returns the output values;
+        a non-callable is returned as a constant single output.
+        """
+        input_types = _split_types(signature[signature.index("(") + 1 : -1])
+        if not callable(handler):
+            value = handler
+            handler = lambda *args: (value,)  # noqa: E731
+        selector = "0x" + function_signature_to_4byte_selector(signature).hex()
+        self._selectors[selector] = (signature, input_types, output_types, handler)
+
+    def _eth_call(self, params):
+        data = params[0].get("data") or params[0].get("input")
+        signature, input_types, output_types, handler = self._selectors[data[:10]]
+        with self._lock:
+            self.contract_calls[signature] += 1
+        args = decode(input_types, bytes.fromhex(data[10:]))
+        return "0x" + encode(output_types, list(handler(*args))).hex()
+
+    def _dispatch(self, request):
+        method = request["method"]
+        with self._lock:
+            self.calls[method] += 1
+        try:
+            result = self.handlers[method](request.get("params", []))
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": str(e)},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def http_error(self) -> int | None:
+        """Pop the HTTP status injected for the next request, if any."""
+        with self._lock:
+            if not self.http_errors:
+                return None
+            self.requests += 1
+            return self.http_errors.pop(0)
+
+    def handle(self, payload):
+        """Answer a single or batched JSON-RPC payload."""
+        with self._lock:
+            self.requests += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if isinstance(payload, list):
+            return [self._dispatch(request) for request in payload]
+        return self._dispatch(payload)
+
+
+class StubChain:
+    """Minimal chain state behind a StubRPC: accounts, nonces and receipts.
+
+    Accepted transactions are mined immediately, each in its own block, unless
+    ``auto_mine`` is off, in which case they wait for ``mine()``. A transaction
+    reusing a nonce is rejected with "nonce too low".
+    """
+
+    def __init__(self, rpc: StubRPC):
+        """Install the transaction-related handlers on the stub node."""
+        self.rpc = rpc
+        self.block_number = 0
+        self.used_nonces: dict[str, set[int]] = {}
+        self.transactions: list[dict] = []
+        self.receipts: dict[str, dict] = {}
+        self.mempool: list[dict] = []
+        self.auto_mine = True
+        self.gas_used = 50_000
+        self._lock = threading.Lock()
+
+        rpc.on("eth_getTransactionCount", self._get_transaction_count)
+        rpc.on("eth_sendRawTransaction", self._send_raw_transaction)
+        rpc.on("eth_getTransactionReceipt", self._get_transaction_receipt)
+        rpc.on("eth_estimateGas", lambda params: hex(self.gas_used))
+        rpc.on("eth_gasPrice", lambda params: hex(10**9))
+        rpc.on("eth_blockNumber", lambda params: hex(self.block_number))
+
+    def transaction_count(self, address: str) -> int:
+        """Lowest nonce not yet used by an address."""
+        used = self.used_nonces.get(address.lower(), set())
+        count = 0
+        while count in used:
+            count += 1
+        return count
+
+    def use_nonce(self, address: str, nonce: int):
+        """Consume a nonce, as a transaction sent outside the SDK would."""
+        with self._lock:
+            used = self.used_nonces.setdefault(address.lower(), set())
+            if nonce in used:
+                raise ValueError(f"nonce too low: nonce {nonce} already used")
+            used.add(nonce)
+
+    def _get_transaction_count(self, params):
+        return hex(self.transaction_count(params[0]))
+
+    def _send_raw_transaction(self, params):
+        raw = bytes.fromhex(params[0][2:])
+        fields = rlp.decode(raw[1:]) if raw[0] < 0x80 else rlp.decode(raw)
+        nonce = int.from_bytes(fields[1] if raw[0] < 0x80 else fields[0], "big")
+        to = "0x" + (fields[5] if raw[0] < 0x80 else fields[3]).hex()
+        gas = int.from_bytes(fields[4] if raw[0] < 0x80 else fields[2], "big")
+        if raw[0] < 0x80:
+            fees = {
+                "maxPriorityFeePerGas": int.from_bytes(fields[2], "big"),
+                "maxFeePerGas": int.from_bytes(fields[3], "big"),
+            }
+        else:
+            fees = {"gasPrice": int.from_bytes(fields[1], "big")}
+        sender = Account.recover_transaction(raw)
+        self.use_nonce(sender, nonce)
+
+        tx_hash = "0x" + keccak(raw).hex()
+        with self._lock:
+            self.transactions.append(
+                {
+                    "hash": tx_hash,
+                    "from": sender,
+                    "nonce": nonce,
+                    "to": to,
+                    "gas": gas,
+                    **fees,
+                }
+            )
+            self.mempool.append({"hash": tx_hash, "from": sender})
+        if self.auto_mine:
+            self.mine()
+        return tx_hash
+
+    def mine(self):
+        """Mine every transaction in the mempool, each in its own block."""
+        with self._lock:
+            for tx in self.mempool:
+                self.block_number += 1
+                self.receipts[tx["hash"]] = {
+                    "transactionHash": tx["hash"],
+                    "transactionIndex": "0x0",
+                    "blockHash": "0x" + f"{self.block_number:064x}",
+                    "blockNumber": hex(self.block_number),
+                    "from": tx["from"],
+                    "to": None,
+                    "cumulativeGasUsed": hex(self.gas_used),
+                    "gasUsed": hex(self.gas_used),
+                    "effectiveGasPrice": hex(10**9),
+                    "contractAddress": None,
+                    "logs": [],
+                    "logsBloom": "0x" + "00" * 256,
+                    "status": "0x1",
+                    "type": "0x0",
+                }
+            self.mempool.clear()
+
+    def _get_transaction_receipt(self, params):
+        return self.receipts.get(params[0])
+
+
+@pytest.fixture
+def stub_rpc(monkeypatch):
+    """Stub node exported through ``RPC_URL``."""
+    rpc = StubRPC()
+    from orion_finance_sdk.connection import close_connections
+
+    monkeypatch.setenv("RPC_URL", rpc.url)
+    yield rpc
+    close_connections()
+    rpc.close()
+
+
+@pytest.fixture
+def stub_chain(stub_rpc):
+    """Chain state served by the stub node."""
+    return StubChain(stub_rpc)
+
+
+@pytest.fixture
+def abis(monkeypatch):
+    """Serve the minimal ABIs above instead of the downloaded artifacts."""
+    import orion_finance_sdk.contracts as contracts
+
+    monkeypatch.setattr(contracts, "load_contract_abi", lambda name: ABIS[name])
+    return ABIS
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk SDK caches inside the test's temporary directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("ORION_CACHE_DIR", str(path))
+    return path
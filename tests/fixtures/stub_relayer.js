@@ -0,0 +1,36 @@
+// Stand-in for @zama-fhe/relayer-sdk/node: a slow instance creation, as when
+// downloading FHE keys, and deterministic fake handles and proofs.
+const startupMs = Number(process.env.STUB_RELAYER_STARTUP_MS || 0);
+
+exports.SepoliaConfig = {};
+
+exports.createInstance = async () => {
+  await new Promise((resolve) => setTimeout(resolve, startupMs));
+  return {
+    createEncryptedInput(vaultAddress, curatorAddress) {
+      const values = [];
+      return {
+        add128(value) {
+          if (value === 'crash') {
+            process.exit(3);
+          }
+          if (value < 0) {
+            throw new Error(`Cannot encrypt negative value ${value}`);
+          }
+          values.push(value);
+        },
+        async encrypt() {
+          return {
+            handles: values.map((value) =>
+              Buffer.from(value.toString(16).padStart(64, '0'), 'hex'),
+            ),
+            inputProof: Buffer.from(
+              vaultAddress.slice(2) + curatorAddress.slice(2),
+              'hex',
+            ),
+          };
+        },
+      };
+    },
+  };
+};
@@ -0,0 +1,123 @@
+"""Property tests of the exact largest-remainder allocator."""
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from orion_finance_sdk.utils import allocate_units, round_with_fixed_sum
+
+N_CASES = 500
+
+
+def _random_weights(rng: random.Random) -> list:
+    n = rng.choice([1, 2, 5, 20, 100, 500])
+    kind = rng.choice(["float", "rounded", "int", "decimal", "dust"])
+    if kind == "float":
+        return [rng.random() + 1e-12 for _ in range(n)]
+    if kind == "rounded":
+        weights = [rng.random() + 0.001 for _ in range(n)]
+        return [round(weight / sum(weights), 6) or 1e-6 for weight in weights]
+    if kind == "int":
+        return [rng.randint(0, 10) for _ in range(n - 1)] + [1]
+    if kind == "decimal":
+        return [Decimal(rng.randint(1, 10**6)) / 10**6 for _ in range(n)]
+    return [rng.randint(1, 10) / 10**9 for _ in range(n - 1)] + [0.9]
+
+
+def _intent_weights(rng: random.Random, n: int, places: int = 8) -> list[float]:
+    """Weights as written in an intent file: few decimals, summing to 1."""
+    parts = [rng.randint(1, 10**6) for _ in range(n)]
+    units = [part * 10**places // sum(parts) for part in parts]
+    units[-1] += 10**places - sum(units)
+    return [unit / 10**places for unit in units]
+
+
+def _exact_shares(weights: list, total_units: int) -> list[Fraction]:
+    fractions = [
+        Fraction(repr(w)) if type(w) is float else Fraction(w) for w in weights
+    ]
+    weight_sum = sum(fractions)
+    return [total_units * fraction / weight_sum for fraction in fractions]
+
+
+def test_allocation_properties():
+    """Random intents: exact sum, every part within one unit of its exact share."""
+    rng = random.Random(20240901)
+    for _ in range(N_CASES):
+        weights = _random_weights(rng)
+        total_units = 10 ** rng.choice([0, 2, 6, 9, 18, 27])
+        units = allocate_units(weights, total_units)
+
+        assert sum(units) == total_units
+        assert all(isinstance(unit, int) and unit >= 0 for unit in units)
+        for unit, share in zip(units, _exact_shares(weights, total_units)):
+            assert share - 1 < unit < share + 1
+            assert unit in (share.__floor__(), share.__ceil__())
+
+        # Deterministic, and scaling the weights does not change the result.
+        assert allocate_units(weights, total_units) == units
+        if all(type(w) is int for w in weights):
+            assert allocate_units([3 * w for w in weights], total_units) == units
+
+
+def test_leftover_goes_to_largest_remainders():
+    """Units left after flooring go to the largest remainders."""
+    assert allocate_units([0.26, 0.26, 0.48], 10) == [3, 2, 5]
+    assert allocate_units([0.2, 0.35, 0.45], 10) == [2, 4, 4]
+
+
+def test_ties_go_to_the_earliest_weights():
+    """Equal remainders are resolved by position, not by value or hash order."""
+    assert allocate_units([1, 1, 1], 2) == [1, 1, 0]
+    assert allocate_units([1, 1, 1, 1], 6) == [2, 2, 1, 1]
+
+
+def test_floats_are_read_as_written():
+    """Decimal weights allocate exactly at 18 decimals, without float drift."""
+    assert allocate_units([0.1, 0.2, 0.7], 10**18) == [
+        10**17,
+        2 * 10**17,
+        7 * 10**17,
+    ]
+    weights = [0.123456789012345678, 0.876543210987654322]
+    assert sum(allocate_units(weights, 10**18)) == 10**18
+
+
+def _reference_allocation(weights: list, total_units: int) -> list[int]:
+    shares = _exact_shares(weights, total_units)
+    units = [share.__floor__() for share in shares]
+    order = sorted(range(len(shares)), key=lambda i: shares[i] - units[i], reverse=True)
+    for i in order[: total_units - sum(units)]:
+        units[i] += 1
+    return units
+
+
+def test_short_and_long_decimals_agree():
+    """Weights read by scaling and by parsing their repr allocate alike."""
+    rng = random.Random(11)
+    for _ in range(N_CASES // 5):
+        weights = _intent_weights(rng, rng.choice([2, 5, 50]), rng.randint(1, 15))
+        # 0.1 + 0.2 has a 17-digit repr, so the whole intent is parsed.
+        for intent in (weights, [*weights, 0.1 + 0.2]):
+            for total_units in (10**6, 10**9, 10**18):
+                assert allocate_units(intent, total_units) == _reference_allocation(
+                    intent, total_units
+                )
+    assert allocate_units([0.07, 0.29, 0.64], 100) == [7, 29, 64]
+
+
+def test_invalid_weights():
+    """Negative or all-zero weights cannot be allocated."""
+    with pytest.raises(ValueError):
+        allocate_units([0.5, -0.1], 10)
+    with pytest.raises(ValueError):
+        allocate_units([0, 0.0], 10)
+    with pytest.raises(ValueError):
+        allocate_units([], 10)
+
+
+def test_round_with_fixed_sum():
+    """Scaled values round to integers summing to the (default) target."""
+    assert round_with_fixed_sum([1.4, 1.4, 1.2]) == [2, 1, 1]
+    assert round_with_fixed_sum([2.5, 2.5], 6) == [3, 3]
@@ -0,0 +1,60 @@
+"""Tests for the asyncio contract classes."""
+
+import asyncio
+
+from eth_account import Account
+from orion_finance_sdk.async_contracts import (
+    AsyncOrionConfig,
+    AsyncOrionTransparentVault,
+)
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+
+def test_reads_are_gathered_concurrently(stub_rpc, abis):
+    """Config reads can be awaited together."""
+    stub_rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+    stub_rpc.on_call("getAllWhitelistedAssets()", ["address[]"], [TOKEN])
+    stub_rpc.on_call("getAllOrionVaults(uint8)", ["address[]"], lambda t: ([VAULT],))
+    stub_rpc.on_call("isWhitelisted(address)", ["bool"], True)
+
+    async def main():
+        config = AsyncOrionConfig()
+        try:
+            return await asyncio.gather(
+                config.curator_intent_decimals,
+                config.whitelisted_asset_set,
+                config.orion_transparent_vaults,
+                config.is_whitelisted(TOKEN),
+            )
+        finally:
+            await config.w3.provider.disconnect()
+
+    decimals, whitelist, vaults, whitelisted = asyncio.run(main())
+
+    assert decimals == 9
+    assert whitelist == {TOKEN}
+    assert [vault.lower() for vault in vaults] == [VAULT]
+    assert whitelisted is True
+
+
+def test_concurrent_async_submissions(stub_chain, abis, monkeypatch):
+    """Submissions awaited together from one key get distinct nonces."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+
+    async def main():
+        vault = AsyncOrionTransparentVault()
+        try:
+            return await asyncio.gather(
+                *(vault.submit_order_intent({TOKEN: i}) for i in range(10))
+            )
+        finally:
+            await vault.w3.provider.disconnect()
+
+    results = asyncio.run(main())
+
+    assert all(result.receipt["status"] == 1 for result in results)
+    assert sorted(tx["nonce"] for tx in stub_chain.transactions) == list(range(10))
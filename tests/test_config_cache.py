@@ -0,0 +1,130 @@
+"""Tests for the OrionConfig read-through cache."""
+
+import pytest
+from orion_finance_sdk import config_cache
+from orion_finance_sdk.config_cache import ConfigCache
+from orion_finance_sdk.connection import close_connections
+from orion_finance_sdk.contracts import OrionConfig
+
+VAULTS = ["0x" + "11" * 20, "0x" + "22" * 20]
+
+
+@pytest.fixture
+def config_rpc(stub_rpc, abis):
+    """Stub node serving OrionConfig reads."""
+    stub_rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+    stub_rpc.on_call("getAllWhitelistedAssets()", ["address[]"], [VAULTS[0]])
+    stub_rpc.on_call("getAllOrionVaults(uint8)", ["address[]"], VAULTS)
+    return stub_rpc
+
+
+def test_reads_are_cached_across_instances(config_rpc):
+    """Repeated reads, from any instance on the connection, cost one call each."""
+    for _ in range(10):
+        config = OrionConfig()
+        assert config.curator_intent_decimals == 9
+        assert len(config.orion_transparent_vaults) == 2
+
+    assert config_rpc.contract_calls["curatorIntentDecimals()"] == 1
+    assert config_rpc.contract_calls["getAllOrionVaults(uint8)"] == 1
+
+
+def test_ttl_expiry(config_rpc, monkeypatch):
+    """Values are read again once their field's TTL has elapsed."""
+    now = [1000.0]
+    monkeypatch.setattr(config_cache.time, "time", lambda: now[0])
+    config = OrionConfig(cache_ttls={"whitelisted_assets": 10})
+
+    config.whitelisted_assets
+    now[0] += 5
+    config.whitelisted_assets
+    assert config_rpc.contract_calls["getAllWhitelistedAssets()"] == 1
+
+    now[0] += 10
+    config.whitelisted_assets
+    assert config_rpc.contract_calls["getAllWhitelistedAssets()"] == 2
+
+
+def test_zero_ttl_disables_caching(config_rpc):
+    """A TTL of 0 reads the field from the chain every time."""
+    config = OrionConfig(cache_ttls={"curator_intent_decimals": 0})
+
+    config.curator_intent_decimals
+    config.curator_intent_decimals
+
+    assert config_rpc.contract_calls["curatorIntentDecimals()"] == 2
+
+
+def test_ttl_overrides_are_per_instance(config_rpc):
+    """An instance's TTLs do not change cache freshness for other instances."""
+    OrionConfig(cache_ttls={"curator_intent_decimals": 0}).curator_intent_decimals
+
+    for _ in range(3):
+        assert OrionConfig().curator_intent_decimals == 9
+
+    assert config_rpc.contract_calls["curatorIntentDecimals()"] == 2
+
+
+def test_refresh(config_rpc):
+    """refresh() drops the given fields, or all of them."""
+    config = OrionConfig()
+    config.curator_intent_decimals
+    config.whitelisted_assets
+
+    config.refresh("whitelisted_assets")
+    config.curator_intent_decimals
+    config.whitelisted_assets
+    assert config_rpc.contract_calls["curatorIntentDecimals()"] == 1
+    assert config_rpc.contract_calls["getAllWhitelistedAssets()"] == 2
+
+    config.refresh()
+    config.curator_intent_decimals
+    assert config_rpc.contract_calls["curatorIntentDecimals()"] == 2
+
+
+def test_block_number_invalidation():
+    """Only values read before the given block are dropped."""
+    cache = ConfigCache("key")
+    cache.get("orion_transparent_vaults", lambda: (["old"], 10))
+    cache.get("orion_encrypted_vaults", lambda: (["new"], 20))
+
+    cache.invalidate(block_number=15)
+
+    assert cache.get("orion_transparent_vaults", lambda: (["fresh"], 21)) == ["fresh"]
+    assert cache.get("orion_encrypted_vaults", lambda: (["fresh"], 21)) == ["new"]
+
+
+def test_persistence_between_processes(config_rpc, monkeypatch):
+    """With persistence enabled, a new connection reuses values read by an earlier one."""
+    monkeypatch.setenv("ORION_CONFIG_CACHE_PERSIST", "1")
+    assert OrionConfig().orion_transparent_vaults == VAULTS
+
+    close_connections()  # A new connection gets a new in-memory cache
+    assert OrionConfig().orion_transparent_vaults == VAULTS
+    assert config_rpc.contract_calls["getAllOrionVaults(uint8)"] == 1
+
+
+def test_vault_type_resolution(config_rpc):
+    """Vault types are resolved from one read of each list, case-insensitively."""
+    from orion_finance_sdk.types import VaultType
+
+    transparent = [f"0x{i + 1:040x}" for i in range(500)]
+    encrypted = ["0x" + "ab" * 20]
+    config_rpc.on_call(
+        "getAllOrionVaults(uint8)",
+        ["address[]"],
+        lambda kind: (transparent if kind == 0 else encrypted,),
+    )
+    config = OrionConfig()
+
+    assert config.vault_type(transparent[-1]) == VaultType.TRANSPARENT
+    assert config.vault_type(encrypted[0].upper().replace("0X", "0x")) == (
+        VaultType.ENCRYPTED
+    )
+    for vault in transparent:
+        assert config.vault_type(vault) == VaultType.TRANSPARENT
+    assert config_rpc.contract_calls["getAllOrionVaults(uint8)"] == 2
+
+    # Unknown addresses re-read the lists once, for newly deployed vaults.
+    assert config.vault_type("0x" + "cd" * 20) is None
+    assert config_rpc.contract_calls["getAllOrionVaults(uint8)"] == 4
@@ -0,0 +1,40 @@
+"""Tests for the shared Web3 connection registry."""
+
+from orion_finance_sdk.connection import close_connections, get_web3
+from orion_finance_sdk.contracts import OrionConfig
+
+
+def test_contracts_share_one_connection(stub_rpc, abis):
+    """Contract objects on the same RPC URL reuse one provider and TCP connection."""
+    stub_rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+
+    configs = [OrionConfig() for _ in range(3)]
+    for config in configs:
+        assert config.curator_intent_decimals == 9
+
+    assert configs[0].w3 is configs[1].w3 is configs[2].w3
+    assert len(stub_rpc.connections) == 1
+
+
+def test_get_web3_is_keyed_by_url(stub_rpc):
+    """Distinct RPC URLs get distinct connections; closing resets the registry."""
+    w3 = get_web3(stub_rpc.url)
+    assert get_web3(stub_rpc.url) is w3
+    assert get_web3(stub_rpc.url + "/other") is not w3
+
+    close_connections()
+    assert get_web3(stub_rpc.url) is not w3
+
+
+def test_get_web3_pool_configuration(stub_rpc, monkeypatch):
+    """Pool size and timeout are read from the environment."""
+    monkeypatch.setenv("ORION_RPC_POOL_SIZE", "3")
+    monkeypatch.setenv("ORION_RPC_TIMEOUT", "5")
+
+    w3 = get_web3(stub_rpc.url)
+
+    assert w3.provider.get_request_kwargs()["timeout"] == 5.0
+    session = w3.provider._request_session_manager.cache_and_return_session(
+        stub_rpc.url
+    )
+    assert session.get_adapter(stub_rpc.url)._pool_maxsize == 3
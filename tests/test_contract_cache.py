@@ -0,0 +1,97 @@
+"""Tests for the memoized ABI and contract-object cache."""
+
+import json
+import time
+
+import pytest
+from orion_finance_sdk import contracts
+from orion_finance_sdk.async_contracts import AsyncOrionConfig
+from orion_finance_sdk.contracts import OrionConfig, OrionSmartContract, get_contract
+
+N_FUNCTIONS = 200
+N_INSTANCES = 50
+
+
+def _function(i: int) -> dict:
+    return {
+        "type": "function",
+        "name": f"function{i}",
+        "stateMutability": "view",
+        "inputs": [{"name": "account", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    }
+
+
+@pytest.fixture
+def package_abis(tmp_path, monkeypatch, stub_rpc):
+    """Serve a large OrionConfig ABI from the packaged abis directory."""
+    (tmp_path / "abis").mkdir()
+    abi = [_function(i) for i in range(N_FUNCTIONS)]
+    (tmp_path / "abis" / "OrionConfig.json").write_text(json.dumps({"abi": abi}))
+    monkeypatch.setattr(contracts.resources, "files", lambda package: tmp_path)
+    contracts.load_contract_abi.cache_clear()
+    yield abi
+    contracts.load_contract_abi.cache_clear()
+
+
+def test_abi_is_parsed_once(package_abis, monkeypatch):
+    """Repeated loads of an ABI reuse the parsed list."""
+    loads = []
+    json_load = contracts.json.load
+    monkeypatch.setattr(
+        contracts.json, "load", lambda f: loads.append(f) or json_load(f)
+    )
+
+    first = contracts.load_contract_abi("OrionConfig")
+    second = contracts.load_contract_abi("OrionConfig")
+
+    assert first is second
+    assert len(loads) == 1
+
+
+def test_contract_object_is_shared_per_connection(package_abis):
+    """Instances on one connection share the contract object and event index."""
+    first = OrionConfig()
+    second = OrionConfig()
+
+    assert first.contract is second.contract
+    assert first.w3 is second.w3
+
+
+def test_contract_cache_normalises_addresses(package_abis):
+    """Lower-case and checksum spellings of an address share one entry."""
+    checksum = OrionSmartContract("OrionConfig", "0x" + "ab" * 20).contract
+
+    assert get_contract(checksum.w3, "OrionConfig", "0x" + "AB" * 20) is checksum
+
+
+def test_sync_and_async_connections_do_not_share(package_abis):
+    """AsyncWeb3 connections get their own async contract objects."""
+    sync_contract = OrionConfig().contract
+    async_contract = AsyncOrionConfig().contract
+
+    assert async_contract is not sync_contract
+    assert type(async_contract).__name__ == "AsyncContract"
+
+
+def test_cached_instantiation_is_faster(package_abis):
+    """Building N contract wrappers is far cheaper once the ABI and object are cached."""
+    w3 = OrionConfig().w3
+
+    start = time.perf_counter()
+    for _ in range(N_INSTANCES):
+        contracts.load_contract_abi.cache_clear()
+        contracts._contracts.pop(w3, None)
+        OrionConfig()
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(N_INSTANCES):
+        OrionConfig()
+    cached = time.perf_counter() - start
+
+    print(
+        f"\n{N_INSTANCES} OrionConfig instantiations ({N_FUNCTIONS} functions): "
+        f"cold {cold * 1000:.1f} ms, cached {cached * 1000:.1f} ms"
+    )
+    assert cached * 5 < cold
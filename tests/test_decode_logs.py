@@ -0,0 +1,117 @@
+"""Tests for decoding receipt logs through the topic0 event index."""
+
+import time
+
+import pytest
+from eth_abi import encode
+from eth_utils import event_signature_to_log_topic
+from hexbytes import HexBytes
+from orion_finance_sdk.contracts import OrionSmartContract
+from web3.datastructures import AttributeDict
+
+CONTRACT = "0x" + "55" * 20
+N_EVENTS = 20
+N_LOGS = 500
+
+ABI = [
+    {
+        "type": "event",
+        "name": f"Event{i}",
+        "anonymous": False,
+        "inputs": [
+            {"name": "account", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    }
+    for i in range(N_EVENTS)
+]
+
+
+def _log(event: int, value: int, address: str = CONTRACT, log_index: int = 0):
+    topic0 = event_signature_to_log_topic(f"Event{event}(address,uint256)")
+    return AttributeDict(
+        {
+            "address": address,
+            "topics": [HexBytes(topic0), HexBytes(b"\0" * 12 + b"\x66" * 20)],
+            "data": HexBytes(encode(["uint256"], [value])),
+            "blockHash": HexBytes(b"\1" * 32),
+            "blockNumber": 1,
+            "logIndex": log_index,
+            "transactionHash": HexBytes(b"\2" * 32),
+            "transactionIndex": 0,
+        }
+    )
+
+
+@pytest.fixture
+def contract(stub_rpc, monkeypatch):
+    """Contract object with many events."""
+    import orion_finance_sdk.contracts as contracts
+
+    monkeypatch.setattr(contracts, "load_contract_abi", lambda name: ABI)
+    return OrionSmartContract("Events", CONTRACT)
+
+
+def _legacy_decode_logs(contract, receipt):
+    """Reference implementation trying every event on every log."""
+    decoded_logs = []
+    for log in receipt.logs:
+        if log.address.lower() != contract.contract_address.lower():
+            continue
+        for event in contract.contract.events:
+            try:
+                decoded_logs.append(event.process_log(log))
+                break
+            except Exception:
+                continue
+    return decoded_logs
+
+
+def test_decode_logs(contract):
+    """Logs are decoded by topic0; foreign and unknown logs are skipped."""
+    unknown = _log(0, 1)
+    unknown = AttributeDict({**unknown, "topics": [HexBytes(b"\x09" * 32)]})
+    receipt = AttributeDict(
+        {
+            "logs": [
+                _log(3, 42),
+                _log(3, 43, address="0x" + "77" * 20),
+                unknown,
+                AttributeDict({**unknown, "topics": []}),
+                _log(19, 44, log_index=4),
+            ]
+        }
+    )
+
+    decoded = contract._decode_logs(receipt)
+
+    assert [(log["event"], log["args"]["value"]) for log in decoded] == [
+        ("Event3", 42),
+        ("Event19", 44),
+    ]
+    assert decoded[1]["logIndex"] == 4
+    assert decoded[0]["args"]["account"] == "0x" + "66" * 20
+
+
+def test_decode_logs_benchmark(contract):
+    """Benchmark the topic0 index against trying every event per log."""
+    receipt = AttributeDict(
+        {"logs": [_log(i % N_EVENTS, i, log_index=i) for i in range(N_LOGS)]}
+    )
+
+    start = time.perf_counter()
+    legacy = _legacy_decode_logs(contract, receipt)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = contract._decode_logs(receipt)
+    indexed_time = time.perf_counter() - start
+
+    print(
+        f"\n{N_LOGS} logs: per-event scan {legacy_time * 1e3:.1f} ms, "
+        f"topic0 index {indexed_time * 1e3:.1f} ms"
+    )
+    assert [log["args"]["value"] for log in indexed] == [
+        log.args.value for log in legacy
+    ]
+    assert indexed_time < legacy_time
@@ -0,0 +1,195 @@
+"""Tests for order intent encryption through the Node entry point."""
+
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from orion_finance_sdk import encrypt
+from orion_finance_sdk.encrypt import (
+    EncryptionWorker,
+    encrypt_order_intent,
+    encrypt_order_intents_batch,
+)
+
+ROOT = Path(__file__).parent.parent
+VAULT = "0x" + "11" * 20
+CURATOR = "0x" + "22" * 20
+STARTUP_MS = 300
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+
+
+@pytest.fixture
+def js_entry(tmp_path, monkeypatch):
+    """The SDK entry point wired to a stub relayer with slow instance creation."""
+    relayer = tmp_path / "node_modules" / "@zama-fhe" / "relayer-sdk"
+    relayer.mkdir(parents=True)
+    shutil.copy(
+        Path(__file__).parent / "fixtures" / "stub_relayer.js", relayer / "node.js"
+    )
+    entry = tmp_path / "index.js"
+    shutil.copy(ROOT / "js" / "src" / "index.js", entry)
+
+    monkeypatch.setattr(encrypt, "_js_entry", lambda: str(entry))
+    monkeypatch.setenv("STUB_RELAYER_STARTUP_MS", str(STARTUP_MS))
+    monkeypatch.setenv("CURATOR_ADDRESS", CURATOR)
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    # A process-wide worker of its own, started with this entry point.
+    monkeypatch.setattr(encrypt, "_worker", None)
+    yield str(entry)
+    if encrypt._worker is not None:
+        encrypt._worker.close()
+
+
+@pytest.fixture
+def broken_worker(tmp_path, monkeypatch):
+    """Process-wide worker whose Node process exits on startup."""
+    worker = EncryptionWorker(js_entry=str(tmp_path / "missing.js"))
+    monkeypatch.setattr(encrypt, "get_encryption_worker", lambda: worker)
+    return worker
+
+
+def _handle(value: int) -> str:
+    return "0x" + f"{value:064x}"
+
+
+def test_encrypt_order_intent(js_entry):
+    """Encryption returns one handle per token and the input proof."""
+    encrypted, proof = encrypt_order_intent({"0xa": 7, "0xb": 9})
+
+    assert encrypted == {"0xa": _handle(7), "0xb": _handle(9)}
+    assert proof == VAULT + CURATOR[2:]
+    # The process-wide worker stays warm for the next intent.
+    assert encrypt.get_encryption_worker().running
+
+
+def test_encrypt_order_intent_falls_back_to_one_shot(js_entry, broken_worker):
+    """A worker that cannot start leaves the encryption to a one-shot process."""
+    encrypted, proof = encrypt_order_intent({"0xa": 7})
+
+    assert encrypted == {"0xa": _handle(7)}
+    assert proof == VAULT + CURATOR[2:]
+    assert not broken_worker.running
+
+
+def test_rejected_request_is_not_retried(js_entry, monkeypatch):
+    """An error of the request itself is raised, without a one-shot retry."""
+
+    def run_node(payload):
+        raise AssertionError("retried in a one-shot process")
+
+    monkeypatch.setattr(encrypt, "_run_node", run_node)
+    with pytest.raises(encrypt.EncryptionError, match="negative"):
+        encrypt_order_intent({"0xa": -1})
+
+
+def test_worker_multiplexes_concurrent_requests(js_entry):
+    """Concurrent requests through one worker each get their own response."""
+    with EncryptionWorker() as worker:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda i: worker.encrypt_order_intent({"0xa": i, "0xb": i + 1}),
+                    range(20),
+                )
+            )
+
+    for i, (encrypted, _) in enumerate(results):
+        assert encrypted == {"0xa": _handle(i), "0xb": _handle(i + 1)}
+    assert not worker.running
+
+
+def test_worker_reports_errors_per_request(js_entry):
+    """A failing request does not affect the worker or other requests."""
+    with EncryptionWorker() as worker:
+        with pytest.raises(RuntimeError, match="negative"):
+            worker.submit(VAULT, CURATOR, [-1]).result(timeout=10)
+        assert worker.submit(VAULT, CURATOR, [1]).result(timeout=10)[
+            "encryptedValues"
+        ] == [_handle(1)]
+
+
+def test_worker_restarts_after_crash(js_entry):
+    """Requests in flight fail when the worker dies; the next one restarts it."""
+    with EncryptionWorker() as worker:
+        with pytest.raises(RuntimeError, match="exited with code 3"):
+            worker.submit(VAULT, CURATOR, ["crash"]).result(timeout=10)
+        encrypted, _ = worker.encrypt_order_intent({"0xa": 5})
+        assert encrypted == {"0xa": _handle(5)}
+
+
+def test_worker_is_spawned_once_and_reused(js_entry, monkeypatch):
+    """Successive intents share one warm Node process, without one-shot runs."""
+    spawned = []
+    popen = subprocess.Popen
+
+    def spawn(*args, **kwargs):
+        spawned.append(args[0])
+        return popen(*args, **kwargs)
+
+    def run_node(payload, timeout=None):
+        raise AssertionError("ran a one-shot process")
+
+    monkeypatch.setattr(subprocess, "Popen", spawn)
+    monkeypatch.setattr(encrypt, "_run_node", run_node)
+    for i in range(3):
+        encrypted, _ = encrypt_order_intent({"0xa": i})
+        assert encrypted == {"0xa": _handle(i)}
+    encrypt_order_intents_batch([(VAULT, CURATOR, {"0xb": 4})])
+
+    assert len(spawned) == 1
+    assert "--worker" in spawned[0]
+
+
+def test_timeout_is_not_retried(js_entry, monkeypatch):
+    """A request outliving the worker timeout raises instead of running twice."""
+    worker = EncryptionWorker(timeout=STARTUP_MS / 1e3 / 10)
+    monkeypatch.setattr(encrypt, "get_encryption_worker", lambda: worker)
+    one_shot = []
+    monkeypatch.setattr(encrypt, "_run_node", lambda *args: one_shot.append(args))
+
+    with worker:
+        with pytest.raises(TimeoutError, match="timed out"):
+            encrypt_order_intent({"0xa": 1})
+        with pytest.raises(TimeoutError, match="timed out"):
+            encrypt_order_intents_batch([(VAULT, CURATOR, {"0xa": 1})])
+
+    assert one_shot == []
+
+
+def test_one_shot_process_is_bounded(js_entry):
+    """The one-shot fallback gives up after the timeout too."""
+    payload = encrypt._encryption_payload({"0xa": 1})
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        encrypt._run_node(payload, timeout=STARTUP_MS / 1e3 / 10)
+
+
+@pytest.mark.parametrize("path", ["module", "worker", "fallback"])
+def test_encrypt_order_intents_batch(js_entry, request, path):
+    """A batch returns per-vault handles and proofs, and per-item errors."""
+    vaults = ["0x" + f"{i:02x}" * 20 for i in range(1, 4)]
+    requests = [
+        (vaults[0], CURATOR, {"0xa": 1, "0xb": 2}),
+        (vaults[1], CURATOR, {"0xa": -1}),
+        (vaults[2], CURATOR, {"0xc": 3}),
+    ]
+
+    if path == "worker":
+        with EncryptionWorker() as worker:
+            results = worker.encrypt_order_intents_batch(requests)
+    else:
+        if path == "fallback":
+            request.getfixturevalue("broken_worker")
+        results = encrypt_order_intents_batch(requests)
+
+    assert [result.vault_address for result in results] == vaults
+    assert results[0].encrypted_intent == {"0xa": _handle(1), "0xb": _handle(2)}
+    assert results[0].input_proof == vaults[0] + CURATOR[2:]
+    assert results[1].error is not None and "negative" in results[1].error
+    assert not results[1].error.startswith("Encryption failed")
+    assert results[1].encrypted_intent is None
+    assert results[2].encrypted_intent == {"0xc": _handle(3)}
+    assert results[2].error is None
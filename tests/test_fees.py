@@ -0,0 +1,123 @@
+"""Tests for EIP-1559 fee estimation."""
+
+import asyncio
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk.connection import get_async_web3, get_web3
+from orion_finance_sdk.contracts import OrionTransparentVault
+from orion_finance_sdk.fees import FeeOracle, get_fee_oracle
+from orion_finance_sdk.types import FeeStrategy
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+GWEI = 10**9
+BASE_FEE = 20 * GWEI  # Base fee of the next block
+
+
+def _fee_history(params):
+    """Ten blocks with 1, 2 and 5 gwei tips at the 10th, 50th and 90th percentiles."""
+    block_count = int(params[0], 16) if isinstance(params[0], str) else params[0]
+    return {
+        "oldestBlock": hex(100 - block_count + 1),
+        "baseFeePerGas": [hex(18 * GWEI)] * block_count + [hex(BASE_FEE)],
+        "gasUsedRatio": [0.5] * (block_count - 1) + [0.0],
+        # The empty last block reports zero tips, which must not drag the median.
+        "reward": [[hex(GWEI), hex(2 * GWEI), hex(5 * GWEI)]] * (block_count - 1)
+        + [["0x0", "0x0", "0x0"]],
+    }
+
+
+@pytest.fixture
+def vault(stub_chain, abis, monkeypatch):
+    """Transparent vault on the stub chain, with a curator key configured."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    monkeypatch.delenv("ORION_FEE_STRATEGY", raising=False)
+    return OrionTransparentVault()
+
+
+def test_strategies(stub_rpc):
+    """Each strategy pays its tip percentile plus its base fee headroom."""
+    stub_rpc.on("eth_feeHistory", _fee_history)
+    oracle = FeeOracle(get_web3(stub_rpc.url))
+
+    assert oracle.transaction_fees(FeeStrategy.CHEAP) == {
+        "maxFeePerGas": 25 * GWEI + GWEI,
+        "maxPriorityFeePerGas": GWEI,
+    }
+    assert oracle.transaction_fees(FeeStrategy.NORMAL) == {
+        "maxFeePerGas": 40 * GWEI + 2 * GWEI,
+        "maxPriorityFeePerGas": 2 * GWEI,
+    }
+    assert oracle.transaction_fees("fast") == {
+        "maxFeePerGas": 60 * GWEI + 5 * GWEI,
+        "maxPriorityFeePerGas": 5 * GWEI,
+    }
+    assert oracle.sample().block_number == 100
+    assert stub_rpc.calls["eth_feeHistory"] == 1
+
+
+def test_submissions_share_one_fee_sample(vault, stub_chain, monkeypatch):
+    """Transactions are EIP-1559 and priced from a single eth_feeHistory call."""
+    stub_chain.rpc.on("eth_feeHistory", _fee_history)
+    monkeypatch.setenv("ORION_FEE_STRATEGY", "fast")
+
+    for weight in range(3):
+        vault.submit_order_intent({TOKEN: weight})
+
+    assert [tx["maxFeePerGas"] for tx in stub_chain.transactions] == [65 * GWEI] * 3
+    assert stub_chain.rpc.calls["eth_feeHistory"] == 1
+    assert stub_chain.rpc.calls["eth_gasPrice"] == 0
+
+
+def test_stale_sample_is_refreshed(stub_rpc):
+    """A new sample is taken once the previous one is older than max_age."""
+    stub_rpc.on("eth_feeHistory", _fee_history)
+    oracle = FeeOracle(get_web3(stub_rpc.url), max_age=0)
+
+    oracle.transaction_fees()
+    oracle.transaction_fees()
+
+    assert stub_rpc.calls["eth_feeHistory"] == 2
+
+
+def test_legacy_fallback_without_fee_history(vault, stub_chain):
+    """Nodes without eth_feeHistory get legacy transactions at the gas price."""
+    for weight in range(3):
+        vault.submit_order_intent({TOKEN: weight})
+
+    assert [tx.get("gasPrice") for tx in stub_chain.transactions] == [GWEI] * 3
+    assert stub_chain.rpc.calls["eth_gasPrice"] == 1
+
+
+def test_legacy_fallback_without_base_fee(stub_rpc):
+    """Chains reporting no base fee are priced legacy and not sampled again."""
+    stub_rpc.on(
+        "eth_feeHistory",
+        lambda params: {"oldestBlock": "0x1", "baseFeePerGas": [], "gasUsedRatio": []},
+    )
+    stub_rpc.on("eth_gasPrice", lambda params: hex(3 * GWEI))
+    oracle = FeeOracle(get_web3(stub_rpc.url), max_age=0)
+
+    assert oracle.transaction_fees() == {"gasPrice": 3 * GWEI}
+    assert oracle.transaction_fees() == {"gasPrice": 3 * GWEI}
+    assert oracle.supports_eip1559 is False
+    assert stub_rpc.calls["eth_feeHistory"] == 1
+
+
+def test_async_oracle(stub_rpc):
+    """The async oracle prices transactions like the sync one."""
+    stub_rpc.on("eth_feeHistory", _fee_history)
+
+    async def fees():
+        oracle = get_fee_oracle(get_async_web3(stub_rpc.url))
+        return await asyncio.gather(*(oracle.transaction_fees() for _ in range(4)))
+
+    assert (
+        asyncio.run(fees())
+        == [{"maxFeePerGas": 42 * GWEI, "maxPriorityFeePerGas": 2 * GWEI}] * 4
+    )
+    assert stub_rpc.calls["eth_feeHistory"] == 1
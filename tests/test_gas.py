@@ -0,0 +1,97 @@
+"""Tests for the gas estimate cache."""
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk.contracts import OrionTransparentVault
+from orion_finance_sdk.gas import GasEstimateCache
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKENS = ["0x" + f"{i + 0x40:02x}" * 20 for i in range(3)]
+
+
+@pytest.fixture
+def vault(stub_chain, abis, monkeypatch):
+    """Transparent vault on the stub chain, with a curator key configured."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    return OrionTransparentVault()
+
+
+def test_estimates_need_agreeing_receipts():
+    """An estimate is served once enough receipts agree, with refund headroom."""
+    cache = GasEstimateCache("test")
+
+    cache.record("shape", {"status": 1, "gasUsed": 100_000})
+    assert cache.get("shape") is None
+    cache.record("shape", {"status": 1, "gasUsed": 96_000})
+    assert cache.get("shape") == 125_000
+    cache.record("shape", {"status": 1, "gasUsed": 150_000})
+    assert cache.get("shape") is None
+
+
+def test_failed_transaction_forgets_the_shape():
+    """A reverted transaction sends the next call back to eth_estimateGas."""
+    cache = GasEstimateCache("test")
+    for _ in range(2):
+        cache.record("shape", {"status": 1, "gasUsed": 100_000})
+
+    cache.record("shape", {"status": 0, "gasUsed": 125_000})
+
+    assert cache.get("shape") is None
+
+
+def test_persisted_samples(tmp_path):
+    """Samples persisted by one process are used by the next one."""
+    path = tmp_path / "gas_estimates.json"
+    cache = GasEstimateCache("network", path=path)
+    for _ in range(2):
+        cache.record("shape", {"status": 1, "gasUsed": 80_000})
+
+    assert GasEstimateCache("network", path=path).get("shape") == 100_000
+    assert GasEstimateCache("other", path=path).get("shape") is None
+
+
+def test_submissions_skip_estimate_gas(vault, stub_chain):
+    """Only the first submissions of an intent shape are simulated by the node."""
+    for weight in range(5):
+        vault.submit_order_intent({TOKENS[0]: weight, TOKENS[1]: 1})
+    assert stub_chain.rpc.calls["eth_estimateGas"] == 2
+
+    # A different number of tokens is a different shape.
+    vault.submit_order_intent(dict.fromkeys(TOKENS, 1))
+    assert stub_chain.rpc.calls["eth_estimateGas"] == 3
+
+    pending = vault.submit_order_intent({TOKENS[0]: 1, TOKENS[1]: 1}, wait=False)
+    pending.result()
+    assert stub_chain.rpc.calls["eth_estimateGas"] == 3
+
+
+def test_cached_estimate_is_not_padded_again(vault, stub_chain):
+    """The refund headroom of a cached estimate is the only margin applied."""
+    intent = {TOKENS[0]: 1, TOKENS[1]: 1}
+    for _ in range(3):
+        vault.submit_order_intent(intent)
+
+    estimated, _, cached = (tx["gas"] for tx in stub_chain.transactions)
+    assert estimated == int(stub_chain.gas_used * 1.2)
+    assert cached == stub_chain.gas_used * 5 // 4
+
+
+def test_rejected_transaction_falls_back_to_estimate_gas(vault, stub_chain):
+    """A transaction rejected with a cached estimate is estimated next time."""
+    intent = {TOKENS[0]: 1, TOKENS[1]: 1}
+    for _ in range(2):
+        vault.submit_order_intent(intent)
+    send = stub_chain.rpc.handlers["eth_sendRawTransaction"]
+
+    def reject(params):
+        raise ValueError("intrinsic gas too low")
+
+    stub_chain.rpc.on("eth_sendRawTransaction", reject)
+    with pytest.raises(Exception, match="intrinsic gas too low"):
+        vault.submit_order_intent(intent)
+    stub_chain.rpc.on("eth_sendRawTransaction", send)
+    vault.submit_order_intent(intent)
+
+    assert stub_chain.rpc.calls["eth_estimateGas"] == 3
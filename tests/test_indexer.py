@@ -0,0 +1,261 @@
+"""Tests for the incremental vault registry indexer."""
+
+import pytest
+from eth_abi import encode
+from eth_utils import event_signature_to_log_topic
+from orion_finance_sdk.connection import close_connections
+from orion_finance_sdk.indexer import VaultIndexer
+from orion_finance_sdk.types import VaultType
+from web3 import Web3
+
+TRANSPARENT_FACTORY = "0x5689219Aa5dC2766928d316E719AaE25047314e4"
+ENCRYPTED_FACTORY = "0xdD7900c4B6abfEB4D2Cb9F233d875071f6e1093F"
+CURATOR = Web3.to_checksum_address("0x" + "c1" * 20)
+NEW_CURATOR = Web3.to_checksum_address("0x" + "c2" * 20)
+
+
+def _event(name: str, inputs: list[tuple[str, str, bool]]) -> dict:
+    return {
+        "type": "event",
+        "name": name,
+        "anonymous": False,
+        "inputs": [
+            {"name": arg, "type": type_, "indexed": indexed}
+            for arg, type_, indexed in inputs
+        ],
+    }
+
+
+VAULT_CREATED = _event(
+    "OrionVaultCreated",
+    [
+        ("vault", "address", True),
+        ("curator", "address", True),
+        ("feeType", "uint8", False),
+        ("performanceFee", "uint16", False),
+        ("managementFee", "uint16", False),
+    ],
+)
+VAULT_EVENTS = [
+    _event("CuratorUpdated", [("newCurator", "address", True)]),
+    _event(
+        "FeeModelUpdated",
+        [
+            ("feeType", "uint8", False),
+            ("performanceFee", "uint16", False),
+            ("managementFee", "uint16", False),
+        ],
+    ),
+]
+INDEXER_ABIS = {
+    "TransparentVaultFactory": [VAULT_CREATED],
+    "EncryptedVaultFactory": [VAULT_CREATED],
+    "OrionTransparentVault": VAULT_EVENTS,
+    "OrionEncryptedVault": VAULT_EVENTS,
+    "OrionConfig": [],
+}
+
+
+def _vault(i: int) -> str:
+    return Web3.to_checksum_address(f"0x{i + 0xA000:040x}")
+
+
+def _topic(address: str) -> str:
+    return "0x" + "00" * 12 + address[2:].lower()
+
+
+class LogChain:
+    """Local chain stand-in serving eth_getLogs from a list of logs."""
+
+    def __init__(self, rpc):
+        self.logs = []
+        self.head = 0
+        self.ranges = []
+        self.address_counts = []
+        rpc.on("eth_blockNumber", lambda params: hex(self.head))
+        rpc.on("eth_getLogs", self._get_logs)
+
+    def emit(self, block: int, address: str, signature: str, topics, types, values):
+        self.logs.append(
+            {
+                "address": address,
+                "topics": [
+                    "0x" + event_signature_to_log_topic(signature).hex(),
+                    *topics,
+                ],
+                "data": "0x" + encode(types, values).hex(),
+                "blockNumber": hex(block),
+                "blockHash": "0x" + f"{block:064x}",
+                "transactionHash": "0x" + f"{len(self.logs) + 1:064x}",
+                "transactionIndex": "0x0",
+                "logIndex": hex(len(self.logs)),
+                "removed": False,
+            }
+        )
+        self.head = max(self.head, block)
+
+    def create_vault(self, block: int, factory: str, vault: str):
+        self.emit(
+            block,
+            factory,
+            "OrionVaultCreated(address,address,uint8,uint16,uint16)",
+            [_topic(vault), _topic(CURATOR)],
+            ["uint8", "uint16", "uint16"],
+            [1, 1000, 100],
+        )
+
+    def _get_logs(self, params):
+        query = params[0]
+        from_block, to_block = int(query["fromBlock"], 16), int(query["toBlock"], 16)
+        self.ranges.append((from_block, to_block))
+        self.address_counts.append(len(query["address"]))
+        addresses = {address.lower() for address in query["address"]}
+        topics = set(query["topics"][0])
+        return [
+            log
+            for log in self.logs
+            if from_block <= int(log["blockNumber"], 16) <= to_block
+            and log["address"].lower() in addresses
+            and log["topics"][0] in topics
+        ]
+
+
+@pytest.fixture
+def chain(stub_rpc, monkeypatch):
+    """Stub node with vault factory and vault events."""
+    import orion_finance_sdk.contracts as contracts
+
+    monkeypatch.setattr(contracts, "load_contract_abi", lambda name: INDEXER_ABIS[name])
+    return LogChain(stub_rpc)
+
+
+def test_indexes_vaults_and_updates(chain, tmp_path):
+    """Vault creations and later curator and fee updates end up in the index."""
+    chain.create_vault(10, TRANSPARENT_FACTORY, _vault(0))
+    chain.create_vault(12, ENCRYPTED_FACTORY, _vault(1))
+    chain.emit(
+        12,
+        _vault(1),
+        "CuratorUpdated(address)",
+        [_topic(NEW_CURATOR)],
+        [],
+        [],
+    )
+    chain.emit(
+        30,
+        _vault(0),
+        "FeeModelUpdated(uint8,uint16,uint16)",
+        [],
+        ["uint8", "uint16", "uint16"],
+        [3, 2000, 50],
+    )
+
+    with VaultIndexer(
+        tmp_path / "index.sqlite", chunk_size=8, confirmations=0
+    ) as index:
+        assert index.sync() == 4
+        transparent, encrypted = index.vaults()
+
+    assert (transparent.address, transparent.vault_type) == (
+        _vault(0),
+        VaultType.TRANSPARENT,
+    )
+    assert (transparent.fee_type, transparent.performance_fee) == (3, 2000)
+    assert transparent.curator == CURATOR
+    assert transparent.updated_block == 30
+    assert (encrypted.vault_type, encrypted.curator) == (
+        VaultType.ENCRYPTED,
+        NEW_CURATOR,
+    )
+    # Block ranges are scanned in chunks, factories and vaults separately.
+    assert chain.ranges[::2] == [(0, 7), (8, 15), (16, 23), (24, 30)]
+
+
+def test_sync_resumes_from_checkpoint(chain, tmp_path):
+    """A later sync, even from a new process, only fetches new blocks."""
+    db_path = tmp_path / "index.sqlite"
+    chain.create_vault(5, TRANSPARENT_FACTORY, _vault(0))
+    with VaultIndexer(db_path, confirmations=0) as index:
+        assert index.sync() == 1
+        assert index.last_block == 5
+
+    chain.create_vault(9, TRANSPARENT_FACTORY, _vault(1))
+    chain.ranges.clear()
+    with VaultIndexer(db_path, confirmations=0) as index:
+        assert index.sync() == 1
+        assert index.sync() == 0
+        assert [vault.address for vault in index.vaults()] == [_vault(0), _vault(1)]
+        assert index.vault(_vault(1).lower()).created_block == 9
+
+    assert chain.ranges == [(6, 9), (6, 9)]
+
+
+def test_confirmations_hold_back_recent_blocks(chain, tmp_path):
+    """Blocks within the confirmation depth are left for a later sync."""
+    chain.create_vault(20, TRANSPARENT_FACTORY, _vault(0))
+    chain.head = 22
+
+    with VaultIndexer(tmp_path / "index.sqlite", confirmations=5) as index:
+        assert index.sync() == 0
+        assert index.last_block == 17
+        chain.head = 25
+        assert index.sync() == 1
+
+
+def test_sync_feeds_vault_type_resolution(chain, tmp_path):
+    """Indexed vaults resolve their type without reading the vault lists."""
+    from orion_finance_sdk.contracts import OrionConfig
+
+    chain.create_vault(3, ENCRYPTED_FACTORY, _vault(7))
+    with VaultIndexer(tmp_path / "index.sqlite", confirmations=0) as index:
+        index.sync()
+
+    assert OrionConfig().vault_type(_vault(7)) == VaultType.ENCRYPTED
+
+
+def test_vault_addresses_are_queried_in_groups(chain, tmp_path):
+    """Updates are fetched with at most address_chunk_size vaults per request."""
+    for i in range(5):
+        chain.create_vault(2, TRANSPARENT_FACTORY, _vault(i))
+        chain.emit(
+            4,
+            _vault(i),
+            "CuratorUpdated(address)",
+            [_topic(NEW_CURATOR)],
+            [],
+            [],
+        )
+
+    with VaultIndexer(
+        tmp_path / "index.sqlite", confirmations=0, address_chunk_size=2
+    ) as index:
+        assert index.sync() == 10
+        assert [vault.curator for vault in index.vaults()] == [NEW_CURATOR] * 5
+
+    assert max(chain.address_counts) == 2
+    # Two factories, then three groups of at most two vaults.
+    assert chain.address_counts == [2, 2, 2, 1]
+
+
+def test_index_is_per_chain(chain, stub_rpc, tmp_path):
+    """Vaults and checkpoints of one chain are not used on another."""
+    db_path = tmp_path / "index.sqlite"
+    chain.create_vault(5, TRANSPARENT_FACTORY, _vault(0))
+    with VaultIndexer(db_path, confirmations=0) as index:
+        index.sync()
+        assert index.last_block == 5
+
+    stub_rpc.on("eth_chainId", lambda params: hex(1))
+    close_connections()
+    chain.logs.clear()
+    chain.create_vault(5, ENCRYPTED_FACTORY, _vault(1))
+    chain.address_counts.clear()
+    with VaultIndexer(db_path, confirmations=0) as index:
+        assert index.last_block is None
+        assert index.vaults() == []
+        assert index.vault(_vault(0)) is None
+        index.sync()
+        assert [vault.address for vault in index.vaults()] == [_vault(1)]
+
+    # Only the factories and the one vault of this chain were queried.
+    assert chain.address_counts == [2, 1]
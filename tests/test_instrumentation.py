@@ -0,0 +1,147 @@
+"""Tests for stage spans, RPC metrics and the --profile flag."""
+
+import asyncio
+import contextlib
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk.cli import app
+from orion_finance_sdk.contracts import OrionTransparentVault
+from orion_finance_sdk.instrumentation import (
+    OpenTelemetryInstrumentation,
+    Profiler,
+    get_instrumentation,
+    set_instrumentation,
+    span,
+    traced,
+)
+from typer.testing import CliRunner
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+
+@pytest.fixture
+def profiler():
+    """Profiler installed as the process-wide instrumentation."""
+    profiler = Profiler()
+    set_instrumentation(profiler)
+    yield profiler
+    set_instrumentation(None)
+
+
+@pytest.fixture
+def vault(stub_chain, abis, monkeypatch):
+    """Transparent vault on the stub chain, with a curator key configured."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    return OrionTransparentVault()
+
+
+def test_default_is_a_no_op():
+    """Without configuration, spans cost a null context."""
+    assert isinstance(span("anything"), contextlib.nullcontext)
+    assert type(get_instrumentation()).__name__ == "Instrumentation"
+
+
+def test_spans_nest_and_aggregate(profiler):
+    """Stages are listed under their parent, in the order they started."""
+
+    @traced("child")
+    async def child():
+        await asyncio.sleep(0)
+
+    async def run():
+        with span("parent"):
+            for _ in range(3):
+                await child()
+            with span("other"):
+                pass
+
+    asyncio.run(run())
+
+    assert list(profiler.stages) == [
+        ("parent",),
+        ("parent", "child"),
+        ("parent", "other"),
+    ]
+    assert profiler.stages[("parent", "child")][0] == 3
+    lines = profiler.format().splitlines()
+    assert [line.split()[0] for line in lines[1:4]] == ["parent", "child", "other"]
+
+
+def test_transaction_stages_and_rpc_latency(vault, profiler):
+    """A contract write is broken down into its stages and RPC methods."""
+    vault.submit_order_intent({TOKEN: 1})
+
+    assert list(profiler.stages) == [
+        ("OrionTransparentVault.submitIntent",),
+        ("OrionTransparentVault.submitIntent", "encode"),
+        ("OrionTransparentVault.submitIntent", "estimate_gas"),
+        ("OrionTransparentVault.submitIntent", "sign"),
+        ("OrionTransparentVault.submitIntent", "send"),
+        ("OrionTransparentVault.submitIntent", "wait_receipt"),
+    ]
+    assert profiler.rpc["eth_estimateGas"].count == 1
+    assert profiler.rpc["eth_sendRawTransaction"].count == 1
+    histogram = profiler.rpc["eth_estimateGas"]
+    assert 0 < histogram.quantile(0.5) <= histogram.max
+    assert "eth_sendRawTransaction" in profiler.format()
+
+
+def test_opentelemetry_instrumentation():
+    """Spans and RPC metrics are forwarded to the given tracer and meter."""
+    recorded = []
+
+    class Tracer:
+        def start_as_current_span(self, name, attributes=None):
+            recorded.append(("span", name, attributes))
+            return contextlib.nullcontext()
+
+    class Instrument:
+        def __init__(self, name):
+            self.name = name
+
+        def add(self, value, attributes):
+            recorded.append((self.name, value, attributes["rpc.method"]))
+
+        record = add
+
+    class Meter:
+        def create_counter(self, name, **kwargs):
+            return Instrument(name)
+
+        create_histogram = create_counter
+
+    set_instrumentation(OpenTelemetryInstrumentation(Tracer(), Meter()))
+    try:
+        with span("validate_order", tokens=2):
+            pass
+        get_instrumentation().record_rpc("eth_call", 0.002)
+    finally:
+        set_instrumentation(None)
+
+    assert recorded == [
+        ("span", "validate_order", {"tokens": 2}),
+        ("rpc.client.requests", 1, "eth_call"),
+        ("rpc.client.duration", 2.0, "eth_call"),
+    ]
+
+
+def test_profile_flag(vault, tmp_path, monkeypatch):
+    """--profile prints the command's stages after its output."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("orion_finance_sdk.cli.ensure_env_file", lambda: None)
+    monkeypatch.setenv("VAULT_DEPLOYER_PRIVATE_KEY", CURATOR.key.hex())
+
+    result = CliRunner().invoke(
+        app, ["--profile", "update-curator", "--new-curator-address", TOKEN]
+    )
+
+    assert result.exit_code == 0, result.output
+    profile = result.output[result.output.index("Stages:") :]
+    assert "orion update-curator" in profile
+    assert "OrionTransparentVault.updateCurator" in profile
+    assert "eth_sendRawTransaction" in profile
+    assert type(get_instrumentation()).__name__ == "Instrumentation"
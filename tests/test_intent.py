@@ -0,0 +1,109 @@
+"""Tests for order intents and their loading from JSON, CSV and Arrow files."""
+
+import json
+
+import pytest
+from orion_finance_sdk.intent import (
+    OrderIntent,
+    load_order_intent,
+    read_intent_columns,
+)
+from web3 import Web3
+
+TOKENS = [f"0x{i + 1:040x}" for i in range(3)]
+WEIGHTS = [0.5, 0.3, 0.2]
+
+
+def test_json_csv_and_headerless_csv_agree(tmp_path):
+    """Every format yields the same columns, in file order."""
+    (tmp_path / "intent.json").write_text(json.dumps(dict(zip(TOKENS, WEIGHTS))))
+    (tmp_path / "intent.csv").write_text(
+        "Token,Weight\n" + "".join(f"{t},{w}\n" for t, w in zip(TOKENS, WEIGHTS))
+    )
+    (tmp_path / "bare.csv").write_text(
+        "".join(f"{t},{w}\n" for t, w in zip(TOKENS, WEIGHTS))
+    )
+
+    for name in ("intent.json", "intent.csv", "bare.csv"):
+        assert read_intent_columns(str(tmp_path / name)) == (TOKENS, WEIGHTS)
+        assert load_order_intent(str(tmp_path / name)).to_dict() == dict(
+            zip(TOKENS, WEIGHTS)
+        )
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("intent.json", f'{{"{TOKENS[0]}": 0.5, "{TOKENS[0]}": 0.5}}'),
+        ("intent.csv", f"token,weight\n{TOKENS[0]},0.5\n{TOKENS[0]},0.5\n"),
+    ],
+)
+def test_duplicate_tokens_are_rejected(tmp_path, name, content):
+    """A repeated token is an error rather than a silently merged weight."""
+    (tmp_path / name).write_text(content)
+
+    with pytest.raises(ValueError, match="more than once"):
+        load_order_intent(str(tmp_path / name))
+
+
+def test_csv_without_token_column(tmp_path):
+    """The error names the accepted columns."""
+    (tmp_path / "intent.csv").write_text("symbol,weight\nUSDC,1\n")
+
+    with pytest.raises(ValueError, match="token / address / asset"):
+        load_order_intent(str(tmp_path / "intent.csv"))
+
+
+def test_parquet_and_feather(tmp_path):
+    """Parquet and Feather files are read column by column with pyarrow."""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+
+    table = pa.table({"address": TOKENS, "weight": WEIGHTS})
+    parquet.write_table(table, tmp_path / "intent.parquet")
+    feather.write_feather(table, tmp_path / "intent.feather")
+
+    for name in ("intent.parquet", "intent.feather"):
+        assert load_order_intent(str(tmp_path / name)).to_dict() == dict(
+            zip(TOKENS, WEIGHTS)
+        )
+
+
+def test_order_intent_shares_tokens():
+    """New weights reuse the parsed tokens and their checksum addresses."""
+    address = "0x" + "ab" * 20
+    intent = OrderIntent.from_mapping({address: 0.5, TOKENS[0]: 0.5})
+
+    assert intent.addresses == [Web3.to_checksum_address(address), TOKENS[0]]
+    allocated = intent.with_weights([60, 40])
+    assert allocated.tokens is intent.tokens
+    assert allocated.addresses is intent.addresses
+    assert dict(allocated.items()) == dict(zip(intent.addresses, [60, 40]))
+    assert OrderIntent.from_mapping(allocated) is allocated
+
+
+@pytest.mark.parametrize(
+    "addresses, message",
+    [
+        (["0x" + "ab" * 20, "0x" + "AB" * 20], "more than once"),
+        (["0x1234"], "Invalid token address"),
+    ],
+)
+def test_order_intent_rejects_bad_tokens(addresses, message):
+    """Addresses differing only in letter case are the same token."""
+    with pytest.raises(ValueError, match=message):
+        OrderIntent.from_columns(addresses, [1.0] * len(addresses))
+
+
+def test_order_intent_is_a_read_only_mapping():
+    """Lookups accept any letter case; views are lists, safe to iterate twice."""
+    intent = OrderIntent.from_columns(TOKENS, WEIGHTS)
+
+    assert intent[TOKENS[1].upper().replace("0X", "0x")] == WEIGHTS[1]
+    assert TOKENS[2] in intent and "0x1234" not in intent
+    assert intent.get("0x" + "ff" * 20) is None
+    items = intent.items()
+    assert list(items) == list(items) == list(zip(TOKENS, WEIGHTS))
+    with pytest.raises(KeyError):
+        intent["0x" + "ff" * 20]
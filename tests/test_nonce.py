@@ -0,0 +1,87 @@
+"""Tests for local nonce allocation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk.connection import get_web3
+from orion_finance_sdk.contracts import OrionTransparentVault
+from orion_finance_sdk.nonce import get_nonce_manager
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+
+@pytest.fixture
+def vault(stub_chain, abis, monkeypatch):
+    """Transparent vault on the stub chain, with a curator key configured."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    return OrionTransparentVault()
+
+
+def test_concurrent_submissions_get_distinct_nonces(vault, stub_chain):
+    """Submissions pipelined from one key never collide on a nonce."""
+    n_submissions = 24
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(
+                lambda i: vault.submit_order_intent({TOKEN: i}),
+                range(n_submissions),
+            )
+        )
+
+    nonces = sorted(tx["nonce"] for tx in stub_chain.transactions)
+    assert nonces == list(range(n_submissions))
+    assert len({result.tx_hash for result in results}) == n_submissions
+    # The pending count is read once; later nonces are allocated locally.
+    assert stub_chain.rpc.calls["eth_getTransactionCount"] == 1
+
+
+def test_resync_after_external_transaction(vault, stub_chain):
+    """A nonce consumed outside the SDK triggers a resync and one retry."""
+    vault.submit_order_intent({TOKEN: 1})
+    stub_chain.use_nonce(CURATOR.address, 1)
+
+    vault.submit_order_intent({TOKEN: 2})
+
+    assert [tx["nonce"] for tx in stub_chain.transactions] == [0, 2]
+
+
+def test_unsent_nonce_is_reused(stub_chain):
+    """A nonce whose transaction was never broadcast is handed out again."""
+    manager = get_nonce_manager(get_web3(stub_chain.rpc.url), CURATOR.address)
+
+    first = manager.acquire()
+    with pytest.raises(RuntimeError):
+        with manager.nonce():
+            raise RuntimeError("estimate_gas reverted")
+    third = manager.acquire()
+    manager.release(first)
+
+    assert (first, third) == (0, 1)
+    assert manager.acquire() == 0
+    assert manager.acquire() == 2
+
+
+def test_already_known_is_not_resent(vault, stub_chain):
+    """A transaction the node already holds is waited for, not signed again."""
+    send = stub_chain.rpc.handlers["eth_sendRawTransaction"]
+
+    def send_already_known(params):
+        # The transaction is accepted, but the answer reads like a rejection,
+        # as when an earlier attempt timed out after reaching the node.
+        send(params)
+        raise ValueError("already known")
+
+    stub_chain.rpc.on("eth_sendRawTransaction", send_already_known)
+
+    result = vault.submit_order_intent({TOKEN: 1})
+
+    assert len(stub_chain.transactions) == 1
+    assert result.tx_hash.removeprefix("0x") == stub_chain.transactions[0][
+        "hash"
+    ].removeprefix("0x")
+    assert stub_chain.rpc.calls["eth_sendRawTransaction"] == 1
@@ -0,0 +1,169 @@
+"""Tests for submitting order intents to several vaults at once."""
+
+import json
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk import encrypt, orders
+from orion_finance_sdk.encrypt import EncryptionResult
+from orion_finance_sdk.orders import format_submissions, load_manifest, submit_manifest
+from orion_finance_sdk.types import VaultType
+from web3 import Web3
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+TOKENS = [Web3.to_checksum_address(f"0x{i + 0x100:040x}") for i in range(3)]
+TRANSPARENT = [Web3.to_checksum_address(f"0x{i + 0xA00:040x}") for i in range(6)]
+ENCRYPTED = [Web3.to_checksum_address(f"0x{i + 0xE00:040x}") for i in range(2)]
+
+
+@pytest.fixture
+def chain(stub_chain, abis, monkeypatch):
+    """Stub chain with an OrionConfig registering transparent and encrypted vaults."""
+    rpc = stub_chain.rpc
+    rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+    rpc.on_call("getAllWhitelistedAssets()", ["address[]"], TOKENS)
+    rpc.on_call(
+        "getAllOrionVaults(uint8)",
+        ["address[]"],
+        lambda kind: (TRANSPARENT if kind == 0 else ENCRYPTED,),
+    )
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    monkeypatch.setenv("CURATOR_ADDRESS", CURATOR.address)
+    monkeypatch.delenv("ORION_VAULT_ADDRESS", raising=False)
+    return stub_chain
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """Write one intent file per vault and a manifest referencing them."""
+
+    def write(vaults: list[str], intent: dict | None = None) -> str:
+        entries = {}
+        for i, vault in enumerate(vaults):
+            (tmp_path / f"intent_{i}.json").write_text(
+                json.dumps(intent or {TOKENS[0]: 0.25, TOKENS[1]: 0.75})
+            )
+            entries[vault] = f"intent_{i}.json"
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps(entries))
+        return str(path)
+
+    return write
+
+
+def test_load_manifest_resolves_relative_paths(manifest, tmp_path):
+    """Intent paths are relative to the manifest file."""
+    loaded = load_manifest(manifest([TRANSPARENT[0]]))
+
+    assert loaded == {TRANSPARENT[0]: str(tmp_path / "intent_0.json")}
+
+
+def test_submit_manifest_shares_reads_and_sequences_nonces(chain, manifest):
+    """Each vault gets one transaction; config reads and nonces are shared."""
+    submissions = submit_manifest(load_manifest(manifest(TRANSPARENT)))
+
+    assert all(submission.ok for submission in submissions)
+    assert [submission.vault_type for submission in submissions] == [
+        VaultType.TRANSPARENT
+    ] * len(TRANSPARENT)
+    assert sorted(tx["nonce"] for tx in chain.transactions) == list(
+        range(len(TRANSPARENT))
+    )
+    assert {tx["to"] for tx in chain.transactions} == {
+        vault.lower() for vault in TRANSPARENT
+    }
+    assert chain.rpc.contract_calls["getAllWhitelistedAssets()"] == 1
+    assert chain.rpc.contract_calls["curatorIntentDecimals()"] == 1
+    assert chain.rpc.calls["eth_getTransactionCount"] == 1
+
+
+def test_submit_manifest_encrypts_in_one_batch(chain, manifest, monkeypatch):
+    """Encrypted vaults are encrypted together and submitted with their proofs."""
+    batches = []
+
+    def encrypt(requests):
+        batches.append(requests)
+        return [
+            EncryptionResult(
+                vault_address=vault,
+                encrypted_intent={token: b"\x01" * 32 for token in intent},
+                input_proof="0x1234",
+            )
+            for vault, _, intent in requests
+        ]
+
+    monkeypatch.setattr(orders, "encrypt_order_intents_batch", encrypt)
+
+    submissions = submit_manifest(load_manifest(manifest(ENCRYPTED + TRANSPARENT[:1])))
+
+    assert all(submission.ok for submission in submissions)
+    assert len(batches) == 1
+    assert [vault for vault, _, _ in batches[0]] == ENCRYPTED
+    assert len(chain.transactions) == 3
+
+
+def test_failures_are_reported_per_vault(chain, manifest, monkeypatch):
+    """An unknown vault or a failed encryption does not stop the other vaults."""
+    unknown = Web3.to_checksum_address("0x" + "99" * 20)
+    monkeypatch.setattr(
+        orders,
+        "encrypt_order_intents_batch",
+        lambda requests: [
+            EncryptionResult(vault_address=vault, error="relayer down")
+            for vault, _, _ in requests
+        ],
+    )
+
+    submissions = submit_manifest(
+        load_manifest(manifest([TRANSPARENT[0], unknown, ENCRYPTED[0]]))
+    )
+
+    assert [submission.ok for submission in submissions] == [True, False, False]
+    assert "not in OrionConfig" in submissions[1].error
+    assert submissions[2].error == "Encryption failed: relayer down"
+    assert len(chain.transactions) == 1
+
+    table = format_submissions(submissions)
+    assert table.splitlines()[0].startswith("Vault")
+    assert f"0x{submissions[0].tx_hash}" in table
+    assert "relayer down" in table
+
+
+def _failing_batch(monkeypatch):
+    def encrypt(requests):
+        raise RuntimeError("node exited with status 1")
+
+    monkeypatch.setattr(orders, "encrypt_order_intents_batch", encrypt)
+    return "node exited with status 1"
+
+
+def _missing_node(monkeypatch):
+    monkeypatch.setattr(encrypt, "resolve_node", lambda: None)
+    return "requires Node.js"
+
+
+def _missing_curator(monkeypatch):
+    monkeypatch.delenv("CURATOR_ADDRESS")
+    monkeypatch.setattr(encrypt, "load_env", lambda: None)
+    return "CURATOR_ADDRESS environment variable is missing"
+
+
+@pytest.mark.parametrize(
+    "break_encryption", [_failing_batch, _missing_node, _missing_curator]
+)
+def test_encryption_failure_spares_transparent_vaults(
+    chain, manifest, monkeypatch, break_encryption
+):
+    """A batch encryption that raises fails the encrypted vaults only."""
+    monkeypatch.setattr(encrypt, "_worker", None)
+    reason = break_encryption(monkeypatch)
+
+    submissions = submit_manifest(
+        load_manifest(manifest([ENCRYPTED[0], TRANSPARENT[0], ENCRYPTED[1]]))
+    )
+
+    assert [submission.ok for submission in submissions] == [False, True, False]
+    assert submissions[0].error.startswith("Encryption failed: ")
+    assert reason in submissions[0].error
+    assert len(chain.transactions) == 1
+    assert "Encryption failed" in format_submissions(submissions)
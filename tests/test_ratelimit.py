@@ -0,0 +1,86 @@
+"""Tests for client-side RPC rate limiting and request accounting."""
+
+import asyncio
+import time
+
+import pytest
+from orion_finance_sdk.connection import get_async_web3, get_web3
+from orion_finance_sdk.ratelimit import (
+    TokenBucket,
+    compute_units,
+    format_request_stats,
+    get_request_budget,
+    request_stats,
+    reset_request_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    """Start each test with zeroed counters and no rate limit set."""
+    for name in ("ORION_RPC_RATE_LIMIT", "ORION_RPC_BURST", "ORION_RPC_COMPUTE_UNITS"):
+        monkeypatch.delenv(name, raising=False)
+    reset_request_stats()
+
+
+def test_token_bucket_queues_callers():
+    """Reservations beyond the burst wait in order instead of failing."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    delays = [bucket.reserve(1) for _ in range(5)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_compute_unit_overrides(monkeypatch):
+    """Heavier methods cost more, and the weights can be overridden."""
+    assert compute_units("eth_estimateGas") > compute_units("eth_chainId")
+
+    monkeypatch.setenv("ORION_RPC_COMPUTE_UNITS", "eth_chainId=4, eth_foo=7")
+    assert compute_units("eth_chainId") == 4
+    assert compute_units("eth_foo") == 7
+
+    monkeypatch.setenv("ORION_RPC_COMPUTE_UNITS", "eth_chainId")
+    with pytest.raises(ValueError, match="method=units"):
+        compute_units("eth_chainId")
+
+
+def test_requests_are_paced_and_counted(stub_chain, stub_rpc, monkeypatch):
+    """A rate limit spaces requests out, batches weighing their sum."""
+    monkeypatch.setenv("ORION_RPC_RATE_LIMIT", "50")
+    monkeypatch.setenv("ORION_RPC_BURST", "1")
+    w3 = get_web3(stub_rpc.url)
+
+    start = time.monotonic()
+    for _ in range(6):
+        w3.eth.get_block_number()
+    with w3.batch_requests() as batch:
+        batch.add(w3.eth.get_block_number())
+        batch.add(w3.eth.estimate_gas({"to": "0x" + "11" * 20}))
+        batch.execute()
+    elapsed = time.monotonic() - start
+
+    # 5 units beyond the burst at 50 units/s, then the batch's 6 units.
+    assert elapsed >= 0.2
+    assert request_stats()["eth_blockNumber"] == (7, 7)
+    assert request_stats()["eth_estimateGas"] == (1, 5)
+    assert get_request_budget(stub_rpc.url).throttled > 0
+    assert "RPC requests: 8 (12 compute units" in format_request_stats()
+
+
+def test_async_requests_share_the_budget(stub_rpc):
+    """Async connections to an endpoint count against the same budget."""
+
+    async def read():
+        w3 = get_async_web3(stub_rpc.url)
+        try:
+            await asyncio.gather(*(w3.eth.block_number for _ in range(3)))
+        finally:
+            await w3.provider.disconnect()
+
+    get_web3(stub_rpc.url).eth.get_block_number()
+    asyncio.run(read())
+
+    assert request_stats()["eth_blockNumber"] == (4, 4)
+    assert stub_rpc.calls["eth_blockNumber"] == 4
@@ -0,0 +1,87 @@
+"""Tests for fire-and-forget submission and batched receipt tracking."""
+
+import pytest
+from eth_account import Account
+from hexbytes import HexBytes
+from orion_finance_sdk.connection import get_web3
+from orion_finance_sdk.contracts import OrionTransparentVault, PendingTransaction
+from orion_finance_sdk.receipts import ReceiptTimeout, ReceiptTracker
+from web3.exceptions import TimeExhausted
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+
+@pytest.fixture
+def vault(stub_chain, abis, monkeypatch):
+    """Transparent vault on a stub chain that only mines on demand."""
+    stub_chain.auto_mine = False
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    return OrionTransparentVault()
+
+
+def test_submit_without_waiting(vault, stub_chain):
+    """Submissions return pending handles that resolve once mined."""
+    pending = [vault.submit_order_intent({TOKEN: i}, wait=False) for i in range(5)]
+
+    assert all(isinstance(tx, PendingTransaction) for tx in pending)
+    assert not any(tx.done() for tx in pending)
+
+    stub_chain.mine()
+    results = [tx.result(timeout=10) for tx in pending]
+
+    assert [result.tx_hash for result in results] == [tx.tx_hash for tx in pending]
+    assert all(result.receipt["status"] == 1 for result in results)
+    assert all(result.decoded_logs == [] for result in results)
+
+
+def test_tracker_polls_all_hashes_in_one_request(stub_chain):
+    """One poll costs one request however many transactions are tracked."""
+    w3 = get_web3(stub_chain.rpc.url)
+    tracker = ReceiptTracker(w3, poll_interval=3600)
+    stub_chain.auto_mine = False
+    for nonce in range(10):
+        stub_chain.use_nonce(CURATOR.address, nonce)
+        stub_chain.transactions.append({"hash": f"0x{nonce:064x}"})
+        stub_chain.mempool.append({"hash": f"0x{nonce:064x}", "from": CURATOR.address})
+
+    futures = [tracker.track(f"{nonce:064x}") for nonce in range(10)]
+    requests = stub_chain.rpc.requests
+    assert tracker.poll() == 0
+    assert stub_chain.rpc.requests == requests + 1
+
+    stub_chain.mine()
+    receipt_calls = stub_chain.rpc.calls["eth_getTransactionReceipt"]
+    assert tracker.poll() == 10
+    # Mined receipts are formatted from the same response, not fetched again.
+    assert stub_chain.rpc.requests == requests + 2
+    assert stub_chain.rpc.calls["eth_getTransactionReceipt"] == receipt_calls + 10
+    receipts = [future.result(timeout=0) for future in futures]
+    assert [receipt.blockNumber for receipt in receipts] == list(range(1, 11))
+    assert receipts[0]["transactionHash"] == HexBytes(f"0x{0:064x}")
+
+
+def test_tracker_timeout(stub_chain):
+    """Transactions never mined fail with TimeExhausted."""
+    tracker = ReceiptTracker(get_web3(stub_chain.rpc.url), poll_interval=0.01)
+
+    future = tracker.track("0x" + "ab" * 32, timeout=0.05)
+
+    with pytest.raises(TimeExhausted):
+        future.result(timeout=5)
+
+
+def test_tracker_timeout_while_endpoint_is_down(stub_chain):
+    """Deadlines expire even when every receipt poll fails."""
+    stub_chain.rpc.http_errors.extend([500] * 1000)
+    tracker = ReceiptTracker(get_web3(stub_chain.rpc.url), poll_interval=0.01)
+
+    future = tracker.track("0x" + "ab" * 32, timeout=0.05)
+
+    with pytest.raises(ReceiptTimeout) as exc_info:
+        future.result(timeout=5)
+    assert isinstance(exc_info.value, TimeoutError)
+    assert exc_info.value.__cause__ is not None
+    assert "500" in str(exc_info.value)
@@ -0,0 +1,134 @@
+"""Tests for routing JSON-RPC requests over several endpoints."""
+
+import asyncio
+import time
+
+import pytest
+from conftest import StubChain, StubRPC
+from eth_account import Account
+from orion_finance_sdk.connection import get_async_web3, get_web3
+from orion_finance_sdk.contracts import OrionTransparentVault
+from orion_finance_sdk.router import RPCRouter
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+VAULT = "0x" + "33" * 20
+TOKEN = "0x" + "44" * 20
+
+
+@pytest.fixture
+def stubs(monkeypatch):
+    """Start stub nodes on demand, with RPC_URL listing all of them."""
+    from orion_finance_sdk.connection import close_connections
+
+    monkeypatch.delenv("ORION_RPC_HEDGE_DELAY", raising=False)
+    started = []
+
+    def start(*delays):
+        rpcs = [StubRPC(delay=delay) for delay in delays]
+        started.extend(rpcs)
+        monkeypatch.setenv("RPC_URL", ",".join(rpc.url for rpc in rpcs))
+        return rpcs
+
+    yield start
+    close_connections()
+    for rpc in started:
+        rpc.close()
+
+
+def test_reads_prefer_the_fastest_endpoint(stubs):
+    """Once measured, the slow endpoint only gets an occasional read."""
+    slow, fast = stubs(0.05, 0.0)
+    w3 = get_web3(f"{slow.url},{fast.url}")
+    assert isinstance(w3.provider, RPCRouter)
+
+    for _ in range(40):
+        assert w3.eth.block_number == 1
+
+    assert slow.requests + fast.requests == 40
+    assert slow.requests <= 5
+
+
+def test_rate_limited_endpoint_is_skipped(stubs):
+    """A 429 fails over at once and rests the endpoint for its Retry-After."""
+    limited, healthy = stubs(0.0, 0.0)
+    limited.http_errors = [429]
+    limited.retry_after = 60
+    w3 = get_web3(f"{limited.url},{healthy.url}")
+
+    start = time.monotonic()
+    for _ in range(5):
+        assert w3.eth.chain_id == 11155111
+    assert time.monotonic() - start < 1
+
+    assert limited.requests == 1
+    assert healthy.requests == 5
+    assert not w3.provider.endpoints[0].available
+
+
+def test_backoff_when_every_endpoint_fails(stubs):
+    """Once no endpoint is healthy, requests back off and are retried."""
+    first, second = stubs(0.0, 0.0)
+    first.http_errors = [503]
+    second.http_errors = [502]
+    w3 = get_web3(f"{first.url},{second.url}")
+
+    assert w3.eth.block_number == 1
+    assert first.requests + second.requests == 3
+
+
+def test_client_errors_are_not_retried(stubs):
+    """An HTTP 4xx other than 429 is the request's fault, not the endpoint's."""
+    first, second = stubs(0.0, 0.0)
+    first.http_errors = [400]
+    w3 = get_web3(f"{first.url},{second.url}")
+
+    with pytest.raises(Exception, match="400"):
+        w3.eth.get_block_number()
+    assert second.requests == 0
+
+
+def test_hedged_read(stubs, monkeypatch):
+    """A read unanswered within the hedge delay is answered by the next endpoint."""
+    monkeypatch.setenv("ORION_RPC_HEDGE_DELAY", "0.05")
+    slow, fast = stubs(1.0, 0.0)
+    w3 = get_web3(f"{slow.url},{fast.url}")
+
+    start = time.monotonic()
+    assert w3.eth.block_number == 1
+    assert time.monotonic() - start < 0.5
+    assert fast.requests == 1
+
+
+def test_transactions_are_broadcast(stubs, abis, monkeypatch):
+    """Signed transactions reach every endpoint, reads only one."""
+    monkeypatch.setenv("ORION_VAULT_ADDRESS", VAULT)
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    chains = [StubChain(rpc) for rpc in stubs(0.0, 0.0)]
+
+    result = OrionTransparentVault().submit_order_intent({TOKEN: 1})
+
+    assert [len(chain.transactions) for chain in chains] == [1, 1]
+    assert chains[0].transactions[0]["hash"].endswith(result.tx_hash[-64:])
+    assert chains[1].transactions[0]["hash"] == chains[0].transactions[0]["hash"]
+    assert sum(chain.rpc.calls["eth_estimateGas"] for chain in chains) == 1
+
+
+def test_async_router(stubs, monkeypatch):
+    """The async router fails over and hedges like the sync one."""
+    monkeypatch.setenv("ORION_RPC_HEDGE_DELAY", "0.05")
+    limited, slow, fast = stubs(0.0, 1.0, 0.0)
+    limited.http_errors = [429]
+
+    async def read():
+        w3 = get_async_web3(",".join(rpc.url for rpc in (limited, slow, fast)))
+        try:
+            start = time.monotonic()
+            block_number = await w3.eth.block_number
+            return block_number, time.monotonic() - start
+        finally:
+            await w3.provider.disconnect()
+
+    block_number, elapsed = asyncio.run(read())
+    assert block_number == 1
+    assert elapsed < 0.5
+    assert fast.requests == 1
@@ -0,0 +1,151 @@
+"""Tests for dry runs of contract writes."""
+
+import json
+
+import pytest
+from eth_account import Account
+from orion_finance_sdk.contracts import OrionTransparentVault, VaultFactory
+from orion_finance_sdk.orders import (
+    load_manifest,
+    simulate_order_intent,
+    submit_manifest,
+)
+from orion_finance_sdk.simulation import SimulationReport
+from orion_finance_sdk.types import VaultType
+from web3 import Web3
+
+CURATOR = Account.from_key("0x" + "01" * 32)
+TOKENS = [Web3.to_checksum_address(f"0x{i + 0x100:040x}") for i in range(3)]
+TRANSPARENT = [Web3.to_checksum_address(f"0x{i + 0xA00:040x}") for i in range(3)]
+ENCRYPTED = [Web3.to_checksum_address(f"0x{i + 0xE00:040x}") for i in range(1)]
+INTENT = {TOKENS[0]: 0.25, TOKENS[1]: 0.75}
+
+
+@pytest.fixture
+def chain(stub_chain, abis, monkeypatch):
+    """Stub chain whose vaults accept any submitted intent."""
+    rpc = stub_chain.rpc
+    rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+    rpc.on_call("getAllWhitelistedAssets()", ["address[]"], TOKENS)
+    rpc.on_call(
+        "getAllOrionVaults(uint8)",
+        ["address[]"],
+        lambda kind: (TRANSPARENT if kind == 0 else ENCRYPTED,),
+    )
+    rpc.on_call("submitIntent((address,uint32)[])", [], lambda items: ())
+    rpc.on_call("submitIntent((address,bytes32)[],bytes)", [], lambda *args: ())
+    monkeypatch.setenv("CURATOR_PRIVATE_KEY", CURATOR.key.hex())
+    monkeypatch.setenv("CURATOR_ADDRESS", CURATOR.address)
+    monkeypatch.setenv("VAULT_DEPLOYER_PRIVATE_KEY", CURATOR.key.hex())
+    return stub_chain
+
+
+def test_simulation_is_one_batch_and_sends_nothing(chain):
+    """Gas estimation and eth_call share one request; no transaction is sent."""
+    vault = OrionTransparentVault(TRANSPARENT[0])
+    requests = chain.rpc.requests
+
+    report = vault.submit_order_intent({TOKENS[0]: 10**9}, simulate=True)
+
+    assert report.ok, report.error
+    assert report.gas_estimate == chain.gas_used
+    assert report.return_data == "0x"
+    assert [stage.name for stage in report.stages] == [
+        "encode",
+        "estimate_gas+eth_call",
+    ]
+    assert chain.rpc.requests - requests == 1
+    assert chain.transactions == []
+    assert chain.rpc.calls["eth_getTransactionCount"] == 0
+
+
+def test_revert_is_reported(chain):
+    """A reverting call fails its stage with the node's message."""
+
+    def revert(items):
+        raise ValueError("execution reverted: curator only")
+
+    chain.rpc.on_call("updateCurator(address)", [], revert)
+    vault = OrionTransparentVault(TRANSPARENT[0])
+
+    report = vault.update_curator(CURATOR.address, simulate=True)
+
+    assert not report.ok
+    assert "curator only" in report.error
+    assert "Would fail" in report.format()
+
+
+def test_simulate_order_intent_stages(chain):
+    """The order pipeline is timed stage by stage, up to the eth_call."""
+    report = simulate_order_intent(TRANSPARENT[0], dict(INTENT))
+
+    assert report.ok, report.error
+    assert [stage.name for stage in report.stages] == [
+        "config",
+        "vault_type",
+        "validate",
+        "prepare",
+        "encode",
+        "estimate_gas+eth_call",
+    ]
+    assert all(stage.seconds >= 0 for stage in report.stages)
+    assert "Would succeed" in report.format()
+
+
+def test_simulate_order_intent_stops_at_validation(chain):
+    """Later stages are skipped once validation fails."""
+    report = simulate_order_intent(TRANSPARENT[0], {TOKENS[0]: 0.5})
+
+    assert not report.ok
+    assert report.stages[-1].name == "validate"
+    assert chain.rpc.calls["eth_estimateGas"] == 0
+
+
+def test_simulate_encrypted_with_stubbed_encryption(chain):
+    """Placeholder ciphertexts stand in for the Node encryption toolchain."""
+    report = simulate_order_intent(ENCRYPTED[0], dict(INTENT), stub_encryption=True)
+
+    assert report.ok, report.error
+    assert "encrypt" in [stage.name for stage in report.stages]
+
+
+def test_simulate_manifest(chain, tmp_path):
+    """Every vault of a manifest is simulated, none is submitted."""
+    entries = {}
+    for i, vault in enumerate(TRANSPARENT + ENCRYPTED):
+        (tmp_path / f"intent_{i}.json").write_text(json.dumps(INTENT))
+        entries[vault] = f"intent_{i}.json"
+    (tmp_path / "manifest.json").write_text(json.dumps(entries))
+
+    submissions = submit_manifest(
+        load_manifest(str(tmp_path / "manifest.json")),
+        simulate=True,
+        stub_encryption=True,
+    )
+
+    assert all(submission.ok for submission in submissions)
+    assert all(submission.report.gas_estimate for submission in submissions)
+    assert chain.transactions == []
+
+
+def test_deploy_while_system_busy_fails_its_stage(chain):
+    """A busy system fails the simulation stage instead of exiting."""
+    chain.rpc.on_call("isSystemIdle()", ["bool"], False)
+    factory = VaultFactory(VaultType.TRANSPARENT)
+    report = SimulationReport("createVault")
+
+    result = report.run(
+        "validate",
+        factory.create_orion_vault,
+        name="Vault",
+        symbol="VLT",
+        fee_type=0,
+        performance_fee=0,
+        management_fee=0,
+        simulate=True,
+    )
+
+    assert result is None
+    assert not report.ok
+    assert "not idle" in report.error
+    assert chain.rpc.calls["eth_estimateGas"] == 0
@@ -0,0 +1,67 @@
+"""Startup budget for the package import and the CLI help."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules only commands that talk to the chain or validate intents may load.
+HEAVY_MODULES = ("web3", "eth_account", "numpy", "dotenv", "aiohttp")
+
+IMPORT_BUDGET_US = 50_000  # import orion_finance_sdk
+HELP_BUDGET_US = 1_000_000  # orion --help, all imports included
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by a command.
+
+    The total of the top-level imports is recorded under the empty name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {"": 0}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative)
+        if not module[1:].startswith(" "):
+            times[""] += int(cumulative)
+    return times
+
+
+def _heavy(times: dict[str, int]) -> list[str]:
+    return [module for module in times if module.split(".")[0] in HEAVY_MODULES]
+
+
+def test_package_import_is_light():
+    """Importing the package loads none of the command dependencies."""
+    times = _import_times("-c", "import orion_finance_sdk")
+
+    print(f"\nimport orion_finance_sdk: {times['orion_finance_sdk'] / 1000:.1f} ms")
+    assert _heavy(times) == []
+    assert times["orion_finance_sdk"] < IMPORT_BUDGET_US
+
+
+def test_cli_help_is_light():
+    """The CLI help is rendered without loading web3, numpy or dotenv."""
+    times = _import_times("-m", "orion_finance_sdk", "--help")
+
+    print(f"\norion --help imports: {times[''] / 1000:.1f} ms")
+    assert _heavy(times) == []
+    assert times[""] < HELP_BUDGET_US
+
+
+def test_lazy_attributes():
+    """Public commands and the version are still importable from the package."""
+    import orion_finance_sdk
+
+    assert callable(orion_finance_sdk.submit_order)
+    assert isinstance(orion_finance_sdk.__version__, str)
+    assert "submit_orders" in dir(orion_finance_sdk)
+    with pytest.raises(AttributeError):
+        orion_finance_sdk.missing
@@ -0,0 +1,69 @@
+"""Tests for Node.js toolchain resolution."""
+
+import os
+
+import pytest
+from orion_finance_sdk.toolchain import resolve_node
+
+
+class FakeNode:
+    """A fake node binary that records each time it is probed."""
+
+    def __init__(self, directory):
+        self.path = directory / "node"
+        self._probes = directory / "probes"
+
+    def install(self, version: str):
+        self.path.write_text(f"#!/bin/sh\necho x >> {self._probes}\necho {version}\n")
+        self.path.chmod(0o755)
+
+    def probes(self) -> int:
+        if not self._probes.exists():
+            return 0
+        return len(self._probes.read_text().splitlines())
+
+
+@pytest.fixture
+def fake_node(tmp_path, monkeypatch):
+    """A fake node v22 selected through ORION_NODE_PATH."""
+    node = FakeNode(tmp_path)
+    node.install("v22.4.1")
+    monkeypatch.setenv("ORION_NODE_PATH", str(node.path))
+    resolve_node.cache_clear()
+    yield node
+    resolve_node.cache_clear()
+
+
+def test_resolve_node_from_env(fake_node):
+    """ORION_NODE_PATH selects the binary, whose version is probed once."""
+    toolchain = resolve_node()
+
+    assert toolchain.path == os.path.realpath(fake_node.path)
+    assert toolchain.version == "v22.4.1"
+    assert toolchain.major_version == 22
+    assert resolve_node() is toolchain
+    assert fake_node.probes() == 1
+
+
+def test_resolve_node_disk_cache(fake_node):
+    """A new process reuses the version cached on disk until the binary changes."""
+    resolve_node()
+    resolve_node.cache_clear()
+    assert resolve_node().version == "v22.4.1"
+    assert fake_node.probes() == 1
+
+    fake_node.install("v20.1.0")
+    os.utime(fake_node.path, ns=(0, os.stat(fake_node.path).st_mtime_ns + 10**9))
+    resolve_node.cache_clear()
+    assert resolve_node().version == "v20.1.0"
+    assert fake_node.probes() == 2
+
+
+def test_resolve_node_rejects_old_or_missing(fake_node, monkeypatch):
+    """Unsupported versions and missing binaries resolve to None."""
+    fake_node.install("v14.0.0")
+    assert resolve_node() is None
+
+    resolve_node.cache_clear()
+    monkeypatch.setenv("ORION_NODE_PATH", str(fake_node.path) + "-missing")
+    assert resolve_node() is None
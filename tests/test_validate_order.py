@@ -0,0 +1,122 @@
+"""Tests for order intent validation against the OrionConfig whitelist."""
+
+import json
+
+import pytest
+from orion_finance_sdk.contracts import OrionConfig
+from orion_finance_sdk.utils import validate_order
+
+N_ASSETS = 150
+
+
+def _address(i: int) -> str:
+    return "0x" + f"{i + 1:040x}"
+
+
+@pytest.fixture
+def config_rpc(stub_rpc, abis):
+    """Stub node serving an OrionConfig with ``N_ASSETS`` whitelisted assets."""
+    from web3 import Web3
+
+    whitelist = [Web3.to_checksum_address(_address(i)) for i in range(N_ASSETS)]
+    stub_rpc.on_call("getAllWhitelistedAssets()", ["address[]"], whitelist)
+    stub_rpc.on_call(
+        "isWhitelisted(address)",
+        ["bool"],
+        lambda token: (Web3.to_checksum_address(token) in whitelist,),
+    )
+    stub_rpc.on_call("curatorIntentDecimals()", ["uint8"], 9)
+    return stub_rpc
+
+
+def test_validate_order_fetches_whitelist_once(config_rpc):
+    """Whitelist validation costs a single contract call regardless of intent size."""
+    order_intent = {_address(i): 1 / N_ASSETS for i in range(N_ASSETS)}
+
+    result = validate_order(order_intent)
+
+    assert sum(result.values()) == 10**9
+    assert config_rpc.contract_calls["getAllWhitelistedAssets()"] == 1
+    assert config_rpc.contract_calls["isWhitelisted(address)"] == 0
+
+
+def test_validate_order_reports_all_non_whitelisted(config_rpc):
+    """Every non-whitelisted token is reported, not only the first one."""
+    unknown = [_address(N_ASSETS + i) for i in range(3)]
+    order_intent = {_address(0): 0.25, **{token: 0.25 for token in unknown}}
+
+    with pytest.raises(ValueError) as exc_info:
+        validate_order(order_intent)
+
+    for token in unknown:
+        assert token in str(exc_info.value)
+
+
+def test_validate_order_whitelist_is_case_insensitive(config_rpc):
+    """Lowercase addresses match their checksummed whitelist entries."""
+    order_intent = {_address(10).lower(): 0.5, _address(11): 0.5}
+
+    assert sum(validate_order(order_intent).values()) == 10**9
+
+
+def test_whitelist_lookups_are_batched(config_rpc):
+    """The whitelist set costs one eth_call however many tokens are checked."""
+    config = OrionConfig()
+    tokens = [_address(i) for i in range(N_ASSETS)]
+
+    assert all(config.is_whitelisted(token) for token in tokens)
+    per_token = config_rpc.calls["eth_call"]
+
+    for _ in range(2):
+        whitelist = config.whitelisted_asset_set
+        assert all(
+            config.w3.to_checksum_address(token) in whitelist for token in tokens
+        )
+    batched = config_rpc.calls["eth_call"] - per_token
+
+    assert per_token == N_ASSETS
+    assert batched == 1
+    assert config_rpc.contract_calls["isWhitelisted(address)"] == N_ASSETS
+    assert config_rpc.contract_calls["getAllWhitelistedAssets()"] == 1
+
+
+def test_validate_order_rejects_checksum_duplicates(config_rpc):
+    """The same token written in two cases is a duplicate, not two assets."""
+    order_intent = {
+        _address(10).lower(): 0.5,
+        _address(10).upper().replace("X", "x"): 0.5,
+    }
+
+    with pytest.raises(ValueError, match="more than once"):
+        validate_order(order_intent)
+
+
+def test_validate_order_fuzz_covers_whitelist(config_rpc):
+    """Fuzzing adds every other whitelisted asset and keeps the exact total."""
+    order_intent = {_address(0): 0.5, _address(1): 0.5}
+
+    result = validate_order(order_intent, fuzz=True)
+
+    assert len(result) == N_ASSETS
+    assert sum(result.values()) == 10**9
+    assert all(units > 0 for units in result.values())
+
+
+def test_validate_order_result_is_a_mapping(config_rpc):
+    """The validated intent converts to, and reads like, a dict of its tokens."""
+    from web3 import Web3
+
+    order_intent = {_address(1).lower(): 0.75, _address(2): 0.25}
+
+    result = validate_order(order_intent)
+    as_dict = dict(result)
+
+    assert as_dict == {
+        Web3.to_checksum_address(_address(1)): 750_000_000,
+        Web3.to_checksum_address(_address(2)): 250_000_000,
+    }
+    assert result == as_dict
+    assert result[_address(1).lower()] == 750_000_000
+    assert "0x" + _address(2)[2:].upper() in result
+    assert _address(3) not in result
+    assert json.loads(json.dumps(result.to_dict())) == as_dict